@@ -0,0 +1,96 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool, text
+from sqlmodel import SQLModel
+
+from app.core.config import settings
+from app.services import partitioning
+
+# Import all models to register them with SQLModel
+from app.models.user import User  # noqa: F401
+from app.models.category import Category  # noqa: F401
+from app.models.transaction import Transaction  # noqa: F401
+from app.models.rollup import MonthlyRollup  # noqa: F401
+from app.models.data_version import UserDataVersion  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = SQLModel.metadata
+
+
+def get_url() -> str:
+    # alembic -x database_url=... 로 다른 DB(벤치마크용 등)에 적용 가능
+    return context.get_x_argument(as_dictionary=True).get("database_url", settings.DATABASE_URL)
+
+
+def include_object_for(dialect_name: str, partitioned: bool = False):
+    def include_object(object, name, type_, reflected, compare_to) -> bool:
+        # PostgreSQL 전용 인덱스(pg_trgm GIN 등)는 다른 DB 에서 비교하지 않음
+        if type_ == "index" and not reflected and dialect_name != "postgresql":
+            return not object.dialect_options["postgresql"].get("using")
+        if partitioned:
+            # 월별 파티션/변환 전 테이블은 모델에 없음 (app.services.partitioning 이 관리)
+            if type_ == "table" and reflected and compare_to is None and name.startswith(f"{partitioning.TABLE}_"):
+                return False
+            # 파티션 테이블의 유니크 인덱스는 transaction_date 가 추가되어 모델과 다름
+            if type_ == "index" and object.unique and object.table.name == partitioning.TABLE:
+                return False
+        return True
+
+    return include_object
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        compare_type=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _is_partitioned(connection) -> bool:
+    # python -m app.cli partitions migrate 로 파티션 테이블로 바꿨는지
+    partitioned = connection.execute(
+        text(partitioning.IS_PARTITIONED_SQL), {"table": partitioning.TABLE}
+    ).scalar_one()
+    # 마이그레이션은 새 트랜잭션에서 (이미 열린 트랜잭션이 있으면 Alembic 이 commit 하지 않음)
+    connection.commit()
+    return partitioned
+
+
+def run_migrations_online() -> None:
+    configuration = config.get_section(config.config_ini_section) or {}
+    configuration["sqlalchemy.url"] = get_url()
+    connectable = engine_from_config(
+        configuration,
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+            render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_object_for(
+                connection.dialect.name, connection.dialect.name == "postgresql" and _is_partitioned(connection)
+            ),
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
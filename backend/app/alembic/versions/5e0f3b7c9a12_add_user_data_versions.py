@@ -0,0 +1,32 @@
+"""add user data versions
+
+사용자별 거래 데이터 버전 (목록/통계 ETag 와 응답 캐시 키).
+
+Revision ID: 5e0f3b7c9a12
+Revises: a41c7e9d2b58
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0f3b7c9a12'
+down_revision = 'a41c7e9d2b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'user_data_versions',
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('user_data_versions')
@@ -0,0 +1,40 @@
+"""backfill monthly rollups
+
+기존 거래로 monthly_rollups 를 다시 채움 (테이블이 비어 있는 상태로 생성된 배포용).
+
+Revision ID: 7d4c2e8f1b36
+Revises: 5e0f3b7c9a12
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d4c2e8f1b36'
+down_revision = '5e0f3b7c9a12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_context().dialect.name == "postgresql":
+        period = "CAST(date_trunc('month', transaction_date) AS DATE)"
+    else:
+        period = "strftime('%Y-%m-01', transaction_date)"
+
+    # 집계 결과로 통째로 바꾸므로 여러 번 실행해도 같은 결과
+    op.execute("DELETE FROM monthly_rollups")
+    op.execute(sa.text(
+        "INSERT INTO monthly_rollups "
+        "(user_id, period, category_id, transaction_type, total_amount, transaction_count) "
+        f"SELECT user_id, {period}, category_id, transaction_type, SUM(amount), COUNT(*) "
+        "FROM transactions "
+        f"GROUP BY user_id, {period}, category_id, transaction_type"
+    ))
+
+
+def downgrade():
+    # 데이터만 채운 리비전이므로 되돌릴 스키마 변경 없음
+    pass
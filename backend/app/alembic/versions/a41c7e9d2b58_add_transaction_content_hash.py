@@ -0,0 +1,42 @@
+"""add transaction content hash
+
+거래 가져오기(POST /transactions/import)의 중복 판별용 content_hash 컬럼과
+(user_id, content_hash) 유니크 인덱스. 기존 거래는 NULL 이라 제약에 걸리지 않는다.
+
+Revision ID: a41c7e9d2b58
+Revises: dbdae9bdb138
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c7e9d2b58'
+down_revision = 'dbdae9bdb138'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transactions_user_id_content_hash', 'transactions', ['user_id', 'content_hash'],
+            unique=True, if_not_exists=True, postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transactions_user_id_content_hash', table_name='transactions',
+            if_exists=True, postgresql_concurrently=True,
+        )
+
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('content_hash')
@@ -0,0 +1,105 @@
+"""initial schema
+
+기존에 SQLModel.metadata.create_all 로 만들어진 DB 에도 그대로 적용할 수 있도록
+이미 존재하는 테이블은 건너뛴다.
+
+Revision ID: c8b2bf6a8361
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8b2bf6a8361'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# create_all 로 만든 DB 에는 enum 타입이 이미 있을 수 있으므로 create_table 이 CREATE TYPE 을 하지 않게 하고
+# upgrade 시작할 때 없으면 만든다 (다른 DB 에서는 문자열 컬럼)
+transaction_type = postgresql.ENUM('INCOME', 'EXPENSE', name='transactiontype', create_type=False)
+payment_method = postgresql.ENUM('CASH', 'CARD', name='paymentmethod', create_type=False)
+
+
+def upgrade():
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+
+    if op.get_context().dialect.name == 'postgresql':
+        checkfirst = not context.is_offline_mode()
+        transaction_type.create(op.get_bind(), checkfirst=checkfirst)
+        payment_method.create(op.get_bind(), checkfirst=checkfirst)
+
+    if 'users' not in existing:
+        op.create_table(
+            'users',
+            sa.Column('email', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            sa.Column('is_superuser', sa.Boolean(), nullable=False),
+            sa.Column('full_name', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.Column('id', sa.Uuid(), nullable=False),
+            sa.Column('hashed_password', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+
+    if 'categories' not in existing:
+        op.create_table(
+            'categories',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+            sa.Column('description', sqlmodel.sql.sqltypes.AutoString(length=200), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index(op.f('ix_categories_name'), 'categories', ['name'], unique=True)
+
+    if 'transactions' not in existing:
+        op.create_table(
+            'transactions',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.Column('amount', sa.Integer(), nullable=False),
+            sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+            sa.Column('transaction_type', transaction_type, nullable=False),
+            sa.Column('payment_method', payment_method, nullable=True),
+            sa.Column('user_id', sa.Uuid(), nullable=False),
+            sa.Column('category_id', sa.Integer(), nullable=False),
+            sa.Column('transaction_date', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+            sa.PrimaryKeyConstraint('id'),
+        )
+
+    if 'monthly_rollups' not in existing:
+        op.create_table(
+            'monthly_rollups',
+            sa.Column('user_id', sa.Uuid(), nullable=False),
+            sa.Column('period', sa.Date(), nullable=False),
+            sa.Column('category_id', sa.Integer(), nullable=False),
+            sa.Column('transaction_type', transaction_type, nullable=False),
+            sa.Column('total_amount', sa.BigInteger(), nullable=False),
+            sa.Column('transaction_count', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+            sa.PrimaryKeyConstraint('user_id', 'period', 'category_id', 'transaction_type'),
+        )
+
+
+def downgrade():
+    op.drop_table('monthly_rollups')
+    op.drop_table('transactions')
+    op.drop_index(op.f('ix_categories_name'), table_name='categories')
+    op.drop_table('categories')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    transaction_type.drop(op.get_bind(), checkfirst=True)
+    payment_method.drop(op.get_bind(), checkfirst=True)
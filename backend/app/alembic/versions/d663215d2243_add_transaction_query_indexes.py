@@ -0,0 +1,44 @@
+"""add transaction query indexes
+
+목록(정렬/커서), 카테고리 필터, 유형+기간 집계용 복합 인덱스.
+PostgreSQL 에서는 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY 로 만든다.
+
+Revision ID: d663215d2243
+Revises: c8b2bf6a8361
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd663215d2243'
+down_revision = 'c8b2bf6a8361'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'ix_transactions_user_id_transaction_date_id': ['user_id', 'transaction_date', 'id'],
+    'ix_transactions_user_id_amount_id': ['user_id', 'amount', 'id'],
+    'ix_transactions_user_id_category_id': ['user_id', 'category_id'],
+    'ix_transactions_user_id_transaction_type_transaction_date': ['user_id', 'transaction_type', 'transaction_date'],
+}
+
+
+def upgrade():
+    # CONCURRENTLY 는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name, 'transactions', columns,
+                if_not_exists=True, postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name, table_name='transactions',
+                if_exists=True, postgresql_concurrently=True,
+            )
@@ -0,0 +1,46 @@
+"""add trigram search indexes
+
+거래 설명/카테고리 이름의 ILIKE '%q%' 검색용 pg_trgm GIN 인덱스.
+PostgreSQL 전용이며 CREATE EXTENSION 권한이 필요하다. 다른 DB 에서는 아무것도 하지 않는다.
+
+Revision ID: dbdae9bdb138
+Revises: d663215d2243
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'dbdae9bdb138'
+down_revision = 'd663215d2243'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'ix_transactions_description_trgm': ('transactions', 'description'),
+    'ix_categories_name_trgm': ('categories', 'name'),
+}
+
+
+def upgrade():
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, (table, column) in INDEXES.items():
+            op.create_index(
+                name, table, [column],
+                if_not_exists=True, postgresql_concurrently=True,
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+
+def downgrade():
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name, (table, _) in INDEXES.items():
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
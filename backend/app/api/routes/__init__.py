@@ -1,9 +1,11 @@
 from fastapi import APIRouter
-from app.api.routes import categories, transactions, user, login
+from app.api.routes import categories, dashboard, transactions, user, login, monitoring
 
 api_router = APIRouter()
 
 api_router.include_router(categories.router)
 api_router.include_router(login.router)
 api_router.include_router(user.router)
-api_router.include_router(transactions.router)
\ No newline at end of file
+api_router.include_router(transactions.router)
+api_router.include_router(dashboard.router)
+api_router.include_router(monitoring.router)
\ No newline at end of file
@@ -1,73 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select, func
-from typing import List
-from app.core.database import SessionDep, get_db
-from app.models.category import Category, CategoryCreate, CategoryUpdate, CategoryResponse, CategoryPaginatedResponse
+from fastapi import APIRouter, Request, Response
+from app.core.database import AsyncSessionDep, ReadSessionDep
+from app.core.http_cache import etag_matches, make_etag, not_modified
+from app.models.category import CategoryCreate, CategoryUpdate, CategoryResponse, CategoryPaginatedResponse
+from app.services import categories
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 @router.get("/", response_model=CategoryPaginatedResponse)
-def get_categories(
-    db: SessionDep,
+async def get_categories(
+    request: Request,
+    response: Response,
+    db: ReadSessionDep,
     skip: int = 0,
     limit: int = 100,
     search_query: str | None = None
 ):
-    """전체 카테고리 조회"""
-    # Base statement
-    statement = select(Category)
+    """전체 카테고리 조회
 
-    # Apply search filter
-    if search_query:
-        statement = statement.where(Category.name.ilike(f"%{search_query}%"))
+    응답의 ETag 를 If-None-Match 로 보내면 카테고리가 바뀌지 않은 경우 304 를 반환한다.
+    """
+    snapshot = await categories.current_categories(db)
+    etag = make_etag(snapshot.etag)
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control="no-cache")
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
 
-    # Get total count with filters
-    count_statement = select(func.count()).select_from(statement.subquery())
-    total = db.exec(count_statement).one()
-
-    # Get paginated items
-    statement = statement.offset(skip).limit(limit)
-    categories = db.exec(statement).all()
-
-    return CategoryPaginatedResponse(items=categories, total=total)
+    if not search_query:
+        return categories.page_categories(snapshot, skip, limit)
+    return await db.run(categories.list_categories, skip, limit, search_query)
 
 @router.get("/{category_id}", response_model=CategoryResponse)
-def get_category(category_id: int, db: SessionDep):
+async def get_category(category_id: int, db: ReadSessionDep):
     """특정 카테고리 조회"""
-    category = db.get(Category, category_id)
-    if not category:
-        raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
-    return category
+    return await db.run(categories.get_category, category_id)
 
 @router.post("/", response_model=CategoryResponse, status_code=201)
-def create_category(category: CategoryCreate, db: SessionDep):
+async def create_category(category: CategoryCreate, db: AsyncSessionDep):
     """카테고리 생성"""
-    db_category = Category.model_validate(category)
-    db.add(db_category)
-    db.commit()
-    db.refresh(db_category)
-    return db_category
+    return await db.run(categories.create_category, category)
 
 @router.patch("/{category_id}", response_model=CategoryResponse)
-def update_category(category_id: int, category: CategoryUpdate, db: SessionDep):
+async def update_category(category_id: int, category: CategoryUpdate, db: AsyncSessionDep):
     """카테고리 수정"""
-    db_category = db.get(Category, category_id)
-    if not db_category:
-        raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
-
-    update_data = category.model_dump(exclude_unset=True)
-    db_category.sqlmodel_update(update_data)
-    
-    db.commit()
-    db.refresh(db_category)
-    return db_category
+    return await db.run(categories.update_category, category_id, category)
 
 @router.delete("/{category_id}", status_code=204)
-def delete_category(category_id: int, db: SessionDep):
+async def delete_category(category_id: int, db: AsyncSessionDep):
     """카테고리 삭제"""
-    db_category = db.get(Category, category_id)
-    if not db_category:
-        raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
-
-    db.delete(db_category)
-    db.commit()
+    await db.run(categories.delete_category, category_id)
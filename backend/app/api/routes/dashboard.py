@@ -0,0 +1,20 @@
+from typing import Annotated
+from fastapi import APIRouter, Query
+from app.core.database import CurrentUser
+from app.models.dashboard import DashboardResponse
+from app.services import dashboard, statistics
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+@router.get("/", response_model=DashboardResponse)
+async def get_dashboard(
+    current_user: CurrentUser,
+    months: Annotated[int, Query(ge=1, le=statistics.MAX_MONTHS)] = 6,
+    top: Annotated[int, Query(ge=1, le=100)] = 5,
+    recent: Annotated[int, Query(ge=1, le=100)] = 10,
+):
+    """홈 화면 (이번 달 요약, 지출 상위 카테고리, 최근 N개월 추이, 최근 거래내역)
+
+    사용자 인증은 한 번만 하고 각 섹션은 별도 세션에서 동시에 조회한다. timings 에 섹션별 조회 시간(ms)을 담는다.
+    """
+    return await dashboard.build_dashboard(current_user, months=months, top=top, recent=recent)
@@ -0,0 +1,110 @@
+from typing import List, Literal
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
+
+from app.core.cache import caches
+from app.core.database import get_current_active_superuser
+from app.core.mailer import mailer
+from app.core.profiling import RequestProfile, get_profile, profiles
+from app.core.query_log import fingerprints, query_duration
+from app.core.security import password_pool
+from app.models.monitoring import (
+    CacheStats,
+    EmailQueueStats,
+    PasswordHashStats,
+    ProfileDetail,
+    ProfileFunction,
+    ProfileQuery,
+    ProfileSummary,
+    QueryStats,
+)
+
+router = APIRouter(prefix="/monitoring", tags=["monitoring"], dependencies=[Depends(get_current_active_superuser)])
+
+@router.get("/caches", response_model=List[CacheStats])
+async def get_cache_stats():
+    """프로세스 내 캐시 통계 (워커별 값)"""
+    return [cache.stats() for cache in caches.values()]
+
+@router.get("/password-hashing", response_model=PasswordHashStats)
+async def get_password_hash_stats():
+    """비밀번호 해시 프로세스 풀 상태 (대기열 길이, 대기 시간)"""
+    return password_pool.stats()
+
+@router.get("/email", response_model=EmailQueueStats)
+async def get_email_queue_stats():
+    """메일 발송 대기열 상태 (워커별 값)"""
+    return mailer.stats()
+
+@router.get("/queries", response_model=List[QueryStats])
+async def get_query_stats(limit: int = 50):
+    """쿼리 지문별 실행 시간 (총 시간이 큰 순서, 워커별 값)"""
+    def ms(seconds):
+        return seconds * 1000 if seconds is not None else None
+
+    series = sorted(query_duration.series(), key=lambda item: item["sum"], reverse=True)[:limit]
+    return [
+        QueryStats(
+            fingerprint=item["labels"]["fingerprint"],
+            sql=fingerprints.get(item["labels"]["fingerprint"], ""),
+            count=item["count"],
+            total_ms=ms(item["sum"]),
+            avg_ms=ms(item["sum"] / item["count"]),
+            max_ms=ms(item["max"]),
+            p50_ms=ms(item["p50"]),
+            p95_ms=ms(item["p95"]),
+            p99_ms=ms(item["p99"]),
+        )
+        for item in series
+    ]
+
+
+def profile_summary(profile: RequestProfile) -> dict:
+    return dict(
+        id=profile.id,
+        created_at=profile.created_at,
+        method=profile.method,
+        path=profile.path,
+        route=profile.route,
+        user_email=profile.user_email,
+        status_code=profile.status_code,
+        duration_ms=profile.duration * 1000,
+        query_count=len(profile.queries),
+        query_ms=sum(duration for *_, duration in profile.queries) * 1000,
+    )
+
+def find_profile(profile_id: str) -> RequestProfile:
+    profile = get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
+
+@router.get("/profiles", response_model=List[ProfileSummary])
+async def get_profiles():
+    """최근 프로파일 목록 (최신순, 워커별 값). X-Profile: 1 헤더나 ?profile=1 로 요청하면 추가됨"""
+    return [ProfileSummary(**profile_summary(profile)) for profile in reversed(profiles)]
+
+@router.get("/profiles/{profile_id}", response_model=ProfileDetail)
+async def get_profile_detail(
+    profile_id: str, sort: Literal["cumulative", "total"] = "cumulative", limit: int = 50
+):
+    """함수별 시간(호출 트리)과 실행한 SQL 목록"""
+    profile = find_profile(profile_id)
+    return ProfileDetail(
+        **profile_summary(profile),
+        functions=[ProfileFunction(**item) for item in profile.functions(sort, limit)],
+        queries=[
+            ProfileQuery(fingerprint=key, sql=sql, started_ms=started * 1000, duration_ms=duration * 1000)
+            for key, sql, started, duration in profile.queries
+        ],
+    )
+
+@router.get("/profiles/{profile_id}/pstats")
+async def download_profile(profile_id: str):
+    """pstats 파일 (snakeviz profile.prof, python -m pstats profile.prof)"""
+    profile = find_profile(profile_id)
+    return Response(
+        profile.dump(),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile.id}.prof"'},
+    )
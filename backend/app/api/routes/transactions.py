@@ -1,204 +1,191 @@
-from typing import List, Optional
-from datetime import datetime
-from fastapi import APIRouter, HTTPException
-from sqlmodel import select, func
-from sqlalchemy.orm import selectinload
-from app.core.database import CurrentUser, SessionDep
-from app.models.transaction import Transaction, TransactionCreate, TransactionResponse, TransactionUpdate, TransactionPaginatedResponse, TransactionType, PaymentMethod, CategorySpending, MonthlyTrend
-from app.models.category import Category
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from app.core.database import AsyncSessionDep, CurrentUser, ReadSessionDep
+from app.models.analytics import CategoryShare, MonthlyAnalytics, SpendingProjection
+from app.models.transaction import TotalStrategy, TransactionCreate, TransactionResponse, TransactionUpdate, TransactionPaginatedResponse, TransactionBatchRequest, TransactionBatchResponse, TransactionImportResult, CategorySpending, MonthlyTrend, TimeBucket, TimeSeriesGroupBy, TimeSeriesPoint
+from app.services import analytics, exports, imports, statistics, timeseries, transactions
+from app.services.data_version import conditional_response, today_key
+from app.services.transactions import TransactionFilters
 
 router = APIRouter(prefix="/transactions",tags=["transactions"])
 
 @router.get("/", response_model=TransactionPaginatedResponse)
-def get_transactions(
+async def get_transactions(
+    request: Request,
     current_user: CurrentUser,
-    session: SessionDep,
+    db: ReadSessionDep,
+    # 필터 파라미터
+    filters: Annotated[TransactionFilters, Depends()],
     skip: int = 0,
     limit: int = 100,
-    # 필터 파라미터
-    transaction_type: Optional[TransactionType] = None,
-    category_id: Optional[int] = None,
-    payment_method: Optional[PaymentMethod] = None,
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
-    min_amount: Optional[int] = None,
-    max_amount: Optional[int] = None,
-    search_query: Optional[str] = None,
-    # 정렬 파라미터
+    # 정렬 파라미터 (date | amount | relevance - relevance 는 search_query 가 있을 때만)
     sort_by: str = "date",
     sort_order: str = "desc",
+    # 페이지네이션 방식: offset(기본) | cursor
+    pagination: str = "offset",
+    cursor: Optional[str] = None,
+    # 전체 개수 계산 방법: exact(기본) | cached | estimated | none
+    total_strategy: TotalStrategy = TotalStrategy.EXACT,
 ):
-    """전체 거래내역 조회 (필터링 및 정렬 지원)"""
-
-    # WHERE 조건 동적 구성
-    filters = [Transaction.user_id == current_user.id]
-
-    if transaction_type:
-        filters.append(Transaction.transaction_type == transaction_type)
-
-    if category_id:
-        filters.append(Transaction.category_id == category_id)
-
-    if payment_method:
-        filters.append(Transaction.payment_method == payment_method)
-
-    if start_date:
-        filters.append(Transaction.transaction_date >= start_date)
-
-    if end_date:
-        # 하루의 마지막까지 포함
-        end_datetime = end_date.replace(hour=23, minute=59, second=59)
-        filters.append(Transaction.transaction_date <= end_datetime)
-
-    if min_amount is not None and min_amount > 0:
-        filters.append(Transaction.amount >= min_amount)
-
-    if max_amount is not None and max_amount > 0:
-        filters.append(Transaction.amount <= max_amount)
-
-    if search_query and search_query.strip():
-        # LIKE 검색 (대소문자 무시)
-        filters.append(Transaction.description.ilike(f"%{search_query.strip()}%"))
-
-    # Get total count
-    count_statement = select(func.count()).select_from(Transaction).where(*filters)
-    total = session.exec(count_statement).one()
-
-    # 정렬 기준 결정
-    if sort_by == "amount":
-        order_column = Transaction.amount.desc() if sort_order == "desc" else Transaction.amount.asc()
-    else:  # date (기본값)
-        order_column = Transaction.transaction_date.desc() if sort_order == "desc" else Transaction.transaction_date.asc()
-
-    # Get paginated items
-    statement = (
-        select(Transaction)
-        .where(*filters)
-        .options(selectinload(Transaction.category))
-        .order_by(order_column)
-        .offset(skip)
-        .limit(limit)
+    """전체 거래내역 조회 (필터링 및 정렬 지원)
+
+    pagination=cursor 이면 skip 대신 응답의 next_cursor 를 다음 요청의 cursor 로 넘긴다.
+    커서 모드에서 total 은 첫 페이지에서만 계산한다.
+    필터가 넓어 count 가 비싸면 total_strategy 로 캐시/추정값을 쓰거나 생략(has_more 만)할 수 있다.
+    거래가 바뀌지 않았으면 If-None-Match 에 304, 같은 조회는 서버 캐시에서 반환한다.
+    """
+    return await conditional_response(request, db, current_user.id, lambda: db.run(
+        transactions.list_transactions,
+        current_user.id,
+        filters,
+        skip=skip,
+        limit=limit,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        pagination=pagination,
+        cursor=cursor,
+        total_strategy=total_strategy,
+    ))
+
+@router.get("/export")
+async def export_transactions(
+    current_user: CurrentUser,
+    filters: Annotated[TransactionFilters, Depends()],
+    # csv | ndjson
+    format: str = "csv",
+    gzip: bool = False,
+):
+    """거래내역 내보내기 (목록 조회와 같은 필터, 날짜순, 스트리밍)"""
+    if format not in exports.EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(exports.EXPORT_FORMATS)}")
+
+    filename = f"transactions.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        exports.stream_export(current_user.id, filters, format, compress=gzip),
+        media_type="application/gzip" if gzip else exports.EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
-    transactions = session.exec(statement).all()
-
-    return TransactionPaginatedResponse(items=transactions, total=total)
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
-def get_transaction(current_user: CurrentUser, session: SessionDep, transaction_id: int):
+async def get_transaction(current_user: CurrentUser, db: ReadSessionDep, transaction_id: int):
     """특정 거래내역 조회"""
-    statement = select(Transaction).where(Transaction.id == transaction_id).options(selectinload(Transaction.category))
-    db_transaction = session.exec(statement).first()
-    if not db_transaction:
-        raise HTTPException(status_code=404, detail=f"Transaction {transaction_id} not found")
-    if db_transaction.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    return db_transaction
+    return await db.run(transactions.get_transaction, current_user.id, transaction_id)
 
 @router.post("/", response_model=TransactionResponse)
-def create_transaction(current_user: CurrentUser, session: SessionDep, transaction: TransactionCreate):
+async def create_transaction(current_user: CurrentUser, db: AsyncSessionDep, transaction: TransactionCreate):
     """거래내역 생성"""
-    transaction_data = transaction.model_dump()
-    db_transaction = Transaction(**transaction_data, user_id=current_user.id)
+    return await db.run(transactions.create_transaction, current_user.id, transaction)
 
-    session.add(db_transaction)
-    session.commit()
-    session.refresh(db_transaction)
-    return db_transaction
+@router.post("/batch", response_model=TransactionBatchResponse)
+async def batch_transactions(current_user: CurrentUser, db: AsyncSessionDep, batch: TransactionBatchRequest):
+    """여러 거래의 생성/수정/삭제를 한 번에 처리 (항목별 결과 반환)"""
+    return await db.run(transactions.apply_batch, current_user.id, batch)
 
-@router.patch("/{transaction_id}", response_model=TransactionResponse)
-def update_transaction(current_user: CurrentUser, session: SessionDep, transaction: TransactionUpdate, transaction_id: int):
-    """거래내역 수정"""
-    db_transaction = session.get(Transaction,transaction_id)
-    if not db_transaction:
-        raise HTTPException(status_code=404, detail=f"Transaction {transaction_id} not found")
-
-    if db_transaction.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
+@router.post("/import", response_model=TransactionImportResult)
+async def import_transactions(
+    current_user: CurrentUser,
+    db: AsyncSessionDep,
+    file: UploadFile,
+    # csv | ndjson (없으면 파일 확장자로 판단)
+    format: Optional[str] = None,
+    # 은행 내보내기 파일은 cp949 인 경우가 많음
+    encoding: str = "utf-8",
+):
+    """거래내역 일괄 가져오기 (CSV 또는 NDJSON)
 
-    update_data = transaction.model_dump(exclude_unset=True)
-    db_transaction.sqlmodel_update(update_data)
+    컬럼: amount, transaction_type, transaction_date, description, payment_method,
+    category_id 또는 category(카테고리 이름). 잘못된 행은 건너뛰고 errors 에 행 번호와 함께 담는다.
+    이미 가져온 행은 duplicates 로 세고 다시 넣지 않는다. 날짜가 없는 행은 같은 파일 안에서만 중복을 판별한다
+    (가져온 시각이 날짜가 되므로 다른 업로드의 같은 행은 새 거래로 들어감).
+    """
+    fmt = imports.detect_format(format, file.filename, file.content_type)
+    return await imports.import_transactions(db, current_user.id, file.file, fmt, encoding)
 
-    session.commit()
-    session.refresh(db_transaction)
-    return db_transaction
+@router.patch("/{transaction_id}", response_model=TransactionResponse)
+async def update_transaction(current_user: CurrentUser, db: AsyncSessionDep, transaction: TransactionUpdate, transaction_id: int):
+    """거래내역 수정"""
+    return await db.run(transactions.update_transaction, current_user.id, transaction_id, transaction)
 
 @router.delete("/{transaction_id}", status_code=204)
-def delete_transaction(current_user: CurrentUser, session: SessionDep, transaction_id: int):
+async def delete_transaction(current_user: CurrentUser, db: AsyncSessionDep, transaction_id: int):
     """거래내역 삭제"""
-    db_transaction = session.get(Transaction,transaction_id)
-    if not db_transaction:
-        raise HTTPException(status_code=404, detail=f"Transaction {transaction_id} not found")
-
-    if db_transaction.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    session.delete(db_transaction)
-    session.commit()
+    await db.run(transactions.delete_transaction, current_user.id, transaction_id)
 
 @router.get("/statistics/category-spending", response_model=List[CategorySpending])
-def get_category_spending(current_user: CurrentUser, session: SessionDep, limit: int = 10):
+async def get_category_spending(request: Request, current_user: CurrentUser, db: ReadSessionDep, limit: int = 10):
     """카테고리별 지출 통계 (지출만, 상위 N개)"""
-    statement = (
-        select(
-            Transaction.category_id,
-            Category.name.label("category_name"),
-            func.sum(Transaction.amount).label("total_amount"),
-            func.count(Transaction.id).label("transaction_count")
-        )
-        .join(Category, Transaction.category_id == Category.id)
-        .where(Transaction.user_id == current_user.id)
-        .where(Transaction.transaction_type == TransactionType.EXPENSE)
-        .group_by(Transaction.category_id, Category.name)
-        .order_by(func.sum(Transaction.amount).desc())
-        .limit(limit)
+    return await conditional_response(
+        request, db, current_user.id, lambda: db.run(statistics.get_category_spending, current_user.id, limit)
+    )
+
+@router.get("/statistics/monthly-trends", response_model=List[MonthlyTrend])
+async def get_monthly_trends(
+    request: Request,
+    current_user: CurrentUser,
+    db: ReadSessionDep,
+    months: Annotated[int, Query(ge=1, le=statistics.MAX_MONTHS)] = 6,
+):
+    """월별 수입/지출 추이 (최근 N개월, 오래된 순서)"""
+    return await conditional_response(
+        request, db, current_user.id, lambda: db.run(statistics.get_monthly_trends, current_user.id, months),
+        extra=today_key(),
+    )
+
+@router.get("/statistics/monthly-analytics", response_model=List[MonthlyAnalytics])
+async def get_monthly_analytics(
+    request: Request,
+    current_user: CurrentUser,
+    db: ReadSessionDep,
+    months: Annotated[int, Query(ge=1, le=statistics.MAX_MONTHS)] = 12,
+    window: Annotated[int, Query(ge=1, le=statistics.MAX_MONTHS)] = 3,
+):
+    """월별 수입/지출 + 지출 이동 평균(window 개월) + 전월 대비 증감 (최근 N개월, 오래된 순서)"""
+    if window > months:
+        raise HTTPException(status_code=400, detail="window must not be larger than months")
+    return await conditional_response(
+        request, db, current_user.id, lambda: db.run(analytics.get_monthly_analytics, current_user.id, months, window),
+        extra=today_key(),
     )
 
-    results = session.exec(statement).all()
+@router.get("/statistics/category-share", response_model=List[CategoryShare])
+async def get_category_share(
+    request: Request,
+    current_user: CurrentUser,
+    db: ReadSessionDep,
+    months: Annotated[int, Query(ge=1, le=statistics.MAX_MONTHS)] = 1,
+):
+    """카테고리별 지출 비율 (이번 달 포함 최근 N개월, 지출 많은 순)"""
+    return await conditional_response(
+        request, db, current_user.id, lambda: db.run(analytics.get_category_share, current_user.id, months),
+        extra=today_key(),
+    )
 
-    return [
-        CategorySpending(
-            category_id=row[0],
-            category_name=row[1],
-            total_amount=row[2],
-            transaction_count=row[3]
-        )
-        for row in results
-    ]
+@router.get("/statistics/projection", response_model=SpendingProjection)
+async def get_spending_projection(request: Request, current_user: CurrentUser, db: ReadSessionDep):
+    """이번 달 월말 예상 지출 (오늘까지의 하루 평균 기준, 직전 3개월 평균과 비교)"""
+    return await conditional_response(
+        request, db, current_user.id, lambda: db.run(analytics.get_spending_projection, current_user.id),
+        extra=today_key(),
+    )
 
-@router.get("/statistics/monthly-trends", response_model=List[MonthlyTrend])
-def get_monthly_trends(current_user: CurrentUser, session: SessionDep, months: int = 6):
-    """월별 수입/지출 추이 (최근 N개월)"""
-    # 모든 거래 조회
-    statement = select(Transaction).where(Transaction.user_id == current_user.id)
-    transactions = session.exec(statement).all()
-
-    # 월별로 수입/지출 집계
-    monthly_data = {}
-    for transaction in transactions:
-        year = transaction.transaction_date.year
-        month = transaction.transaction_date.month
-        key = (year, month)
-
-        if key not in monthly_data:
-            monthly_data[key] = {"income": 0, "expense": 0}
-
-        if transaction.transaction_type == TransactionType.INCOME:
-            monthly_data[key]["income"] += transaction.amount
-        elif transaction.transaction_type == TransactionType.EXPENSE:
-            monthly_data[key]["expense"] += transaction.amount
-
-    # MonthlyTrend 객체 생성
-    trends = []
-    for (year, month), data in sorted(monthly_data.items(), reverse=True)[:months]:
-        income = data["income"]
-        expense = data["expense"]
-        trends.append(MonthlyTrend(
-            year=year,
-            month=month,
-            income=income,
-            expense=expense,
-            net=income - expense
-        ))
-
-    return list(reversed(trends))  # 오래된 순서로 정렬
\ No newline at end of file
+@router.get("/statistics/timeseries", responses={200: {"model": List[TimeSeriesPoint]}})
+async def get_timeseries(
+    current_user: CurrentUser,
+    # 목록 조회와 같은 필터 (start_date/end_date 가 기간)
+    filters: Annotated[TransactionFilters, Depends()],
+    interval: TimeBucket = TimeBucket.DAY,
+    # none | category | payment_method
+    group_by: TimeSeriesGroupBy = TimeSeriesGroupBy.NONE,
+):
+    """기간 버킷(day/week/month/year)별 수입/지출 (거래가 없는 버킷은 0, 스트리밍)
+
+    기간을 지정하지 않으면 오늘까지 최근 30일/12주/12개월/5년. 버킷은 최대 2000개.
+    group_by 를 지정하면 각 버킷의 groups 에 거래가 있는 그룹별 합계를 담는다.
+    """
+    # 스트리밍을 시작하기 전에 기간 검사 (400)
+    timeseries.bucket_range(filters, interval)
+    return StreamingResponse(
+        timeseries.stream_timeseries(current_user.id, filters, interval, group_by),
+        media_type="application/json",
+    )
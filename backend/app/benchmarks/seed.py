@@ -0,0 +1,140 @@
+"""벤치마크용 합성 데이터 생성"""
+from dataclasses import dataclass, field
+from datetime import timedelta
+import math
+import random
+import uuid
+
+from sqlalchemy import Engine, insert
+from sqlmodel import Session, select
+
+from app.core.security import get_password_hash
+from app.models.base import utc_now
+from app.models.category import Category
+from app.models.transaction import PaymentMethod, Transaction, TransactionType
+from app.models.user import User
+from app.services.rollup import rebuild_rollups
+
+BENCH_PASSWORD = "bench-password"
+
+
+@dataclass
+class SeedResult:
+    user_ids: list[uuid.UUID] = field(default_factory=list)
+    emails: list[str] = field(default_factory=list)
+    category_ids: list[int] = field(default_factory=list)
+    transaction_count: int = 0
+
+
+def _get_or_create_categories(session: Session, count: int) -> list[int]:
+    names = [f"bench-category-{i:02d}" for i in range(count)]
+    existing = {category.name: category.id for category in session.exec(select(Category).where(Category.name.in_(names)))}
+    for name in names:
+        if name not in existing:
+            category = Category(name=name, description=None)
+            session.add(category)
+            session.flush()
+            existing[name] = category.id
+    return [existing[name] for name in names]
+
+
+# 카테고리별 자주 나오는 가맹점 (검색 벤치마크용 설명 문자열)
+MERCHANTS = (
+    "스타벅스", "GS25", "CU", "이마트", "쿠팡", "배달의민족", "카카오택시", "CGV",
+    "올리브영", "교보문고", "SK주유소", "다이소", "맥도날드", "롯데마트", "티머니",
+)
+
+
+def _transaction_rows(rng: random.Random, user_id: uuid.UUID, category_ids: list[int], count: int, years: int):
+    """실제 가계부와 비슷한 분포의 거래
+
+    - 수입: 매달 25일 월급 (사용자마다 금액 고정, 조금씩 변동)
+    - 지출: 카테고리마다 빈도(일부 카테고리에 몰림)와 금액 규모(로그정규분포)가 다름
+    - 날짜: 최근일수록 거래가 많고 주말에 더 많음, 시간은 낮~저녁
+    """
+    now = utc_now().replace(microsecond=0)
+    span_days = 365 * years
+    salary = rng.randrange(2_500_000, 6_000_000, 10_000)
+    # 카테고리 빈도 가중치 (Zipf 형태)와 카테고리별 금액 중앙값
+    weights = [1 / (rank + 1) for rank in range(len(category_ids))]
+    medians = {category_id: rng.choice((4_000, 9_000, 15_000, 30_000, 60_000, 150_000)) for category_id in category_ids}
+
+    months = min(years * 12, count // 10)
+    payday = now.replace(day=25, hour=9, minute=0, second=0)
+    for _ in range(months):
+        # 이번 달 월급날이 아직 안 왔으면 지난달부터
+        if payday > now:
+            payday = (payday.replace(day=1) - timedelta(days=1)).replace(day=25)
+        amount = int(salary * rng.uniform(0.95, 1.1)) // 10 * 10
+        yield _row(user_id, category_ids[0], amount, TransactionType.INCOME, None, "월급", payday)
+        payday = (payday.replace(day=1) - timedelta(days=1)).replace(day=25)
+
+    for i in range(count - months):
+        while True:
+            # 최근 쪽으로 치우친 분포 (삼각분포, 최빈값 = 오늘)
+            day = now - timedelta(days=rng.triangular(0, span_days, 0))
+            if day.weekday() >= 5 or rng.random() < 0.7:
+                break
+        hour = min(23, max(7, int(rng.gauss(15, 4))))
+        transaction_date = min(now, day.replace(hour=hour, minute=rng.randrange(60), second=rng.randrange(60), microsecond=0))
+        category_id = rng.choices(category_ids, weights)[0]
+        amount = max(100, int(rng.lognormvariate(math.log(medians[category_id]), 0.8)) // 100 * 100)
+        payment_method = rng.choice([PaymentMethod.CARD, PaymentMethod.CARD, PaymentMethod.CARD, PaymentMethod.CASH, None])
+        description = f"{rng.choice(MERCHANTS)} {rng.randrange(1, 200)}호점"
+        yield _row(user_id, category_id, amount, TransactionType.EXPENSE, payment_method, description, transaction_date)
+
+
+def _row(user_id, category_id, amount, transaction_type, payment_method, description, transaction_date) -> dict:
+    return {
+        "user_id": user_id,
+        "category_id": category_id,
+        "amount": amount,
+        "transaction_type": transaction_type,
+        "payment_method": payment_method,
+        "description": description,
+        "transaction_date": transaction_date,
+        "created_at": transaction_date,
+        "updated_at": transaction_date,
+    }
+
+
+def seed(
+    engine: Engine,
+    *,
+    users: int = 5,
+    categories: int = 12,
+    transactions_per_user: int = 10_000,
+    years: int = 3,
+    seed: int = 42,
+    batch_size: int = 5_000,
+) -> SeedResult:
+    """사용자/카테고리/거래를 만들고 월별 롤업까지 다시 계산"""
+    rng = random.Random(seed)
+    result = SeedResult()
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+
+    with Session(engine) as session:
+        result.category_ids = _get_or_create_categories(session, categories)
+
+        for i in range(users):
+            user = User(email=f"bench-user-{seed}-{i}@example.com", full_name=f"bench user {i}", hashed_password=hashed_password)
+            session.add(user)
+            session.flush()
+            result.user_ids.append(user.id)
+            result.emails.append(user.email)
+
+            batch = []
+            for row in _transaction_rows(rng, user.id, result.category_ids, transactions_per_user, years):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    session.exec(insert(Transaction), params=batch)
+                    batch = []
+            if batch:
+                session.exec(insert(Transaction), params=batch)
+            result.transaction_count += transactions_per_user
+
+        for user_id in result.user_ids:
+            rebuild_rollups(session, user_id)
+        session.commit()
+
+    return result
@@ -0,0 +1,136 @@
+"""
+관리용 커맨드
+
+사용법:
+    python -m app.cli rollups verify [--user-id UUID] [--repair]
+    python -m app.cli rollups rebuild [--user-id UUID]
+    python -m app.cli partitions migrate [--months-ahead N] [--drop-old]
+    python -m app.cli partitions ensure [--months-ahead N] [--since YYYY-MM]   (cron 으로 매일)
+    python -m app.cli partitions status
+"""
+import argparse
+from datetime import datetime
+import sys
+import uuid
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.logger import setup_logger
+from app.services import partitioning, rollup
+
+logger = setup_logger(__name__)
+
+
+def rollups_rebuild(args: argparse.Namespace) -> int:
+    with Session(engine) as session:
+        count = rollup.rebuild_rollups(session, args.user_id)
+        session.commit()
+    logger.info(f"rebuilt {count} rollup rows")
+    return 0
+
+
+def rollups_verify(args: argparse.Namespace) -> int:
+    with Session(engine) as session:
+        mismatches = rollup.verify_rollups(session, args.user_id)
+        for mismatch in mismatches:
+            logger.warning(f"rollup drift: {mismatch.model_dump_json()}")
+
+        if not mismatches:
+            logger.info("rollups are consistent")
+            return 0
+
+        if args.repair:
+            # 어긋난 사용자만 다시 생성
+            for user_id in sorted({mismatch.user_id for mismatch in mismatches}, key=str):
+                rollup.rebuild_rollups(session, user_id)
+            session.commit()
+            logger.info(f"repaired {len(mismatches)} rollup rows")
+            return 0
+    return 1
+
+
+def partitions_migrate(args: argparse.Namespace) -> int:
+    with Session(engine) as session:
+        if not partitioning.is_supported(session):
+            logger.error("partitioning requires PostgreSQL")
+            return 1
+        if partitioning.is_partitioned(session):
+            logger.info("transactions is already partitioned")
+            return 0
+        moved = partitioning.migrate_to_partitioned(session, args.months_ahead, drop_old=args.drop_old)
+        session.commit()
+    logger.info(f"moved {moved} transactions into monthly partitions")
+    if not args.drop_old:
+        logger.info(f"the previous table is kept as {partitioning.UNPARTITIONED_TABLE}")
+    return 0
+
+
+def partitions_ensure(args: argparse.Namespace) -> int:
+    with Session(engine) as session:
+        if not partitioning.is_partitioned(session):
+            logger.warning("transactions is not partitioned (run: partitions migrate)")
+            return 1
+        created = partitioning.ensure_partitions(session, args.months_ahead, since=args.since)
+        session.commit()
+    logger.info(f"created {len(created)} partitions" + (f": {', '.join(created)}" if created else ""))
+    return 0
+
+
+def partitions_status(args: argparse.Namespace) -> int:
+    with Session(engine) as session:
+        if not partitioning.is_partitioned(session):
+            logger.info("transactions is not partitioned")
+            return 0
+        for name in sorted(partitioning.existing_partitions(session)):
+            print(name)
+    return 0
+
+
+def _month(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rollups = commands.add_parser("rollups", help="월별 롤업 관리").add_subparsers(dest="action", required=True)
+
+    rebuild = rollups.add_parser("rebuild", help="원본 거래로부터 롤업 재생성")
+    rebuild.add_argument("--user-id", type=uuid.UUID, default=None)
+    rebuild.set_defaults(handler=rollups_rebuild)
+
+    verify = rollups.add_parser("verify", help="롤업과 원본 거래 비교")
+    verify.add_argument("--user-id", type=uuid.UUID, default=None)
+    verify.add_argument("--repair", action="store_true", help="어긋난 사용자의 롤업 재생성")
+    verify.set_defaults(handler=rollups_verify)
+
+    partitions = commands.add_parser("partitions", help="거래 테이블 월별 파티션 (PostgreSQL)").add_subparsers(
+        dest="action", required=True
+    )
+
+    migrate = partitions.add_parser("migrate", help="기존 거래 테이블을 월별 파티션 테이블로 변환 (쓰기가 잠시 막힘)")
+    migrate.add_argument("--months-ahead", type=int, default=settings.TRANSACTION_PARTITION_MONTHS_AHEAD)
+    migrate.add_argument("--drop-old", action="store_true", help="변환 전 테이블 삭제")
+    migrate.set_defaults(handler=partitions_migrate)
+
+    ensure = partitions.add_parser("ensure", help="앞으로 필요한 파티션 생성, 기본 파티션의 행을 월 파티션으로 이동")
+    ensure.add_argument("--months-ahead", type=int, default=settings.TRANSACTION_PARTITION_MONTHS_AHEAD)
+    ensure.add_argument("--since", type=_month, default=None, help="이 달(YYYY-MM)부터 파티션 생성")
+    ensure.set_defaults(handler=partitions_ensure)
+
+    status = partitions.add_parser("status", help="파티션 목록")
+    status.set_defaults(handler=partitions_status)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
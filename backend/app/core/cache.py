@@ -0,0 +1,292 @@
+import asyncio
+from collections import OrderedDict, defaultdict
+import json
+import threading
+import time
+from typing import Callable, Generic, Hashable, Iterable, Optional, TypeVar
+import uuid
+
+from app.core.config import settings
+from app.core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+V = TypeVar("V")
+
+# 이름 -> 캐시 (모니터링 API 에서 통계 조회용)
+caches: dict[str, "TTLCache"] = {}
+
+
+class TTLCache(Generic[V]):
+    """프로세스 내 TTL + LRU 캐시 (스레드풀/이벤트 루프 양쪽에서 사용 가능)
+
+    tags 로 여러 키를 묶어 한 번에 무효화할 수 있다. (예: 사용자 id -> 그 사용자의 토큰들)
+
+    사용법:
+        cache = TTLCache("users", maxsize=10_000, ttl=60)
+        cache.set(token, snapshot, tags=[user_id])
+        cache.get(token)            # 없거나 만료되면 None
+        cache.invalidate_tag(user_id)
+
+    DB 에서 읽어 채울 때는 읽기 전에 begin_fill 로 세대 번호를 받아 set 에 넘긴다.
+    읽는 동안 그 키(또는 태그)가 무효화되면 set 은 읽은 (이미 오래된) 값을 저장하지 않는다.
+
+        generation = cache.begin_fill(user_id, tags=[user_id])
+        value = load(...)
+        cache.set(user_id, value, tags=[user_id], generation=generation)
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, V, tuple]] = OrderedDict()
+        self._tags: dict[Hashable, set[Hashable]] = defaultdict(set)
+        # 채우는 중인 키 -> (세대 번호, 태그). 무효화되면 빠짐
+        self._fills: OrderedDict[Hashable, tuple[int, tuple]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        caches[name] = self
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def begin_fill(self, key: Hashable, tags: Iterable[Hashable] = ()) -> int:
+        """값을 읽기 전에 호출. 반환한 세대 번호를 set(generation=) 에 넘긴다"""
+        with self._lock:
+            self._generation += 1
+            self._fills.pop(key, None)
+            self._fills[key] = (self._generation, tuple(tags))
+            # 읽다가 실패해서 set 을 호출하지 않은 항목이 쌓이지 않도록
+            while len(self._fills) > self.maxsize:
+                self._fills.popitem(last=False)
+            return self._generation
+
+    def set(
+        self,
+        key: Hashable,
+        value: V,
+        ttl: Optional[float] = None,
+        tags: Iterable[Hashable] = (),
+        generation: Optional[int] = None,
+    ) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        tags = tuple(tags)
+        with self._lock:
+            if generation is not None:
+                fill = self._fills.get(key)
+                if fill is None or fill[0] != generation:
+                    # begin_fill 이후 무효화됨 (또는 더 나중에 시작한 채우기가 있음)
+                    return
+                del self._fills[key]
+            if ttl <= 0:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._tags[tag].add(key)
+            # 가장 오래 사용하지 않은 항목부터 제거
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._fills.pop(key, None)
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def invalidate_tag(self, tag: Hashable) -> None:
+        with self._lock:
+            for key, (_, tags) in list(self._fills.items()):
+                if tag in tags:
+                    del self._fills[key]
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tags.clear()
+            self._fills.clear()
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class InvalidationBus:
+    """캐시 무효화 메시지 전달 (기본: 같은 프로세스 안에서만)
+
+    publish 는 동기 함수라 서비스 함수(스레드풀/run_sync) 어디서든 commit 후에 호출하면 된다.
+    여러 uvicorn 워커가 무효화를 공유하려면 CACHE_BACKEND=postgres 를 사용한다.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[Callable[[str], None]]] = defaultdict(list)
+
+    def subscribe(self, topic: str, handler: Callable[[str], None]) -> None:
+        self._handlers[topic].append(handler)
+
+    def publish(self, topic: str, key: str) -> None:
+        self._dispatch(topic, key)
+
+    def _dispatch(self, topic: str, key: str) -> None:
+        for handler in self._handlers.get(topic, ()):
+            handler(key)
+
+    def _dispatch_all(self) -> None:
+        """놓친 메시지가 있을 수 있을 때 (재연결 등) 구독 중인 캐시를 전부 비움"""
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler("*")
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    """PostgreSQL LISTEN/NOTIFY 로 다른 워커에 무효화를 전달
+
+    이 워커의 캐시는 publish 시점에 바로 무효화하고, 다른 워커는 NOTIFY 를 받아 무효화한다.
+    알림 연결이 끊긴 동안의 메시지는 잃어버리므로 재연결할 때 캐시를 전부 비운다. (최악의 경우에도 TTL 안에 반영)
+    """
+
+    CHANNEL = "cache_invalidation"
+    RECONNECT_DELAY = 5
+
+    def __init__(self, dsn: str) -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.origin = uuid.uuid4().hex
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connection = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, topic: str, key: str) -> None:
+        self._dispatch(topic, key)
+        if self._loop is None:
+            return
+        payload = json.dumps({"origin": self.origin, "topic": topic, "key": key})
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._loop.create_task(self._notify(payload))
+        else:
+            # 스레드풀에서 호출된 경우
+            asyncio.run_coroutine_threadsafe(self._notify(payload), self._loop)
+
+    async def _notify(self, payload: str) -> None:
+        if self._connection is None:
+            logger.warning("Cache invalidation not sent (listener disconnected): %s", payload)
+            return
+        try:
+            async with self._lock:
+                await self._connection.execute("SELECT pg_notify($1, $2)", self.CHANNEL, payload)
+        except Exception:
+            logger.exception("Cache invalidation NOTIFY failed")
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except json.JSONDecodeError:
+            return
+        if message.get("origin") != self.origin:
+            self._dispatch(message["topic"], message["key"])
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(self.CHANNEL, self._on_notification)
+                self._connection = connection
+                self._dispatch_all()
+                try:
+                    await closed.wait()
+                finally:
+                    self._connection = None
+                    if not connection.is_closed():
+                        await connection.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation listener failed (%s), reconnecting in %ss", e, self.RECONNECT_DELAY)
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+
+
+def create_invalidation_bus() -> InvalidationBus:
+    if settings.CACHE_BACKEND == "postgres":
+        return PostgresInvalidationBus(settings.DATABASE_URL)
+    return InvalidationBus()
+
+
+invalidation_bus = create_invalidation_bus()
+
+
+def subscribe_cache(topic: str, cache: TTLCache) -> None:
+    """topic 메시지의 key 를 태그로 무효화 ("*" 는 전체)"""
+    invalidation_bus.subscribe(topic, lambda key: cache.clear() if key == "*" else cache.invalidate_tag(key))
@@ -2,6 +2,15 @@ from typing import Self
 from pydantic import EmailStr, model_validator, computed_field
 from pydantic_settings import BaseSettings
 
+
+def to_async_url(url: str) -> str:
+    """동기 드라이버 URL -> 비동기 드라이버 URL (asyncpg/aiosqlite)"""
+    for sync_scheme, async_scheme in (("postgresql://", "postgresql+asyncpg://"), ("sqlite://", "sqlite+aiosqlite://")):
+        if url.startswith(sync_scheme):
+            return async_scheme + url[len(sync_scheme):]
+    return url
+
+
 class Settings(BaseSettings):
     ENVIRONMENT: str
     FRONTEND_HOST: str
@@ -17,10 +26,68 @@ class Settings(BaseSettings):
     DATABASE_USER: str = "postgres"
     DATABASE_PASSWORD: str
     DATABASE_NAME: str = "budget_book"
+    # 지정하면 위 값 대신 사용 (예: 로컬 테스트용 sqlite:///./budget_book.db)
+    SQLALCHEMY_DATABASE_URL: str | None = None
+    # True: async 라우트가 비동기 엔진(asyncpg/aiosqlite) 사용, False: 동기 엔진을 스레드풀에서 사용
+    DATABASE_ASYNC: bool = True
+    # SQL 로그: off | info (실행한 SQL) | debug (결과 행까지). 모든 쿼리를 동기로 출력하므로 운영에서는 off
+    SQL_ECHO: str = "off"
+    # 이보다 오래 걸린 쿼리는 경고 로그 (None 이면 끔)
+    SLOW_QUERY_MS: int | None = 200
+    # 커넥션 풀 (엔진마다, 워커 프로세스마다 따로 잡힘). 재사용 주기(초)는 DB/프록시의 유휴 연결 종료 시간보다 짧게
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_POOL_RECYCLE_SECONDS: int | None = None
+    # 읽기 전용 복제본 URL (쉼표로 구분). GET 라우트는 돌아가며 복제본에서 조회
+    DATABASE_READ_URLS: str = ""
+    # 쓰기 후 이 시간(초) 동안은 그 사용자의 조회를 주 DB 로 (복제 지연 동안 방금 쓴 내용이 안 보이는 것 방지)
+    READ_AFTER_WRITE_SECONDS: float = 5
+    # PgBouncer (transaction 모드) 뒤에서 실행: asyncpg prepared statement 캐시를 끔
+    # CACHE_BACKEND=postgres 의 LISTEN 은 세션을 유지해야 하므로 그때는 DB 에 직접 연결해야 함
+    DATABASE_PGBOUNCER: bool = False
+    # 월별 파티션 테이블일 때 (python -m app.cli partitions migrate) 미리 만들어 둘 파티션 개월 수 (시작 시/cron 으로 생성)
+    TRANSACTION_PARTITION_MONTHS_AHEAD: int = 3
+
+    # 로그 형식: text | json (한 줄에 JSON 하나)
+    LOG_FORMAT: str = "text"
+    # /metrics (Prometheus 텍스트 형식) 와 요청 지표 수집
+    METRICS_ENABLED: bool = True
+    # /metrics 수집기가 보낼 Bearer 토큰. 없으면 관리자 로그인 토큰으로만 조회 가능
+    METRICS_TOKEN: str | None = None
+    # 요청별 SQL 수/시간 응답 헤더 + 같은 쿼리 반복(N+1) 감지 (개발/테스트용)
+    QUERY_DEBUG: bool = False
+    # 한 요청에서 같은 쿼리 지문이 이 횟수를 넘으면 warn: 경고 로그, raise: RepeatedQueryError 로 요청 실패
+    QUERY_REPEAT_THRESHOLD: int = 10
+    QUERY_REPEAT_ACTION: str = "warn"
+    # 관리자가 X-Profile: 1 헤더나 ?profile=1 로 요청하면 cProfile 로 측정 (/monitoring/profiles 에서 조회)
+    PROFILING_ENABLED: bool = False
+    # 워커별로 보관할 최근 프로파일 수
+    PROFILE_BUFFER_SIZE: int = 20
+
+    # 캐시 설정
+    # local: 워커(프로세스)별 무효화, postgres: LISTEN/NOTIFY 로 워커 간 무효화 공유
+    CACHE_BACKEND: str = "local"
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10_000
+    CATEGORY_CACHE_TTL_SECONDS: int = 300
+    # 사용자 데이터 버전 캐시 (CACHE_BACKEND=local 로 여러 워커를 띄우면 다른 워커의 변경은 이 시간 안에 반영)
+    DATA_VERSION_CACHE_TTL_SECONDS: int = 30
+    # 목록/통계 응답 캐시
+    RESPONSE_CACHE_MAX_SIZE: int = 5_000
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    # 분석 통계용 사용자별 거래 배열 (NumPy, 거래 10만 건에 약 2MB)
+    ANALYTICS_CACHE_MAX_SIZE: int = 256
+    ANALYTICS_CACHE_TTL_SECONDS: int = 600
 
     # 보안 설정
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
+    # bcrypt cost (바꾸면 다음 로그인 때 기존 해시를 새 cost 로 다시 저장)
+    BCRYPT_ROUNDS: int = 12
+    # 비밀번호 해시 프로세스 풀 크기 (None 이면 CPU 코어 수)와 풀이 꽉 찼을 때 대기할 수 있는 작업 수
+    PASSWORD_HASH_WORKERS: int | None = None
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     # SMTP 설정
     SMTP_TLS: bool = True
@@ -32,6 +99,13 @@ class Settings(BaseSettings):
     EMAILS_FROM_EMAIL: EmailStr | None = None
     EMAILS_FROM_NAME: EmailStr | None = None
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48
+    SMTP_TIMEOUT_SECONDS: float = 10
+    # 이 시간 동안 보낼 메일이 없으면 열어 둔 SMTP 연결을 닫음
+    SMTP_IDLE_SECONDS: float = 60
+    # 발송 대기열 크기 (꽉 차면 503), 실패 시 재시도 횟수와 첫 재시도 대기 시간 (초, 매번 두 배)
+    EMAIL_QUEUE_SIZE: int = 1000
+    EMAIL_MAX_RETRIES: int = 5
+    EMAIL_RETRY_BACKOFF_SECONDS: float = 2.0
     EMAIL_TEST_USER: EmailStr
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
@@ -45,8 +119,21 @@ class Settings(BaseSettings):
     @computed_field  # type: ignore[prop-decorator]
     @property
     def DATABASE_URL(self) -> str:
+        if self.SQLALCHEMY_DATABASE_URL:
+            return self.SQLALCHEMY_DATABASE_URL
         return f"postgresql://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return to_async_url(self.DATABASE_URL)
+
+    @property
+    def read_database_urls(self) -> list[tuple[str, str]]:
+        """복제본 (동기 URL, 비동기 URL) 목록"""
+        urls = [url.strip() for url in self.DATABASE_READ_URLS.split(",") if url.strip()]
+        return [(url, to_async_url(url)) for url in urls]
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def emails_enabled(self) -> bool:
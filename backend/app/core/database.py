@@ -1,19 +1,100 @@
-from typing import Annotated
-from fastapi import Depends, HTTPException, status
+from contextlib import asynccontextmanager
+import itertools
+import secrets
+import time
+from typing import Annotated, Any, AsyncIterator, Callable, Optional, TypeVar
+import uuid
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 import jwt
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.core import security
+from app.core.cache import TTLCache, invalidation_bus, subscribe_cache
 from app.core.config import settings
+from app.core.db_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, register_engine
+from app.core.profiling import request_profiler
+from app.core.query_log import instrument_engine
 from app.models.user import TokenPayload, User
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # 연결상태확인
-    echo=True  # SQL 쿼리로그 출력
-)
+T = TypeVar("T")
+
+# SQL_ECHO -> create_engine(echo=...)
+SQL_ECHO_LEVELS = {"off": False, "info": True, "debug": "debug"}
+sql_echo = SQL_ECHO_LEVELS.get(settings.SQL_ECHO, False)
+
+
+def _pool_options() -> dict:
+    """풀 크기/대기 시간/재사용 주기 (DB_POOL_*)"""
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    }
+    if settings.DB_POOL_RECYCLE_SECONDS is not None:
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE_SECONDS
+    return options
+
+
+def _async_connect_args(url: str) -> dict:
+    if settings.DATABASE_PGBOUNCER and url.startswith("postgresql+asyncpg"):
+        # PgBouncer transaction 모드: 서버 커넥션이 트랜잭션마다 바뀌므로 prepared statement 를 재사용하지 않음
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {}
+
+
+def create_engines(url: str, async_url: str, label: str) -> tuple[Engine, Optional[AsyncEngine]]:
+    """동기 엔진 + (DATABASE_ASYNC 이면) 비동기 엔진. label 은 /metrics 의 engine 라벨 (비동기는 label-async)"""
+    sync_engine = create_engine(
+        url,
+        pool_pre_ping=True,  # 연결상태확인
+        # SQLite 는 요청 스레드와 커넥션 생성 스레드가 다를 수 있음
+        connect_args={"check_same_thread": False} if url.startswith("sqlite") else {},
+        echo=sql_echo,  # SQL 쿼리로그 출력
+        # 커넥션 대기 시간 측정 (/metrics 의 engine 라벨)
+        poolclass=TimedQueuePool,
+        pool_logging_name=label,
+        **_pool_options(),
+    )
+    # 쿼리 시간 집계 + 느린 쿼리 로그
+    instrument_engine(sync_engine)
+    register_engine(label, sync_engine)
+
+    # 비동기 엔진 (DATABASE_ASYNC=False 이면 만들지 않고 위 동기 엔진을 스레드풀에서 사용)
+    if not settings.DATABASE_ASYNC:
+        return sync_engine, None
+    async_label = "async" if label == "sync" else f"{label}-async"
+    async_engine = create_async_engine(
+        async_url,
+        pool_pre_ping=True,
+        echo=sql_echo,
+        connect_args=_async_connect_args(async_url),
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name=async_label,
+        **_pool_options(),
+    )
+    instrument_engine(async_engine.sync_engine)
+    register_engine(async_label, async_engine.sync_engine)
+    return sync_engine, async_engine
+
+
+engine, async_engine = create_engines(settings.DATABASE_URL, settings.ASYNC_DATABASE_URL, "sync")
+
+# 읽기 전용 복제본 (DATABASE_READ_URLS). GET 라우트가 ReadSessionDep 로 돌아가며 사용
+read_engines: list[tuple[Engine, Optional[AsyncEngine]]] = [
+    create_engines(url, async_url, f"read{index}")
+    for index, (url, async_url) in enumerate(settings.read_database_urls)
+]
+_read_turn = itertools.count()
 
 # 의존성 주입
 def get_db():
@@ -22,35 +103,168 @@ def get_db():
 
 SessionDep = Annotated[Session, Depends(get_db)]
 
+
+class AsyncDBSession:
+    """async 라우트에서 DB 작업을 이벤트 루프를 막지 않고 실행
+
+    DB 작업은 동기 sqlmodel Session 을 첫 인자로 받는 함수로 작성하고 run 으로 실행한다.
+        DATABASE_ASYNC=True : AsyncSession.run_sync (asyncpg/aiosqlite, 이벤트 루프에서 그린렛으로 실행)
+        DATABASE_ASYNC=False: 동기 Session 을 스레드풀에서 실행 (기존 def 라우트와 같은 방식)
+
+    사용법:
+        async def get_item(db: AsyncSessionDep, item_id: int):
+            return await db.run(items.get_item, item_id)
+    """
+
+    def __init__(self, session: AsyncSession | Session) -> None:
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if isinstance(self.session, AsyncSession):
+            return await self.session.run_sync(fn, *args, **kwargs)
+        # 프로파일링 중이면 스레드풀 스레드에서도 측정 (ProfilingMiddleware)
+        profiler = request_profiler.get()
+        if profiler is not None:
+            fn = profiler.wrap(fn)
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+
+def _pick_engines(read_only: bool) -> tuple[Engine, Optional[AsyncEngine]]:
+    if read_only and read_engines:
+        return read_engines[next(_read_turn) % len(read_engines)]
+    return engine, async_engine
+
+
+@asynccontextmanager
+async def open_async_db(read_only: bool = False) -> AsyncIterator[AsyncDBSession]:
+    """요청 밖(스트리밍 응답, 동시 조회 등)에서 쓰는 독립 세션
+
+    read_only=True 이면 복제본(있으면)에 연결한다. 방금 쓴 사용자인지는 호출하는 쪽에서 확인 (read_from_primary)
+    """
+    sync_engine, async_engine_ = _pick_engines(read_only)
+    if async_engine_ is not None:
+        async with AsyncSession(async_engine_, expire_on_commit=False) as session:
+            yield AsyncDBSession(session)
+    else:
+        session = Session(sync_engine, expire_on_commit=False)
+        try:
+            yield AsyncDBSession(session)
+        finally:
+            await run_in_threadpool(session.close)
+
+
+async def get_async_db() -> AsyncIterator[AsyncDBSession]:
+    async with open_async_db() as db:
+        yield db
+
+AsyncSessionDep = Annotated[AsyncDBSession, Depends(get_async_db)]
+
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
+# 검증된 토큰 -> 사용자 컬럼 값. 사용자가 바뀌면 invalidate_user 로 무효화
+user_cache: TTLCache[dict] = TTLCache(
+    "users", maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+subscribe_cache("user", user_cache)
+
+# 최근에 쓴 사용자 id (READ_AFTER_WRITE_SECONDS 동안 주 DB 에서 조회). "*" 는 모든 사용자 (카테고리 변경 등)
+ALL_USERS = "*"
+recent_writes: TTLCache[bool] = TTLCache(
+    "recent_writes", maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.READ_AFTER_WRITE_SECONDS
+)
+
+
+def _mark_written(key: str) -> None:
+    recent_writes.set(key, True)
+
+
+# commit 후 무효화 메시지를 쓰기 알림으로 사용 (CACHE_BACKEND=postgres 이면 다른 워커의 쓰기도 받음)
+invalidation_bus.subscribe("data_version", _mark_written)
+invalidation_bus.subscribe("user", _mark_written)
+invalidation_bus.subscribe("category", lambda key: _mark_written(ALL_USERS))
+
+
+def _token_user_id(request: Request) -> Optional[str]:
+    """Authorization 헤더의 사용자 id (DB 조회 없이, 잘못된 토큰이면 None)"""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    snapshot = user_cache.get(token)
+    if snapshot is not None:
+        return str(snapshot["id"])
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (InvalidTokenError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
-    user = session.get(User, token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[security.ALGORITHM])
+        return str(uuid.UUID(TokenPayload(**payload).sub))
+    except (InvalidTokenError, ValidationError, TypeError, ValueError):
+        return None
+
+
+def read_from_primary(user_id: Optional[str]) -> bool:
+    """복제 지연 때문에 방금 쓴 내용이 안 보일 수 있으면 True"""
+    if not read_engines or recent_writes.get(ALL_USERS):
+        return True
+    return user_id is not None and recent_writes.get(user_id) is not None
+
+
+async def get_read_db(request: Request) -> AsyncIterator[AsyncDBSession]:
+    """조회 전용 라우트의 세션: 복제본에서 조회 (복제본이 없거나 방금 쓴 사용자면 주 DB)"""
+    read_only = not read_from_primary(_token_user_id(request))
+    async with open_async_db(read_only=read_only) as db:
+        yield db
+
+ReadSessionDep = Annotated[AsyncDBSession, Depends(get_read_db)]
+
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    """사용자 수정/비밀번호 변경/삭제 commit 후 호출 (다른 워커에도 전달)"""
+    invalidation_bus.publish("user", str(user_id))
+
+
+async def get_current_user(db: AsyncSessionDep, token: TokenDep) -> User:
+    # 캐시에 있으면 토큰 검증과 DB 조회를 건너뜀 (만료 시각은 토큰 exp 를 넘지 않음)
+    # 요청마다 새 User 객체를 만들어 반환하므로 세션에 붙어 있지 않다.
+    # 수정이 필요한 라우트는 id 로 다시 조회해야 함
+    snapshot = user_cache.get(token)
+    if snapshot is None:
+        try:
+            payload = jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+            )
+            token_data = TokenPayload(**payload)
+            user_id = uuid.UUID(token_data.sub)
+        except (InvalidTokenError, ValidationError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Could not validate credentials",
+            )
+        # 읽는 사이에 사용자가 바뀌면(비활성화 등) 읽은 값을 캐시하지 않음
+        generation = user_cache.begin_fill(token, tags=[str(user_id)])
+        user = await db.run(Session.get, User, user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        snapshot = user.model_dump()
+        expires_in = payload["exp"] - time.time() if "exp" in payload else None
+        user_cache.set(token, snapshot, ttl=expires_in, tags=[str(user_id)], generation=generation)
+    user = User(**snapshot)
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return user
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
+async def get_current_active_superuser(current_user: CurrentUser) -> User:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=403, detail="The user doesn't have enough privileges"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+async def verify_metrics_access(db: AsyncSessionDep, token: TokenDep) -> None:
+    """/metrics 조회 권한: METRICS_TOKEN 과 같은 Bearer 토큰 또는 관리자 로그인 토큰"""
+    if settings.METRICS_TOKEN and secrets.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        return
+    await get_current_active_superuser(await get_current_user(db, token))
@@ -0,0 +1,66 @@
+import time
+from typing import Iterator
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import Counter, Gauge, Histogram
+
+# 0.1ms ~ 10s (대부분 0 에 가깝고 풀이 모자랄 때만 길어짐)
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+pool_wait = Histogram(
+    "db_pool_wait_seconds", "커넥션 풀에서 커넥션을 얻기까지 기다린 시간", labelnames=("engine",), buckets=POOL_WAIT_BUCKETS
+)
+pool_timeouts = Counter("db_pool_timeouts_total", "pool_timeout 안에 커넥션을 얻지 못한 횟수", labelnames=("engine",))
+
+# 라벨 -> 엔진 (pool_logging_name 과 같은 값)
+_engines: dict[str, Engine] = {}
+
+
+class _TimedPoolMixin:
+    """커넥션을 꺼낼 때(_do_get) 대기 시간 측정. 라벨은 create_engine(pool_logging_name=...)"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        label = self.logging_name or "default"
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_timeouts.inc(engine=label)
+            raise
+        finally:
+            pool_wait.observe(time.perf_counter() - started, engine=label)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_values(method: str) -> Iterator[tuple[tuple[str, ...], float]]:
+    for label, engine in list(_engines.items()):
+        # QueuePool 계열만 (NullPool, StaticPool 등은 값이 없음)
+        value = getattr(engine.pool, method, None)
+        if value is not None:
+            yield (label,), value()
+
+
+Gauge("db_pool_size", "풀 크기 (pool_size)", labelnames=("engine",), collect=lambda: _pool_values("size"))
+Gauge("db_pool_checked_out", "사용 중인 커넥션 수", labelnames=("engine",), collect=lambda: _pool_values("checkedout"))
+Gauge("db_pool_checked_in", "풀에서 쉬고 있는 커넥션 수", labelnames=("engine",), collect=lambda: _pool_values("checkedin"))
+Gauge(
+    "db_pool_overflow",
+    "pool_size 를 넘어 추가로 연 커넥션 수 (음수면 아직 열지 않은 풀 자리)",
+    labelnames=("engine",),
+    collect=lambda: _pool_values("overflow"),
+)
+
+
+def register_engine(label: str, engine: Engine) -> None:
+    """풀 상태 게이지에 엔진 추가 (비동기 엔진은 async_engine.sync_engine)"""
+    _engines[label] = engine
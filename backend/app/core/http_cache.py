@@ -0,0 +1,23 @@
+from fastapi import Request, Response
+
+
+def make_etag(value: str, weak: bool = True) -> str:
+    return f'W/"{value}"' if weak else f'"{value}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 에 etag 가 있으면 True (약한 비교: W/ 접두어 무시)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == target for candidate in header.split(","))
+
+
+def not_modified(etag: str, cache_control: str | None = None) -> Response:
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=304, headers=headers)
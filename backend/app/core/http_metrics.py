@@ -0,0 +1,82 @@
+import time
+from typing import Iterator
+
+from anyio import to_thread
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import Counter, Gauge, Histogram
+
+UNMATCHED = "unmatched"
+
+requests_total = Counter(
+    "http_requests_total", "처리한 요청 수", labelnames=("route", "method", "status")
+)
+request_duration = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간 (응답 본문 전송까지)", labelnames=("route",)
+)
+requests_in_flight = Gauge("http_requests_in_flight", "처리 중인 요청 수", labelnames=("route",))
+
+
+def _threadpool_values(field: str) -> Iterator[tuple[tuple[str, ...], float]]:
+    # 이벤트 루프 안에서만 읽을 수 있음 (/metrics 는 async 라우트)
+    try:
+        limiter = to_thread.current_default_thread_limiter()
+    except RuntimeError:
+        return
+    statistics = limiter.statistics()
+    values = {
+        "total": limiter.total_tokens,
+        "borrowed": statistics.borrowed_tokens,
+        "waiting": statistics.tasks_waiting,
+    }
+    yield (), values[field]
+
+
+# 동기 라우트, run_in_threadpool(db.run 포함)이 같이 쓰는 anyio 기본 스레드풀 (waiting > 0 이면 포화)
+Gauge("threadpool_size", "anyio 기본 스레드풀 크기", collect=lambda: _threadpool_values("total"))
+Gauge("threadpool_busy", "사용 중인 스레드 수", collect=lambda: _threadpool_values("borrowed"))
+Gauge("threadpool_waiting", "스레드를 기다리는 작업 수", collect=lambda: _threadpool_values("waiting"))
+
+
+def route_name(scope: Scope) -> str:
+    """요청에 맞는 라우트의 operation id (custom_generate_unique_id, 예: transactions-get_transactions)
+
+    경로(/transactions/123 등)가 아니라 매칭된 라우트로 이름을 정하므로 라벨 수는 라우트 수를 넘지 않는다.
+    """
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "unique_id", None) or route.name
+    return UNMATCHED
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수/처리 시간/처리 중인 요청 수 집계"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = route_name(scope)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        requests_in_flight.inc(route=route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_duration.observe(time.perf_counter() - started, route=route)
+            requests_in_flight.dec(route=route)
+            requests_total.inc(route=route, method=scope["method"], status=str(status))
@@ -1,6 +1,34 @@
+from datetime import datetime, timezone
+import json
 import logging
 import sys
 
+from app.core.config import settings
+
+# LogRecord 기본 속성 (이 외의 속성은 extra 로 넘긴 값)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 하나 (LOG_FORMAT=json, 로그 수집기용). extra 로 넘긴 값도 필드로 포함"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.filename}:{record.lineno}",
+        }
+        entry.update(
+            (key, value) for key, value in vars(record).items()
+            if key not in _RECORD_ATTRS and not key.startswith("_")
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
 def setup_logger(name: str = __name__) -> logging.Logger:
     """
     디버깅용 로거 설정
@@ -24,10 +52,13 @@ def setup_logger(name: str = __name__) -> logging.Logger:
         handler.setLevel(logging.DEBUG)
 
         # 포맷 설정 (시간, 레벨, 파일명, 함수명, 메시지)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        if settings.LOG_FORMAT == "json":
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
@@ -0,0 +1,236 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.utils import formataddr
+import smtplib
+from typing import Optional
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_DELAY = 300.0
+
+
+@dataclass
+class EmailJob:
+    email_to: str
+    subject: str
+    html_content: str
+    attempts: int = 0
+
+
+def build_message(email_to: str, subject: str, html_content: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = formataddr((str(settings.EMAILS_FROM_NAME or ""), str(settings.EMAILS_FROM_EMAIL)))
+    message["To"] = email_to
+    message.set_content(html_content, subtype="html")
+    return message
+
+
+def connect() -> smtplib.SMTP:
+    """SMTP 설정으로 연결 (SMTP_TLS: STARTTLS, SMTP_SSL: 처음부터 TLS)"""
+    if settings.SMTP_SSL and not settings.SMTP_TLS:
+        smtp: smtplib.SMTP = smtplib.SMTP_SSL(
+            settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS
+        )
+    else:
+        smtp = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS)
+        if settings.SMTP_TLS:
+            smtp.starttls()
+    if settings.SMTP_USER:
+        smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+    return smtp
+
+
+def send_now(email_to: str, subject: str, html_content: str) -> None:
+    """연결을 새로 열어서 바로 발송 (대기열 없이)"""
+    with connect() as smtp:
+        smtp.send_message(build_message(email_to, subject, html_content))
+
+
+def _permanent(error: Exception) -> bool:
+    # 5xx 응답(주소 없음, 인증 실패 등)은 다시 보내도 실패
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+class EmailQueue:
+    """메일 발송 대기열 + 백그라운드 워커
+
+    라우트는 대기열에 넣고 바로 응답한다. 워커는 SMTP 연결 하나를 열어 두고 재사용하며
+    (smtp_idle 초 동안 보낼 메일이 없으면 닫음) 실패한 메일은 retry_backoff 초부터 두 배씩 늘려 max_retries 번 다시 보낸다.
+    대기열이 꽉 차면 503 으로 거절한다. start() 전(테스트, CLI 등)에는 스레드풀에서 바로 발송한다.
+
+    사용법:
+        await mailer.send(email_to=user.email, subject=..., html_content=...)
+    """
+
+    def __init__(self, maxsize: int, max_retries: int, retry_backoff: float, smtp_idle: float) -> None:
+        self.maxsize = maxsize
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.smtp_idle = smtp_idle
+        self._queue: Optional[asyncio.Queue[EmailJob]] = None
+        self._worker: Optional[asyncio.Task] = None
+        # SMTP 연결은 이 스레드에서만 사용
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._retries: set[asyncio.TimerHandle] = set()
+        self.retrying = 0
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.rejected = 0
+        self.connections = 0
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """대기열에 남은 메일을 timeout 초까지 보내고 종료 (재시도 대기 중인 메일은 버림)"""
+        if self._worker is None or self._queue is None or self._executor is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Email queue stopped with %d unsent emails", self._queue.qsize())
+        if self.retrying:
+            logger.warning("Email queue stopped with %d emails waiting to be retried", self.retrying)
+        for handle in self._retries:
+            handle.cancel()
+        self._retries.clear()
+        self.retrying = 0
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        executor = self._executor
+        await asyncio.get_running_loop().run_in_executor(executor, self._close)
+        executor.shutdown(wait=False)
+        self._worker = self._queue = self._executor = None
+
+    async def send(self, email_to: str, subject: str = "", html_content: str = "") -> None:
+        if not settings.emails_enabled:
+            raise HTTPException(status_code=503, detail="Email delivery is not configured")
+        if self._queue is None:
+            await run_in_threadpool(send_now, email_to, subject, html_content)
+            self.sent += 1
+            return
+        try:
+            self._queue.put_nowait(EmailJob(email_to, subject, html_content))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Too many emails waiting to be sent, try again later",
+                headers={"Retry-After": "5"},
+            )
+
+    async def join(self) -> None:
+        """대기열이 빌 때까지 대기 (재시도 대기 중인 메일은 제외)"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                # 연결이 열려 있으면 smtp_idle 초까지만 기다리고 닫음
+                if self._smtp is not None:
+                    job = await asyncio.wait_for(self._queue.get(), self.smtp_idle)
+                else:
+                    job = await self._queue.get()
+            except asyncio.TimeoutError:
+                await loop.run_in_executor(self._executor, self._close)
+                continue
+            try:
+                await loop.run_in_executor(self._executor, self._deliver, job)
+                self.sent += 1
+            except Exception as e:
+                self._retry(job, e)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, job: EmailJob) -> None:
+        message = build_message(job.email_to, job.subject, job.html_content)
+        for reconnect in (False, True):
+            if self._smtp is None:
+                self._smtp = connect()
+                self.connections += 1
+            try:
+                self._smtp.send_message(message)
+                return
+            except smtplib.SMTPServerDisconnected:
+                # 서버가 유휴 연결을 끊은 경우 한 번만 다시 연결
+                self._close()
+                if reconnect:
+                    raise
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException):
+                # 서버가 메일을 거절한 것이라 연결은 계속 사용 가능
+                raise
+            except Exception:
+                self._close()
+                raise
+
+    def _close(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+    def _retry(self, job: EmailJob, error: Exception) -> None:
+        job.attempts += 1
+        if _permanent(error) or job.attempts > self.max_retries:
+            self.failed += 1
+            logger.error("Failed to send email to %s after %d attempts: %s", job.email_to, job.attempts, error)
+            return
+        delay = min(self.retry_backoff * 2 ** (job.attempts - 1), MAX_RETRY_DELAY)
+        self.retried += 1
+        self.retrying += 1
+        logger.warning("Sending email to %s failed (%s), retrying in %.1fs", job.email_to, error, delay)
+        loop = asyncio.get_running_loop()
+        self._retries = {handle for handle in self._retries if handle.when() > loop.time()}
+        self._retries.add(loop.call_later(delay, self._requeue, job))
+
+    def _requeue(self, job: EmailJob) -> None:
+        self.retrying -= 1
+        if self._queue is None:
+            return
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.failed += 1
+            logger.error("Dropped email to %s: queue is full", job.email_to)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queued": self.maxsize,
+            "retrying": self.retrying,
+            "sent": self.sent,
+            "failed": self.failed,
+            "retried": self.retried,
+            "rejected": self.rejected,
+            "connections": self.connections,
+            "connected": self._smtp is not None,
+        }
+
+
+mailer = EmailQueue(
+    settings.EMAIL_QUEUE_SIZE,
+    settings.EMAIL_MAX_RETRIES,
+    settings.EMAIL_RETRY_BACKOFF_SECONDS,
+    settings.SMTP_IDLE_SECONDS,
+)
@@ -0,0 +1,214 @@
+import math
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
+# 이름 -> 지표 (모니터링 API, /metrics 에서 조회용)
+metrics: dict[str, "Metric"] = {}
+
+# 초 단위 버킷 상한 (1ms ~ 10s)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (라벨 값 튜플, 값) 목록을 돌려주는 함수 (조회 시점에 값을 읽는 게이지용)
+Collector = Callable[[], Iterable[tuple[tuple[str, ...], float]]]
+
+
+class Metric:
+    """지표 공통 (이름, 설명, 라벨). samples 는 Prometheus 텍스트 형식의 (접미사, 라벨, 값)"""
+
+    type = "untyped"
+
+    def __init__(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.description = description
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        metrics[name] = self
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, description, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", dict(zip(self.labelnames, key)), value
+
+
+class Gauge(Metric):
+    """현재 값 (inc/dec/set). collect 를 주면 조회할 때마다 그 함수로 값을 읽음"""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        collect: Optional[Collector] = None,
+    ) -> None:
+        super().__init__(name, description, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self.collect = collect
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        if self.collect is not None:
+            items = list(self.collect())
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        for key, value in items:
+            yield "", dict(zip(self.labelnames, key)), value
+
+
+class Histogram(Metric):
+    """고정 버킷 지연시간 히스토그램 (라벨 값 조합별로 따로 집계, 스레드 안전)
+
+    라벨 조합이 max_series 를 넘으면 새 조합은 "other" 로 합쳐서 메모리가 늘지 않게 한다.
+
+    사용법:
+        query_duration = Histogram("db_query_duration_seconds", "SQL 실행 시간", labelnames=("fingerprint",))
+        query_duration.observe(0.012, fingerprint="3f2a9c")
+    """
+
+    type = "histogram"
+    OTHER = "other"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        max_series: int = 1000,
+    ) -> None:
+        super().__init__(name, description, labelnames)
+        self.buckets = buckets
+        self.max_series = max_series
+        # 라벨 값 -> [버킷별 개수..., +Inf 개수], 합계, 최댓값
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+        self._maxes: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                if len(self._counts) >= self.max_series:
+                    key = (self.OTHER,) * len(self.labelnames)
+                    counts = self._counts.get(key)
+                if counts is None:
+                    counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                    self._sums[key] = 0.0
+                    self._maxes[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+            self._maxes[key] = max(self._maxes[key], value)
+
+    def quantile(self, counts: list[int], q: float) -> Optional[float]:
+        """버킷 안에서 선형 보간한 분위수 추정값 (마지막 버킷을 넘으면 마지막 상한)"""
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.buckets[-1]
+
+    def series(self) -> list[dict]:
+        """라벨 조합별 집계 (count, sum, max, 누적 버킷, p50/p95/p99)"""
+        with self._lock:
+            items = [
+                (key, list(counts), self._sums[key], self._maxes[key])
+                for key, counts in self._counts.items()
+            ]
+        result = []
+        for key, counts, total, maximum in items:
+            cumulative = []
+            running = 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+            result.append({
+                "labels": dict(zip(self.labelnames, key)),
+                "count": running,
+                "sum": total,
+                "max": maximum,
+                "buckets": list(zip(self.buckets + (float("inf"),), cumulative)),
+                "p50": self.quantile(counts, 0.50),
+                "p95": self.quantile(counts, 0.95),
+                "p99": self.quantile(counts, 0.99),
+            })
+        return result
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for item in self.series():
+            for bound, count in item["buckets"]:
+                yield "_bucket", {**item["labels"], "le": _format_value(bound)}, count
+            yield "_sum", item["labels"], item["sum"]
+            yield "_count", item["labels"], item["count"]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+            self._maxes.clear()
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus() -> str:
+    """등록된 모든 지표를 Prometheus 텍스트 형식(0.0.4)으로"""
+    lines = []
+    for metric in list(metrics.values()):
+        lines.append(f"# HELP {metric.name} {_escape(metric.description)}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for suffix, labels, value in metric.samples():
+            label_text = ",".join(f'{name}="{_escape(str(label))}"' for name, label in labels.items())
+            name = metric.name + suffix
+            lines.append(f"{name}{{{label_text}}} {_format_value(value)}" if label_text else f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,53 @@
+import base64
+import binascii
+import json
+from typing import Any, Optional
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlmodel import Session
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """커서 값을 클라이언트에 넘길 불투명 문자열로 인코딩"""
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """encode_cursor 의 역변환 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement> (바인드 파라미터는 드라이버 형식 그대로)"""
+    inherit_cache = False
+
+    def __init__(self, statement) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate_count(session: Session, statement) -> Optional[int]:
+    """플래너가 추정한 statement 의 결과 행 수 (PostgreSQL 만, 그 외 DB 는 None)
+
+    ANALYZE 통계 기반이라 실제 값과 다를 수 있지만 count(*) 와 달리 행을 읽지 않는다.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    plan = session.exec(_Explain(statement)).scalar_one()
+    if isinstance(plan, str):
+        # asyncpg 는 json 타입을 문자열로 반환
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
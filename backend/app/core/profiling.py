@@ -0,0 +1,217 @@
+from collections import deque
+from contextvars import ContextVar
+import cProfile
+from dataclasses import dataclass, field
+from datetime import datetime
+import marshal
+import pstats
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+from urllib.parse import parse_qs
+import uuid
+
+from fastapi import HTTPException
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logger import setup_logger
+from app.core.query_log import QueryTracker, normalize, request_queries
+from app.models.base import utc_now
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+PROFILE_HEADER = "x-profile"
+PROFILE_QUERY_PARAM = "profile"
+
+
+@dataclass
+class RequestProfile:
+    """프로파일링한 요청 하나 (cProfile 통계 + 실행한 SQL)"""
+    id: str
+    created_at: datetime
+    method: str
+    path: str
+    route: Optional[str]
+    user_email: str
+    status_code: int = 0
+    duration: float = 0.0
+    # pstats.Stats.stats (dump_stats 와 같은 형식으로 내려받을 수 있게 그대로 보관)
+    stats: dict = field(default_factory=dict)
+    # (지문, 정규화한 SQL, 요청 시작부터 걸린 시간, 실행 시간)
+    queries: list[tuple[str, str, float, float]] = field(default_factory=list)
+
+    def functions(self, sort: str = "cumulative", limit: int = 50) -> list[dict]:
+        """함수별 호출 수/시간 (sort: cumulative | total) 과 호출한 함수 목록 (호출 트리)"""
+        items = []
+        for (filename, line, name), (primitive_calls, calls, total, cumulative, callers) in self.stats.items():
+            items.append({
+                "function": pstats.func_std_string((filename, line, name)),
+                "calls": calls,
+                "primitive_calls": primitive_calls,
+                "total_ms": total * 1000,
+                "cumulative_ms": cumulative * 1000,
+                "callers": [pstats.func_std_string(caller) for caller in callers],
+            })
+        key = "total_ms" if sort == "total" else "cumulative_ms"
+        return sorted(items, key=lambda item: item[key], reverse=True)[:limit]
+
+    def dump(self) -> bytes:
+        """pstats 파일 내용 (snakeviz, python -m pstats 로 열 수 있음)"""
+        return marshal.dumps(self.stats)
+
+
+# 최근 프로파일 (워커별, 오래된 것부터 밀려남)
+profiles: deque[RequestProfile] = deque(maxlen=settings.PROFILE_BUFFER_SIZE)
+
+
+class RequestProfiler:
+    """요청 하나를 cProfile 로 측정
+
+    이벤트 루프 스레드는 요청 전체를, 스레드풀에서 실행하는 DB 작업(AsyncDBSession.run)은
+    스레드마다 따로 측정해서 합친다. 이벤트 루프 측정에는 같은 시간에 처리 중인 다른 요청의 작업도 섞일 수 있다.
+    """
+
+    def __init__(self) -> None:
+        self._loop_profile = cProfile.Profile()
+        self._thread_profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        self._loop_profile.enable()
+
+    def stop(self) -> dict:
+        self._loop_profile.disable()
+        stats = pstats.Stats(self._loop_profile)
+        with self._lock:
+            for profile in self._thread_profiles:
+                stats.add(profile)
+        return stats.stats  # type: ignore[attr-defined]
+
+    def wrap(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """스레드풀에서 실행할 함수를 그 스레드에서 측정하도록 감쌈"""
+        def run(*args: Any, **kwargs: Any) -> T:
+            profile = cProfile.Profile()
+            try:
+                return profile.runcall(fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._thread_profiles.append(profile)
+        return run
+
+
+# 현재 요청의 프로파일러 (프로파일링 중인 요청에서만 설정)
+request_profiler: ContextVar[Optional[RequestProfiler]] = ContextVar("request_profiler", default=None)
+# cProfile 은 스레드에 하나만 켤 수 있어서 워커당 한 요청씩만 프로파일링
+_profiling = threading.Lock()
+
+
+def _requested(scope: Scope) -> bool:
+    for name, value in scope["headers"]:
+        if name == PROFILE_HEADER.encode() and value not in (b"", b"0", b"false"):
+            return True
+    query = scope.get("query_string", b"")
+    if PROFILE_QUERY_PARAM.encode() in query:
+        values = parse_qs(query.decode("latin-1")).get(PROFILE_QUERY_PARAM, [])
+        return any(value not in ("", "0", "false") for value in values)
+    return False
+
+
+async def _superuser_email(scope: Scope) -> Optional[str]:
+    """Authorization 헤더의 토큰이 활성 관리자이면 이메일, 아니면 None"""
+    # database 가 이 모듈을 import 하므로 여기서 import
+    from app.core.database import get_current_user, open_async_db
+
+    authorization = dict(scope["headers"]).get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        async with open_async_db() as db:
+            user = await get_current_user(db, token)
+    except HTTPException:
+        return None
+    return user.email if user.is_superuser else None
+
+
+class ProfilingMiddleware:
+    """관리자가 X-Profile: 1 헤더나 ?profile=1 로 요청하면 그 요청을 cProfile 로 측정 (PROFILING_ENABLED)
+
+    결과는 profiles 버퍼에 쌓이고 응답 헤더 X-Profile-Id 로 id 를 알려준다.
+    조회는 /monitoring/profiles. 요청하지 않은 요청은 헤더만 확인하고 그대로 통과한다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        user_email = await _superuser_email(scope)
+        if user_email is None or not _profiling.acquire(blocking=False):
+            if user_email is not None:
+                logger.info("Profiling skipped: another request is being profiled")
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self._profile(scope, receive, send, user_email)
+        finally:
+            _profiling.release()
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send, user_email: str) -> None:
+        profile = RequestProfile(
+            id=uuid.uuid4().hex[:12],
+            created_at=utc_now(),
+            method=scope["method"],
+            path=scope["path"],
+            route=None,
+            user_email=user_email,
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile.id)
+            await send(message)
+
+        # SQL 은 요청 집계(QUERY_DEBUG)가 있으면 그것에, 없으면 새 집계에 기록
+        tracker = request_queries.get()
+        tracker_token = None
+        if tracker is None:
+            tracker = QueryTracker()
+            tracker_token = request_queries.set(tracker)
+        tracker.statements = []
+
+        profiler = RequestProfiler()
+        profiler_token = request_profiler.set(profiler)
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.stats = profiler.stop()
+            profile.duration = time.perf_counter() - started
+            request_profiler.reset(profiler_token)
+            if tracker_token is not None:
+                request_queries.reset(tracker_token)
+            route = scope.get("route")
+            profile.route = f"{profile.method} {route.path}" if route is not None else None
+            profile.queries = [
+                (key, normalize(statement), finished - duration - started, duration)
+                for key, statement, duration, finished in tracker.statements
+            ]
+            tracker.statements = None
+            profiles.append(profile)
+            logger.info(
+                "Profiled %s %s in %.1f ms (id %s)", profile.method, profile.path, profile.duration * 1000, profile.id
+            )
+
+
+def get_profile(profile_id: str) -> Optional[RequestProfile]:
+    return next((profile for profile in profiles if profile.id == profile_id), None)
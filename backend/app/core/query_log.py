@@ -0,0 +1,217 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+import hashlib
+import re
+import threading
+import time
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logger import setup_logger
+from app.core.metrics import Histogram
+from app.core.request_context import current_route
+
+logger = setup_logger(__name__)
+
+MAX_FINGERPRINTS = 500
+MAX_TRACKED_STATEMENTS = 1000
+
+# 지문 id -> 정규화한 SQL
+fingerprints: dict[str, str] = {}
+_fingerprints_lock = threading.Lock()
+
+query_duration = Histogram(
+    "db_query_duration_seconds",
+    "SQL 실행 시간 (쿼리 지문별)",
+    labelnames=("fingerprint",),
+    max_series=MAX_FINGERPRINTS,
+)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+# IN (?, ?, ?) / VALUES (?, ?), (?, ?) 처럼 개수만 다른 목록은 하나로
+_ITEM = r"\?(?:::\w+)?"  # asyncpg 는 $1::INTEGER 처럼 타입 캐스트가 붙음
+_GROUP = rf"\(\s*{_ITEM}(?:\s*,\s*{_ITEM})*\s*\)"
+_LIST = re.compile(rf"{_GROUP}(?:\s*,\s*{_GROUP})*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(statement: str) -> str:
+    """리터럴/파라미터 값을 ? 로 바꿔서 같은 모양의 쿼리를 하나로 묶음"""
+    sql = _STRING.sub("?", statement)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+@lru_cache(maxsize=2048)
+def _fingerprint(statement: str) -> tuple[str, str]:
+    sql = normalize(statement)
+    return hashlib.sha1(sql.encode("utf-8")).hexdigest()[:12], sql
+
+
+def fingerprint(statement: str) -> str:
+    """쿼리 지문 id (정규화한 SQL 의 해시 앞 12자리). 같은 SQL 문자열은 다시 정규화하지 않음"""
+    key, sql = _fingerprint(statement)
+    if key not in fingerprints:
+        with _fingerprints_lock:
+            if len(fingerprints) < MAX_FINGERPRINTS:
+                fingerprints.setdefault(key, sql)
+    return key
+
+
+class RepeatedQueryError(Exception):
+    """한 요청에서 같은 쿼리가 QUERY_REPEAT_THRESHOLD 번을 넘게 실행됨 (QUERY_REPEAT_ACTION=raise)"""
+
+
+class QueryTracker:
+    """SQL 실행 횟수/시간과 지문별 실행 횟수 (요청 하나 또는 track_queries 블록 동안)"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter[str] = Counter()
+        # 실행 순서대로 (지문, SQL, 시간, 끝난 시각). 프로파일링할 때만 리스트로 설정
+        self.statements: Optional[list[tuple[str, str, float, float]]] = None
+        # 동기 모드에서는 한 요청의 쿼리가 여러 스레드에서 실행될 수 있음
+        self._lock = threading.Lock()
+
+    def record(self, key: str, duration: float, statement: str = "") -> int:
+        """기록하고 이 지문의 실행 횟수를 반환"""
+        with self._lock:
+            self.count += 1
+            self.duration += duration
+            self.fingerprints[key] += 1
+            if self.statements is not None and len(self.statements) < MAX_TRACKED_STATEMENTS:
+                self.statements.append((key, statement, duration, time.perf_counter()))
+            return self.fingerprints[key]
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """threshold 번을 넘게 실행된 지문 -> 횟수"""
+        return {key: count for key, count in self.fingerprints.items() if count > threshold}
+
+    def report(self) -> str:
+        """많이 실행된 순서로 "횟수 x SQL" 목록"""
+        return "\n".join(
+            f"{count:>4} x [{key}] {fingerprints.get(key, '')[:200]}"
+            for key, count in self.fingerprints.most_common()
+        )
+
+
+# 현재 요청의 집계 (QueryCounterMiddleware, QUERY_DEBUG 일 때만)
+request_queries: ContextVar[Optional[QueryTracker]] = ContextVar("request_queries", default=None)
+# track_queries 로 등록한 집계 (스레드/요청과 관계없이 모든 쿼리)
+_trackers: list[QueryTracker] = []
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryTracker]:
+    """블록 안에서 실행된 모든 쿼리 집계 (테스트/스크립트용, TestClient 요청도 포함)"""
+    tracker = QueryTracker()
+    _trackers.append(tracker)
+    try:
+        yield tracker
+    finally:
+        _trackers.remove(tracker)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    duration = time.perf_counter() - conn.info["query_started"].pop()
+    key = fingerprint(statement)
+    query_duration.observe(duration, fingerprint=key if key in fingerprints else Histogram.OTHER)
+
+    if settings.SLOW_QUERY_MS is not None and duration * 1000 >= settings.SLOW_QUERY_MS:
+        rows = getattr(cursor, "rowcount", -1)
+        logger.warning(
+            "Slow query %.1f ms [%s] %s",
+            duration * 1000,
+            key,
+            fingerprints.get(key, normalize(statement))[:500],
+            extra={
+                "fingerprint": key,
+                "duration_ms": round(duration * 1000, 3),
+                "rows": rows if rows is not None and rows >= 0 else None,
+                "route": current_route(),
+            },
+        )
+
+    for tracker in _trackers:
+        tracker.record(key, duration)
+    tracker = request_queries.get()
+    if tracker is not None and tracker.record(key, duration, statement) == settings.QUERY_REPEAT_THRESHOLD + 1:
+        _repeated_query(key, statement)
+
+
+def _repeated_query(key: str, statement: str) -> None:
+    """같은 쿼리가 한 요청에서 반복됨 (대부분 관계 lazy load 로 인한 N+1)"""
+    message = (
+        f"Query [{key}] ran more than {settings.QUERY_REPEAT_THRESHOLD} times in {current_route()} "
+        f"(possible N+1): {fingerprints.get(key, normalize(statement))[:500]}"
+    )
+    if settings.QUERY_REPEAT_ACTION == "raise":
+        raise RepeatedQueryError(message)
+    logger.warning(message, extra={"fingerprint": key, "route": current_route()})
+
+
+def _handle_error(exception_context) -> None:
+    # 실패한 쿼리는 after_cursor_execute 가 호출되지 않음
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진의 모든 쿼리 실행 시간을 지문별로 집계하고 느린 쿼리를 로그로 남김
+
+    비동기 엔진은 async_engine.sync_engine 을 넘긴다.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryCounterMiddleware:
+    """요청별 SQL 수/시간을 응답 헤더로 추가 (QUERY_DEBUG, 개발/테스트용)
+
+    X-DB-Query-Count, X-DB-Query-Time-Ms, 반복된 쿼리가 있으면 X-DB-Repeated-Queries (지문=횟수).
+    스트리밍 응답은 헤더를 보낸 뒤의 쿼리는 포함하지 않는다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tracker = QueryTracker()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-DB-Query-Count", str(tracker.count))
+                headers.append("X-DB-Query-Time-Ms", f"{tracker.duration * 1000:.2f}")
+                repeated = tracker.repeated(settings.QUERY_REPEAT_THRESHOLD)
+                if repeated:
+                    headers.append("X-DB-Repeated-Queries", ",".join(f"{key}={count}" for key, count in repeated.items()))
+            await send(message)
+
+        token = request_queries.set(tracker)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_queries.reset(token)
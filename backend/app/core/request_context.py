@@ -0,0 +1,45 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+@dataclass
+class RequestContext:
+    """현재 요청 정보 (로그/지표에서 어느 라우트의 작업인지 구분할 때 사용)"""
+    method: str
+    path: str
+    scope: Scope
+
+    @property
+    def route(self) -> str:
+        """라우트 경로 템플릿 (예: GET /api/v1/transactions/{transaction_id}). 라우팅 전이면 실제 경로"""
+        route = self.scope.get("route")
+        return f"{self.method} {getattr(route, 'path', self.path)}"
+
+
+# 스레드풀(run_in_threadpool)과 run_sync 에도 그대로 전달됨
+request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def current_route() -> Optional[str]:
+    context = request_context.get()
+    return context.route if context is not None else None
+
+
+class RequestContextMiddleware:
+    """요청마다 request_context 설정 (ASGI 미들웨어라 스트리밍 응답이 끝날 때까지 유지)"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = request_context.set(RequestContext(scope["method"], scope["path"], scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_context.reset(token)
@@ -1,8 +1,15 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, Optional
 
 import bcrypt
+from fastapi import HTTPException
 import jwt
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
 
@@ -20,7 +27,111 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(ENCODING), hashed_password.encode(ENCODING))
 
 
-def get_password_hash(password: str) -> str:
-    salt = bcrypt.gensalt()
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
+    salt = bcrypt.gensalt(rounds or settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode(ENCODING), salt)
     return hashed.decode(ENCODING)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """해시의 cost($2b$12$... 의 12)가 BCRYPT_ROUNDS 와 다르면 True"""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+
+def _timed(fn: Callable, *args: Any) -> tuple[Any, float]:
+    """워커 프로세스에서 실행 (실행 시간을 함께 돌려줘서 대기 시간과 구분)"""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+class PasswordHashPool:
+    """bcrypt 전용 프로세스 풀
+
+    bcrypt 는 요청당 수백 ms 의 CPU 작업이라 기본 스레드풀에서 돌리면 다른 라우트가 밀린다.
+    별도 프로세스 풀(모든 코어 사용)에서 실행하고, 대기 중인 작업이 max_pending 을 넘으면 503 으로 거절한다.
+    start() 전(테스트, CLI 등)에는 스레드풀에서 실행한다.
+
+    사용법:
+        hashed = await password_pool.hash(password)
+        ok = await password_pool.verify(password, hashed)
+    """
+
+    def __init__(self, workers: Optional[int], max_pending: int) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+
+    async def start(self) -> None:
+        # fork 는 실행 중인 스레드의 락 상태까지 복사하므로 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        # 워커 프로세스를 미리 띄워서 첫 로그인이 느려지지 않게 함
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self._executor, os.getpid) for _ in range(self.workers)])
+
+    async def stop(self) -> None:
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await run_in_threadpool(executor.shutdown)
+
+    async def _run(self, fn: Callable, *args: Any) -> Any:
+        if self.in_flight >= self.workers + self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Too many password operations in progress, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            if self._executor is None:
+                result, run_time = await run_in_threadpool(_timed, fn, *args)
+            else:
+                result, run_time = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, _timed, fn, *args
+                )
+        finally:
+            self.in_flight -= 1
+
+        wait = time.perf_counter() - started - run_time
+        self.completed += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.total_run += run_time
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password, settings.BCRYPT_ROUNDS)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": self.total_wait / self.completed * 1000 if self.completed else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+            "avg_run_ms": self.total_run / self.completed * 1000 if self.completed else 0.0,
+        }
+
+
+password_pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
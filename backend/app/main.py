@@ -1,22 +1,62 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRoute
-from sqlmodel import SQLModel
-from app.core.database import engine
 from app.core.config import settings
 from app.api.routes import api_router
+from app.core.cache import invalidation_bus
+from app.core.database import open_async_db, verify_metrics_access
+from app.core.http_metrics import MetricsMiddleware
+from app.core.logger import setup_logger
+from app.core.mailer import mailer
+from app.core.metrics import render_prometheus
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_log import QueryCounterMiddleware
+from app.core.request_context import RequestContextMiddleware
+from app.core.security import password_pool
+from app.services import partitioning
+from app.services.categories import category_cache
 
 # Import all models to register them with SQLModel
 from app.models.user import User
 from app.models.category import Category
 from app.models.transaction import Transaction
+from app.models.rollup import MonthlyRollup
+from app.models.data_version import UserDataVersion
+
+logger = setup_logger(__name__)
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}" if route.tags else route.name
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 간 캐시 무효화 수신 (CACHE_BACKEND=postgres)
+    await invalidation_bus.start()
+    await password_pool.start()
+    await mailer.start()
+    # 카테고리 캐시 미리 채우기 (실패해도 첫 요청 때 다시 읽음)
+    try:
+        async with open_async_db() as db:
+            await db.run(category_cache.load)
+    except Exception as e:
+        logger.warning("Category cache warm-up failed: %s", e)
+    # 거래 테이블이 월별 파티션이면 다음 달들 파티션 미리 생성
+    try:
+        async with open_async_db() as db:
+            await db.run(partitioning.maintain_partitions, settings.TRANSACTION_PARTITION_MONTHS_AHEAD)
+    except Exception as e:
+        logger.warning("Transaction partition maintenance failed: %s", e)
+    yield
+    await mailer.stop()
+    await password_pool.stop()
+    await invalidation_bus.stop()
+
 app = FastAPI(
     title="Budget Book API",
-    generate_unique_id_function=custom_generate_unique_id
+    generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan
 )
 
 # CORS middleware must be added before routers
@@ -28,13 +68,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 로그/지표에 현재 라우트를 남기기 위한 요청 컨텍스트
+app.add_middleware(RequestContextMiddleware)
+# QueryCounterMiddleware 안쪽이어야 프로파일에 요청 집계의 SQL 이 기록됨
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if settings.QUERY_DEBUG:
+    app.add_middleware(QueryCounterMiddleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
-# Create tables after app initialization
-SQLModel.metadata.create_all(engine)
+# 테이블/인덱스는 Alembic 마이그레이션으로 관리 (alembic upgrade head)
 
 print([route.path for route in api_router.routes])
 
 @app.get("/")
 def read_root():
     return {"message": "Welcome to Budget Book API"}
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(verify_metrics_access)])
+    async def metrics():
+        """Prometheus 수집용 지표 (워커별 값, METRICS_TOKEN 또는 관리자 토큰 필요)"""
+        return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
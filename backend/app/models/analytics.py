@@ -0,0 +1,31 @@
+from typing import Optional
+
+from sqlmodel import SQLModel
+
+
+# Schema
+class MonthlyAnalytics(SQLModel):
+    year: int
+    month: int
+    income: int
+    expense: int
+    net: int  # income - expense
+    expense_rolling_average: float  # 이 달까지 window 개월 지출 평균
+    expense_change: int  # 전월 대비 지출 증감
+    expense_change_ratio: Optional[float] = None  # 전월 대비 증감률 (전월 지출이 0 이면 None)
+
+class CategoryShare(SQLModel):
+    category_id: int
+    category_name: str
+    total_amount: int
+    transaction_count: int
+    share: float  # 기간 전체 지출 중 비율 (0~1)
+
+class SpendingProjection(SQLModel):
+    year: int
+    month: int
+    days_elapsed: int
+    days_in_month: int
+    spent_to_date: int  # 이번 달 오늘까지 지출
+    projected_expense: int  # 지금까지의 하루 평균으로 계산한 월말 예상 지출
+    average_expense: float  # 직전 3개월 평균 지출 (비교용)
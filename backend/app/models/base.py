@@ -2,11 +2,23 @@ from datetime import datetime, timezone
 from typing import Optional
 from sqlmodel import Field, SQLModel
 
+
+def utc_now() -> datetime:
+    """현재 UTC 시각 (naive). 컬럼이 timestamp without time zone 이라 asyncpg 는 aware 값을 거부함"""
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def to_naive(value: datetime | None) -> datetime | None:
+    """timezone 정보를 버리고 벽시계 시각만 남김 (psycopg2 가 timestamp 컬럼에 저장하던 방식과 같음)"""
+    if value is not None and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
 # Base
 class Base(SQLModel):
     id: int | None = Field(default=None, primary_key=True)
-    created_at: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0))
-    updated_at: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0))
+    created_at: datetime | None = Field(default_factory=utc_now)
+    updated_at: datetime | None = Field(default_factory=utc_now)
 
 class Message(SQLModel):
     message: str
\ No newline at end of file
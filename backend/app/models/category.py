@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 from typing import List, Optional
 from datetime import datetime
@@ -11,6 +12,13 @@ class CategoryBase(SQLModel):
 # entity
 class Category(CategoryBase, Base, table=True):
     __tablename__ = "categories"
+    __table_args__ = (
+        # 이름 부분 검색 (ILIKE '%q%') - PostgreSQL pg_trgm 전용
+        Index(
+            "ix_categories_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Relationship
     transaction: List["Transaction"] = Relationship(back_populates="category")
@@ -0,0 +1,25 @@
+from typing import Dict, List
+
+from sqlmodel import SQLModel
+
+from app.models.transaction import CategorySpending, MonthlyTrend, TransactionResponse
+from app.models.user import UserPublic
+
+
+# Schema
+class MonthSummary(SQLModel):
+    year: int
+    month: int
+    income: int
+    expense: int
+    net: int  # income - expense
+    transaction_count: int
+
+class DashboardResponse(SQLModel):
+    user: UserPublic
+    month: MonthSummary
+    top_categories: List[CategorySpending]
+    trends: List[MonthlyTrend]
+    recent_transactions: List[TransactionResponse]
+    # 섹션별 조회 시간 (ms, 세션 연결 포함). total 은 동시에 실행한 전체 시간
+    timings: Dict[str, float]
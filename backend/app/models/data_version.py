@@ -0,0 +1,12 @@
+import uuid
+
+from sqlalchemy import BigInteger
+from sqlmodel import Field, SQLModel
+
+# Entity
+class UserDataVersion(SQLModel, table=True):
+    """사용자별 거래 데이터 버전 (거래가 바뀔 때마다 같은 DB 트랜잭션에서 1 증가)"""
+    __tablename__ = "user_data_versions"
+
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    version: int = Field(default=0, sa_type=BigInteger)
@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlmodel import SQLModel
+
+
+# Schema
+class CacheStats(SQLModel):
+    name: str
+    size: int
+    maxsize: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    invalidations: int
+
+class PasswordHashStats(SQLModel):
+    workers: int
+    max_pending: int
+    in_flight: int
+    queued: int  # 워커를 기다리는 작업 수 (계속 0 보다 크면 로그인 부하가 풀을 넘는 상태)
+    completed: int
+    rejected: int  # 대기열이 꽉 차서 503 으로 거절한 수
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_run_ms: float
+
+class EmailQueueStats(SQLModel):
+    queued: int
+    max_queued: int
+    retrying: int  # 재시도 대기 중
+    sent: int
+    failed: int  # 재시도까지 실패해서 버린 수
+    retried: int
+    rejected: int  # 대기열이 꽉 차서 503 으로 거절한 수
+    connections: int  # 연 SMTP 연결 수 (sent 보다 훨씬 작아야 연결을 재사용하는 것)
+    connected: bool
+
+class QueryStats(SQLModel):
+    fingerprint: str
+    sql: str  # 값을 ? 로 바꾼 SQL
+    count: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+    # 히스토그램 버킷에서 추정한 값
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+
+class ProfileSummary(SQLModel):
+    id: str
+    created_at: datetime
+    method: str
+    path: str
+    route: Optional[str] = None
+    user_email: str
+    status_code: int
+    duration_ms: float
+    query_count: int
+    query_ms: float
+
+class ProfileFunction(SQLModel):
+    function: str  # 파일:줄(함수)
+    calls: int
+    primitive_calls: int  # 재귀 호출 제외
+    total_ms: float  # 함수 자체에서 쓴 시간
+    cumulative_ms: float  # 하위 호출 포함
+    callers: List[str]
+
+class ProfileQuery(SQLModel):
+    fingerprint: str
+    sql: str
+    started_ms: float  # 요청 시작부터
+    duration_ms: float
+
+class ProfileDetail(ProfileSummary):
+    functions: List[ProfileFunction]
+    queries: List[ProfileQuery]
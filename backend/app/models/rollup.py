@@ -0,0 +1,30 @@
+from datetime import date
+import uuid
+
+from sqlalchemy import BigInteger
+from sqlmodel import Field, SQLModel
+
+from app.models.transaction import TransactionType
+
+# Entity
+class MonthlyRollup(SQLModel, table=True):
+    """사용자/월/카테고리/거래유형별 합계 (거래 생성·수정·삭제 시 같은 DB 트랜잭션에서 갱신)"""
+    __tablename__ = "monthly_rollups"
+
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    period: date = Field(primary_key=True)  # 해당 월 1일
+    category_id: int = Field(foreign_key="categories.id", primary_key=True)
+    transaction_type: TransactionType = Field(primary_key=True)
+    total_amount: int = Field(default=0, sa_type=BigInteger)
+    transaction_count: int = Field(default=0)
+
+# Schema
+class RollupMismatch(SQLModel):
+    user_id: uuid.UUID
+    period: date
+    category_id: int
+    transaction_type: TransactionType
+    expected_amount: int
+    expected_count: int
+    actual_amount: int
+    actual_count: int
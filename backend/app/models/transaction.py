@@ -1,11 +1,13 @@
 
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, Optional
 from enum import Enum
 import uuid
 
+from sqlalchemy import Index
+from pydantic import field_validator
 from sqlmodel import Field, Relationship, SQLModel
-from app.models.base import Base
+from app.models.base import Base, to_naive, utc_now
 
 #Enum
 class TransactionType(str, Enum):
@@ -25,13 +27,34 @@ class TransactionBase(SQLModel):
     category_id: int
     payment_method: Optional[PaymentMethod] = None
 
+    # 요청의 timezone 은 버리고 저장 (asyncpg 는 aware datetime 을 timestamp 컬럼에 넣지 못함)
+    _naive_transaction_date = field_validator("transaction_date")(to_naive)
+
 # Entiry
 class Transaction(TransactionBase, Base, table=True):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # 목록 조회: user_id 필터 + (정렬값, id) 정렬/커서. 같은 방향 정렬은 역방향 스캔으로 처리
+        Index("ix_transactions_user_id_transaction_date_id", "user_id", "transaction_date", "id"),
+        Index("ix_transactions_user_id_amount_id", "user_id", "amount", "id"),
+        # 카테고리 필터/집계
+        Index("ix_transactions_user_id_category_id", "user_id", "category_id"),
+        # 유형 + 기간 집계
+        Index("ix_transactions_user_id_transaction_type_transaction_date", "user_id", "transaction_type", "transaction_date"),
+        # 설명 부분 검색 (ILIKE '%q%') - PostgreSQL pg_trgm 전용
+        Index(
+            "ix_transactions_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # 가져오기(import) 중복 판별
+        Index("ix_transactions_user_id_content_hash", "user_id", "content_hash", unique=True),
+    )
 
     user_id: uuid.UUID = Field(foreign_key="users.id")
     category_id: int = Field(foreign_key="categories.id")
-    transaction_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0))
+    transaction_date: datetime = Field(default_factory=utc_now)
+    # 가져오기로 생성된 거래의 내용 해시 (직접 생성한 거래는 None)
+    content_hash: Optional[str] = Field(default=None, max_length=64)
 
     # Relationship
     user: "User" = Relationship(back_populates="transactions")
@@ -39,7 +62,7 @@ class Transaction(TransactionBase, Base, table=True):
 
 # Schema
 class TransactionCreate(TransactionBase):
-    transaction_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0))
+    transaction_date: datetime = Field(default_factory=utc_now)
 
 class TransactionUpdate(SQLModel):
     amount: Optional[int] = None
@@ -49,6 +72,8 @@ class TransactionUpdate(SQLModel):
     category_id: Optional[int] = None
     payment_method: Optional[PaymentMethod] = None
 
+    _naive_transaction_date = field_validator("transaction_date")(to_naive)
+
 class TransactionResponse(TransactionBase):
     id: int
     created_at: datetime
@@ -56,9 +81,55 @@ class TransactionResponse(TransactionBase):
     user_id: uuid.UUID
     category: Optional["CategoryResponse"] = None
 
+class TotalStrategy(str, Enum):
+    EXACT = "exact"          # count(*) (기본)
+    CACHED = "cached"        # 같은 필터 + 같은 데이터 버전이면 이전 count 재사용
+    ESTIMATED = "estimated"  # 플래너 통계로 추정 (PostgreSQL)
+    NONE = "none"            # 개수 생략, has_more 만
+
 class TransactionPaginatedResponse(SQLModel):
     items: list[TransactionResponse]
-    total: int
+    total: Optional[int] = None  # 커서 모드의 두 번째 페이지부터, total_strategy=none 이면 None
+    total_strategy: Optional[TotalStrategy] = None  # total 을 구한 방법 (total 이 None 이면 None)
+    has_more: bool = False  # 이 페이지 다음에 행이 더 있는지
+    next_cursor: Optional[str] = None  # 커서 모드에서 다음 페이지가 있을 때만
+
+class BatchOperationType(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+class TransactionBatchOperation(SQLModel):
+    op: BatchOperationType
+    id: Optional[int] = None  # update / delete 대상
+    data: Optional[dict[str, Any]] = None  # create: TransactionCreate, update: TransactionUpdate 필드
+
+class TransactionBatchRequest(SQLModel):
+    operations: list[TransactionBatchOperation] = Field(max_length=1000)
+    atomic: bool = False  # True 면 하나라도 실패할 때 아무것도 반영하지 않음
+
+class TransactionBatchItemResult(SQLModel):
+    index: int
+    op: BatchOperationType
+    id: Optional[int] = None
+    status: int  # 개별 요청으로 보냈을 때의 HTTP 상태 코드
+    error: Optional[str] = None
+
+class TransactionBatchResponse(SQLModel):
+    succeeded: int
+    failed: int
+    results: list[TransactionBatchItemResult]
+
+class TransactionImportError(SQLModel):
+    row: int  # 파일의 데이터 행 번호 (1부터, CSV 헤더 제외)
+    message: str
+
+class TransactionImportResult(SQLModel):
+    total_rows: int
+    imported: int
+    duplicates: int  # 이미 가져온 행 (content hash 일치)
+    failed: int
+    errors: list[TransactionImportError]  # 앞에서부터 최대 100개만
 
 class CategorySpending(SQLModel):
     category_id: int
@@ -73,5 +144,32 @@ class MonthlyTrend(SQLModel):
     expense: int
     net: int  # income - expense
 
+class TimeBucket(str, Enum):
+    DAY = "day"
+    WEEK = "week"  # 월요일부터
+    MONTH = "month"
+    YEAR = "year"
+
+class TimeSeriesGroupBy(str, Enum):
+    NONE = "none"
+    CATEGORY = "category"
+    PAYMENT_METHOD = "payment_method"
+
+class TimeSeriesGroup(SQLModel):
+    key: int | str  # category_id 또는 payment_method
+    name: Optional[str] = None  # 카테고리 이름
+    income: int
+    expense: int
+    net: int
+    count: int
+
+class TimeSeriesPoint(SQLModel):
+    period: date  # 버킷 시작일
+    income: int
+    expense: int
+    net: int  # income - expense
+    count: int
+    groups: Optional[list[TimeSeriesGroup]] = None  # group_by 일 때만, 거래가 있는 그룹만
+
 # Import after class definition to avoid circular import
 from app.models.category import CategoryResponse
\ No newline at end of file
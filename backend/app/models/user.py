@@ -1,10 +1,10 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 import uuid
 from sqlmodel import Field, Relationship, SQLModel
 from pydantic import EmailStr
 
-from app.models.base import Base
+from app.models.base import Base, utc_now
 
 if TYPE_CHECKING:
     from app.models.transaction import Transaction
@@ -14,8 +14,8 @@ class UserBase(SQLModel):
     is_active: bool = True
     is_superuser: bool = False
     full_name: str | None = Field(default=None, max_length=255)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0))
-    updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0))
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: Optional[datetime] = Field(default_factory=utc_now)
 
 class User(UserBase, table=True):
     __tablename__ = "users"
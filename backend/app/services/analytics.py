@@ -0,0 +1,187 @@
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Optional
+import uuid
+
+import numpy as np
+from sqlalchemy import case
+from sqlmodel import Session, select
+
+from app.core.cache import TTLCache, subscribe_cache
+from app.core.config import settings
+from app.models.analytics import CategoryShare, MonthlyAnalytics, SpendingProjection
+from app.models.transaction import Transaction, TransactionType
+from app.services.categories import category_cache
+from app.services.data_version import cached_data_version
+
+# 월말 예상과 비교할 직전 개월 수
+PROJECTION_BASELINE_MONTHS = 3
+
+
+@dataclass(frozen=True)
+class TransactionArrays:
+    """사용자 거래 전체를 열(column) 단위 배열로 (행 i 가 거래 하나)"""
+    amount: np.ndarray  # int64
+    day: np.ndarray  # datetime64[D]
+    category_id: np.ndarray  # int64
+    is_expense: np.ndarray  # bool
+
+    @property
+    def month(self) -> np.ndarray:
+        """1970-01 부터의 월 번호"""
+        return self.day.astype("datetime64[M]").astype(np.int64)
+
+
+# (user_id, 데이터 버전) -> 배열. 버전이 키에 있으므로 거래가 바뀌면 다음 조회에서 다시 읽음
+arrays_cache: TTLCache[TransactionArrays] = TTLCache(
+    "analytics", maxsize=settings.ANALYTICS_CACHE_MAX_SIZE, ttl=settings.ANALYTICS_CACHE_TTL_SECONDS
+)
+subscribe_cache("data_version", arrays_cache)
+
+
+def load_arrays(session: Session, user_id: uuid.UUID) -> TransactionArrays:
+    """거래를 한 번의 쿼리로 읽어 배열로 변환 (ORM 객체를 만들지 않음)"""
+    statement = select(
+        Transaction.amount,
+        Transaction.transaction_date,
+        Transaction.category_id,
+        case((Transaction.transaction_type == TransactionType.EXPENSE, 1), else_=0),
+    ).where(Transaction.user_id == user_id)
+    rows = session.exec(statement).all()
+    if not rows:
+        return TransactionArrays(
+            amount=np.zeros(0, dtype=np.int64),
+            day=np.zeros(0, dtype="datetime64[D]"),
+            category_id=np.zeros(0, dtype=np.int64),
+            is_expense=np.zeros(0, dtype=bool),
+        )
+    amount, day, category_id, is_expense = zip(*rows)
+    return TransactionArrays(
+        amount=np.array(amount, dtype=np.int64),
+        day=np.array(day, dtype="datetime64[D]"),
+        category_id=np.array(category_id, dtype=np.int64),
+        is_expense=np.array(is_expense, dtype=bool),
+    )
+
+
+def user_arrays(session: Session, user_id: uuid.UUID) -> TransactionArrays:
+    key = (str(user_id), cached_data_version(session, user_id))
+    arrays = arrays_cache.get(key)
+    if arrays is None:
+        arrays = load_arrays(session, user_id)
+        arrays_cache.set(key, arrays, tags=[str(user_id)])
+    return arrays
+
+
+def _today(today: Optional[date]) -> date:
+    return today or datetime.now(timezone.utc).date()
+
+
+def _month_index(value: date) -> int:
+    return (value.year - 1970) * 12 + value.month - 1
+
+
+def _monthly_sums(arrays: TransactionArrays, first: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """월 first 부터 count 개월의 (수입, 지출) 합계"""
+    offset = arrays.month - first
+    in_range = (offset >= 0) & (offset < count)
+
+    def sums(mask: np.ndarray) -> np.ndarray:
+        totals = np.bincount(offset[mask], weights=arrays.amount[mask], minlength=count)
+        return np.rint(totals).astype(np.int64)
+
+    return sums(in_range & ~arrays.is_expense), sums(in_range & arrays.is_expense)
+
+
+def get_monthly_analytics(
+    session: Session, user_id: uuid.UUID, months: int = 12, window: int = 3, today: Optional[date] = None
+) -> list[MonthlyAnalytics]:
+    """최근 N개월 (오래된 순서) 수입/지출 + 지출 이동 평균 + 전월 대비 증감"""
+    if months <= 0:
+        return []
+    window = max(window, 1)
+    arrays = user_arrays(session, user_id)
+
+    # 이동 평균과 전월 대비를 계산할 수 있도록 앞쪽 달을 더 읽음
+    extra = max(window - 1, 1)
+    last = _month_index(_today(today))
+    first = last - months + 1
+    income, expense = _monthly_sums(arrays, first - extra, months + extra)
+
+    totals = np.concatenate(([0], np.cumsum(expense)))
+    rolling = (totals[window:] - totals[:-window]) / window
+    change = np.diff(expense)
+    previous = expense[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(previous > 0, change / previous, np.nan)
+
+    income, expense = income[extra:], expense[extra:]
+    rolling = rolling[len(rolling) - months:]
+    change, ratio = change[len(change) - months:], ratio[len(ratio) - months:]
+    return [
+        MonthlyAnalytics(
+            year=1970 + (first + i) // 12,
+            month=(first + i) % 12 + 1,
+            income=int(income[i]),
+            expense=int(expense[i]),
+            net=int(income[i] - expense[i]),
+            expense_rolling_average=round(float(rolling[i]), 2),
+            expense_change=int(change[i]),
+            expense_change_ratio=None if np.isnan(ratio[i]) else round(float(ratio[i]), 4),
+        )
+        for i in range(months)
+    ]
+
+
+def get_category_share(
+    session: Session, user_id: uuid.UUID, months: int = 1, today: Optional[date] = None
+) -> list[CategoryShare]:
+    """최근 N개월(이번 달 포함) 카테고리별 지출과 비율 (지출 많은 순)"""
+    if months <= 0:
+        return []
+    arrays = user_arrays(session, user_id)
+    last = _month_index(_today(today))
+    month = arrays.month
+    mask = arrays.is_expense & (month > last - months) & (month <= last)
+    if not mask.any():
+        return []
+
+    category_ids, inverse = np.unique(arrays.category_id[mask], return_inverse=True)
+    totals = np.rint(np.bincount(inverse, weights=arrays.amount[mask])).astype(np.int64)
+    counts = np.bincount(inverse)
+    grand_total = totals.sum()
+    order = np.argsort(-totals, kind="stable")
+
+    categories = category_cache.load(session).by_id
+    return [
+        CategoryShare(
+            category_id=int(category_ids[i]),
+            category_name=categories[int(category_ids[i])].name if int(category_ids[i]) in categories else "",
+            total_amount=int(totals[i]),
+            transaction_count=int(counts[i]),
+            share=round(float(totals[i] / grand_total), 4) if grand_total else 0.0,
+        )
+        for i in order
+    ]
+
+
+def get_spending_projection(session: Session, user_id: uuid.UUID, today: Optional[date] = None) -> SpendingProjection:
+    """이번 달 오늘까지의 하루 평균 지출로 월말 지출을 예상"""
+    today = _today(today)
+    arrays = user_arrays(session, user_id)
+    days_in_month = calendar.monthrange(today.year, today.month)[1]
+
+    this_month = arrays.is_expense & (arrays.month == _month_index(today)) & (arrays.day <= np.datetime64(today))
+    spent = int(arrays.amount[this_month].sum())
+    _, baseline = _monthly_sums(arrays, _month_index(today) - PROJECTION_BASELINE_MONTHS, PROJECTION_BASELINE_MONTHS)
+
+    return SpendingProjection(
+        year=today.year,
+        month=today.month,
+        days_elapsed=today.day,
+        days_in_month=days_in_month,
+        spent_to_date=spent,
+        projected_expense=round(spent / today.day * days_in_month),
+        average_expense=round(float(baseline.mean()), 2),
+    )
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+import hashlib
+
+from fastapi import HTTPException
+from sqlmodel import Session, func, select
+
+from app.core.cache import TTLCache, invalidation_bus
+from app.core.config import settings
+from app.core.database import AsyncDBSession
+from app.models.category import Category, CategoryCreate, CategoryPaginatedResponse, CategoryResponse, CategoryUpdate
+from app.services import search
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    items: list[CategoryResponse]  # id 순
+    by_id: dict[int, CategoryResponse]
+    etag: str  # 내용 해시 (워커가 달라도 같은 값)
+
+
+class CategoryCache:
+    """전체 카테고리를 프로세스 메모리에 보관
+
+    카테고리가 바뀌면 invalidate() 가 버전을 올리고 다음 조회 때 다시 읽는다.
+    다른 워커의 변경은 무효화 버스(CACHE_BACKEND)로 전달되고, 놓치더라도 TTL 안에 반영된다.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._cache: TTLCache[CategorySnapshot] = TTLCache(
+            "categories", maxsize=1, ttl=settings.CATEGORY_CACHE_TTL_SECONDS
+        )
+        invalidation_bus.subscribe("category", self._on_invalidate)
+
+    def _on_invalidate(self, key: str) -> None:
+        self.version += 1
+        self._cache.clear()
+
+    def invalidate(self) -> None:
+        """카테고리 생성/수정/삭제 commit 후 호출"""
+        invalidation_bus.publish("category", "*")
+
+    def get(self) -> CategorySnapshot | None:
+        return self._cache.get("all")
+
+    def load(self, session: Session) -> CategorySnapshot:
+        snapshot = self.get()
+        if snapshot is not None:
+            return snapshot
+
+        version = self.version
+        items = [
+            CategoryResponse.model_validate(category)
+            for category in session.exec(select(Category).order_by(Category.id))
+        ]
+        digest = hashlib.sha1()
+        for item in items:
+            digest.update(item.model_dump_json().encode("utf-8"))
+        snapshot = CategorySnapshot(items=items, by_id={item.id: item for item in items}, etag=digest.hexdigest())
+        # 읽는 동안 다른 요청이 카테고리를 바꿨으면 저장하지 않음
+        if self.version == version:
+            self._cache.set("all", snapshot)
+        return snapshot
+
+
+category_cache = CategoryCache()
+
+
+async def current_categories(db: AsyncDBSession) -> CategorySnapshot:
+    """캐시에 있으면 DB 를 거치지 않음"""
+    return category_cache.get() or await db.run(category_cache.load)
+
+
+def page_categories(snapshot: CategorySnapshot, skip: int = 0, limit: int = 100) -> CategoryPaginatedResponse:
+    return CategoryPaginatedResponse(items=snapshot.items[skip:skip + limit], total=len(snapshot.items))
+
+
+def list_categories(
+    session: Session, skip: int = 0, limit: int = 100, search_query: str | None = None
+) -> CategoryPaginatedResponse:
+    # 검색이 없으면 캐시에서 바로
+    if not search_query:
+        return page_categories(category_cache.load(session), skip, limit)
+
+    # Base statement
+    statement = select(Category)
+
+    # Apply search filter
+    if search_query:
+        statement = statement.where(search.contains(Category.name, search_query))
+
+    # Get total count with filters
+    count_statement = select(func.count()).select_from(statement.subquery())
+    total = session.exec(count_statement).one()
+
+    # 검색 시 유사도 순 정렬 (PostgreSQL pg_trgm)
+    if search_query and search.supports_ranking(session):
+        statement = statement.order_by(search.relevance(Category.name, search_query).desc(), Category.name)
+
+    # Get paginated items
+    statement = statement.offset(skip).limit(limit)
+    categories = session.exec(statement).all()
+
+    return CategoryPaginatedResponse(items=categories, total=total)
+
+
+def get_existing_category(session: Session, category_id: int) -> Category:
+    category = session.get(Category, category_id)
+    if not category:
+        raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
+    return category
+
+
+def get_category(session: Session, category_id: int) -> CategoryResponse:
+    category = category_cache.load(session).by_id.get(category_id)
+    if category is None:
+        raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
+    return category
+
+
+def create_category(session: Session, category: CategoryCreate) -> CategoryResponse:
+    db_category = Category.model_validate(category)
+    session.add(db_category)
+    session.commit()
+    category_cache.invalidate()
+    session.refresh(db_category)
+    return CategoryResponse.model_validate(db_category)
+
+
+def update_category(session: Session, category_id: int, category: CategoryUpdate) -> CategoryResponse:
+    db_category = get_existing_category(session, category_id)
+
+    update_data = category.model_dump(exclude_unset=True)
+    db_category.sqlmodel_update(update_data)
+
+    session.commit()
+    category_cache.invalidate()
+    session.refresh(db_category)
+    return CategoryResponse.model_validate(db_category)
+
+
+def delete_category(session: Session, category_id: int) -> None:
+    db_category = get_existing_category(session, category_id)
+
+    session.delete(db_category)
+    session.commit()
+    category_cache.invalidate()
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import date, datetime, timezone
+import time
+from typing import Any, Callable
+import uuid
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.database import open_async_db, read_from_primary
+from app.models.dashboard import DashboardResponse, MonthSummary
+from app.models.rollup import MonthlyRollup
+from app.models.transaction import TotalStrategy, TransactionType
+from app.models.user import User, UserPublic
+from app.services import statistics, transactions
+from app.services.transactions import TransactionFilters
+
+
+def get_month_summary(session: Session, user_id: uuid.UUID, today: date | None = None) -> MonthSummary:
+    """이번 달 수입/지출/거래 수 - 월별 롤업에서 집계"""
+    today = today or datetime.now(timezone.utc).date()
+    statement = (
+        select(MonthlyRollup.transaction_type, func.sum(MonthlyRollup.total_amount), func.sum(MonthlyRollup.transaction_count))
+        .where(MonthlyRollup.user_id == user_id)
+        .where(MonthlyRollup.period == date(today.year, today.month, 1))
+        .group_by(MonthlyRollup.transaction_type)
+    )
+    totals = {TransactionType(transaction_type): (int(amount or 0), int(count or 0))
+              for transaction_type, amount, count in session.exec(statement)}
+    income, income_count = totals.get(TransactionType.INCOME, (0, 0))
+    expense, expense_count = totals.get(TransactionType.EXPENSE, (0, 0))
+    return MonthSummary(
+        year=today.year,
+        month=today.month,
+        income=income,
+        expense=expense,
+        net=income - expense,
+        transaction_count=income_count + expense_count,
+    )
+
+
+def get_recent_transactions(session: Session, user_id: uuid.UUID, limit: int) -> list:
+    page = transactions.list_transactions(
+        session, user_id, TransactionFilters(), limit=limit, total_strategy=TotalStrategy.NONE
+    )
+    return page.items
+
+
+async def build_dashboard(user: User, months: int = 6, top: int = 5, recent: int = 10) -> DashboardResponse:
+    """홈 화면 데이터를 한 번에 조회
+
+    섹션마다 세션을 따로 열어 동시에 실행한다 (DATABASE_ASYNC=False 이면 스레드풀에서 동시 실행).
+    방금 쓴 사용자가 아니면 복제본에서 읽는다.
+    """
+    read_only = not read_from_primary(str(user.id))
+    timings: dict[str, float] = {}
+
+    async def section(name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            async with open_async_db(read_only=read_only) as db:
+                return await db.run(fn, *args)
+        finally:
+            timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
+    started = time.perf_counter()
+    month, top_categories, trends, recent_transactions = await asyncio.gather(
+        section("month", get_month_summary, user.id),
+        section("top_categories", statistics.get_category_spending, user.id, top),
+        section("trends", statistics.get_monthly_trends, user.id, months),
+        section("recent_transactions", get_recent_transactions, user.id, recent),
+    )
+    timings["total"] = round((time.perf_counter() - started) * 1000, 2)
+
+    return DashboardResponse(
+        user=UserPublic.model_validate(user),
+        month=month,
+        top_categories=top_categories,
+        trends=trends,
+        recent_transactions=recent_transactions,
+        timings=timings,
+    )
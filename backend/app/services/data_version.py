@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+import hashlib
+from typing import Awaitable, Callable, Hashable
+import uuid
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import event, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session as ORMSession
+from sqlmodel import Session, select
+
+from app.core.cache import TTLCache, invalidation_bus, subscribe_cache
+from app.core.config import settings
+from app.core.database import AsyncDBSession
+from app.core.http_cache import etag_matches, make_etag, not_modified
+from app.models.data_version import UserDataVersion
+from app.services.categories import current_categories
+
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+# commit 후 무효화를 알릴 사용자 id (session.info)
+_PENDING_KEY = "data_version_users"
+CACHE_CONTROL = "private, no-cache"
+
+# user_id -> 버전 (다른 워커의 변경은 무효화 버스로, 놓치면 TTL 안에 반영)
+version_cache: TTLCache[int] = TTLCache(
+    "data_versions", maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.DATA_VERSION_CACHE_TTL_SECONDS
+)
+# (user_id, 버전, 경로, 쿼리 파라미터) -> JSON 본문. 버전이 키에 있으므로 오래된 항목은 쓰이지 않음
+response_cache: TTLCache[bytes] = TTLCache(
+    "responses", maxsize=settings.RESPONSE_CACHE_MAX_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+subscribe_cache("data_version", version_cache)
+subscribe_cache("data_version", response_cache)
+
+
+def bump_data_version(session: Session, user_id: uuid.UUID) -> None:
+    """거래를 바꾸는 쓰기에서 commit 전에 호출 (같은 DB 트랜잭션에서 버전 + 1)"""
+    dialect_insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is not None:
+        statement = dialect_insert(UserDataVersion).values(user_id=user_id, version=1)
+        session.exec(statement.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={"version": UserDataVersion.version + 1},
+        ))
+    else:
+        result = session.exec(
+            update(UserDataVersion)
+            .where(UserDataVersion.user_id == user_id)
+            .values(version=UserDataVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            session.add(UserDataVersion(user_id=user_id, version=1))
+    session.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+
+@event.listens_for(ORMSession, "after_commit")
+def _publish_data_versions(session: ORMSession) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidation_bus.publish("data_version", str(user_id))
+
+
+@event.listens_for(ORMSession, "after_rollback")
+def _discard_data_versions(session: ORMSession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def get_data_version(session: Session, user_id: uuid.UUID) -> int:
+    version = session.exec(select(UserDataVersion.version).where(UserDataVersion.user_id == user_id)).first()
+    return version or 0
+
+
+def cached_data_version(session: Session, user_id: uuid.UUID) -> int:
+    """서비스 함수(동기)용 current_data_version"""
+    key = str(user_id)
+    version = version_cache.get(key)
+    if version is None:
+        generation = version_cache.begin_fill(key, tags=[key])
+        version = get_data_version(session, user_id)
+        version_cache.set(key, version, tags=[key], generation=generation)
+    return version
+
+
+async def current_data_version(db: AsyncDBSession, user_id: uuid.UUID) -> int:
+    # 읽는 사이에 다른 요청의 commit 으로 무효화되면 읽은 버전을 캐시에 넣지 않음 (begin_fill)
+    key = str(user_id)
+    version = version_cache.get(key)
+    if version is None:
+        generation = version_cache.begin_fill(key, tags=[key])
+        version = await db.run(get_data_version, user_id)
+        version_cache.set(key, version, tags=[key], generation=generation)
+    return version
+
+
+async def conditional_response(
+    request: Request,
+    db: AsyncDBSession,
+    user_id: uuid.UUID,
+    compute: Callable[[], Awaitable[object]],
+    extra: tuple[Hashable, ...] = (),
+) -> Response:
+    """사용자 데이터 버전 + 카테고리 스냅샷 + 요청(경로, 쿼리 파라미터)으로 ETag/응답 캐시 처리
+
+    If-None-Match 가 같으면 304, 서버 캐시에 있으면 DB 조회 없이 반환, 없으면 compute() 결과를 저장한다.
+    extra: 데이터 외에 결과를 바꾸는 값 (예: 오늘 날짜 기준 최근 N개월)
+    카테고리 이름은 응답에 들어가지만 사용자 데이터 버전을 올리지 않으므로 카테고리 ETag 도 키에 넣는다.
+    """
+    version = await current_data_version(db, user_id)
+    categories = await current_categories(db)
+    key = (str(user_id), version, categories.etag, request.url.path, tuple(sorted(request.query_params.multi_items())), extra)
+    etag = make_etag(hashlib.sha1(repr(key).encode("utf-8")).hexdigest())
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control=CACHE_CONTROL)
+
+    body = response_cache.get(key)
+    if body is None:
+        body = JSONResponse(jsonable_encoder(await compute())).body
+        response_cache.set(key, body, tags=[str(user_id)])
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+def today_key() -> tuple[Hashable, ...]:
+    """오늘 날짜가 바뀌면 결과가 달라지는 조회용 extra 값"""
+    return (datetime.now(timezone.utc).date().isoformat(),)
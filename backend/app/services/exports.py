@@ -0,0 +1,112 @@
+import csv
+from datetime import datetime
+from enum import Enum
+import io
+import json
+from typing import AsyncIterator, Sequence
+import uuid
+import zlib
+
+from sqlalchemy import Result
+from sqlmodel import Session, select
+
+from app.core.database import open_async_db, read_from_primary
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.services.transactions import TransactionFilters
+
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+EXPORT_BATCH_SIZE = 1000
+
+# 가져오기(import)와 같은 컬럼 이름 -> 내보낸 파일을 그대로 다시 가져올 수 있음
+EXPORT_COLUMNS = (
+    "id",
+    "transaction_date",
+    "transaction_type",
+    "amount",
+    "category_id",
+    "category",
+    "payment_method",
+    "description",
+)
+
+
+def open_export_cursor(session: Session, user_id: uuid.UUID, filters: TransactionFilters) -> Result:
+    """서버 사이드 커서로 조회 (yield_per 만큼씩 DB 에서 가져옴)"""
+    statement = (
+        select(
+            Transaction.id,
+            Transaction.transaction_date,
+            Transaction.transaction_type,
+            Transaction.amount,
+            Transaction.category_id,
+            Category.name,
+            Transaction.payment_method,
+            Transaction.description,
+        )
+        .join(Category, Category.id == Transaction.category_id, isouter=True)
+        .where(*filters.clauses(user_id))
+        .order_by(Transaction.transaction_date, Transaction.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    return session.exec(statement)
+
+
+def fetch_batch(session: Session, result: Result, size: int = EXPORT_BATCH_SIZE) -> Sequence:
+    return result.fetchmany(size)
+
+
+def _value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _values(row) -> list:
+    return [_value(value) for value in row]
+
+
+def encode_csv(rows: Sequence, header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(_values(row) for row in rows)
+    return buffer.getvalue()
+
+
+def encode_ndjson(rows: Sequence) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, _values(row))), ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+async def stream_export(
+    user_id: uuid.UUID, filters: TransactionFilters, fmt: str, compress: bool = False
+) -> AsyncIterator[bytes]:
+    """거래내역을 EXPORT_BATCH_SIZE 행씩 인코딩해서 내보냄 (행 수와 관계없이 메모리 일정)
+
+    응답이 끝날 때까지 요청 세션이 아닌 별도 세션을 사용한다 (방금 쓴 사용자가 아니면 복제본).
+    """
+    # gzip 헤더 포함 (wbits=31)
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    def encode(text: str) -> bytes:
+        data = text.encode("utf-8")
+        return compressor.compress(data) if compressor else data
+
+    async with open_async_db(read_only=not read_from_primary(str(user_id))) as db:
+        result = await db.run(open_export_cursor, user_id, filters)
+        if fmt == "csv":
+            # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+            yield encode("\ufeff" + encode_csv([], header=True))
+        while rows := await db.run(fetch_batch, result):
+            chunk = encode(encode_csv(rows) if fmt == "csv" else encode_ndjson(rows))
+            if chunk:
+                yield chunk
+
+    if compressor:
+        yield compressor.flush()
@@ -0,0 +1,315 @@
+import codecs
+import csv
+from collections import Counter
+from enum import Enum
+import hashlib
+import io
+import json
+from typing import BinaryIO, Iterator, Optional
+import uuid
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import AsyncDBSession
+from app.models.base import utc_now
+from app.models.transaction import (
+    Transaction,
+    TransactionCreate,
+    TransactionImportError,
+    TransactionImportResult,
+)
+from app.services.categories import category_cache
+from app.services.data_version import bump_data_version
+from app.services.rollup import RollupDelta
+from app.services.transactions import validation_message
+
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+# COPY / INSERT 에 쓰는 컬럼 (id 는 DB 시퀀스)
+COPY_COLUMNS = (
+    "user_id",
+    "category_id",
+    "amount",
+    "description",
+    "transaction_type",
+    "payment_method",
+    "transaction_date",
+    "content_hash",
+    "created_at",
+    "updated_at",
+)
+
+
+def detect_format(requested: Optional[str], filename: Optional[str], content_type: Optional[str]) -> str:
+    """format 파라미터 -> 파일 확장자 -> Content-Type 순으로 결정 (기본 csv)"""
+    if requested:
+        if requested not in IMPORT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(IMPORT_FORMATS)}")
+        return requested
+    name = (filename or "").lower()
+    if name.endswith((".ndjson", ".jsonl", ".json")) or "json" in (content_type or ""):
+        return "ndjson"
+    return "csv"
+
+
+def category_lookup(session: Session) -> dict[str, int]:
+    """카테고리 이름(대소문자 무시) -> id (카테고리 캐시, 없으면 한 번의 쿼리로 전부 읽음)"""
+    return {category.name.casefold(): category.id for category in category_cache.load(session).items}
+
+
+def content_hash(transaction: TransactionCreate, occurrence: int, upload_id: str = "") -> str:
+    """중복 판별용 해시. 같은 파일 안의 똑같은 행은 occurrence(몇 번째인지)로 구분한다
+
+    날짜가 없는 행은 가져온 시각이 날짜로 들어가므로 날짜 대신 upload_id(업로드마다 다름)를 넣는다.
+    같은 파일 안에서는 재시도해도 같은 해시지만, 다른 업로드의 같은 행(매일 같은 금액의 커피 등)은 중복이 아니다.
+    """
+    dated = "transaction_date" in transaction.model_fields_set
+    parts = (
+        transaction.transaction_date.isoformat() if dated else f"upload:{upload_id}",
+        str(transaction.amount),
+        transaction.transaction_type.value,
+        str(transaction.category_id),
+        transaction.payment_method.value if transaction.payment_method else "",
+        transaction.description or "",
+        str(occurrence),
+    )
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return validation_message(error)
+    return str(error)
+
+
+class ImportParser:
+    """업로드 파일을 한 행씩 읽어 TransactionCreate 로 검증 (파일 전체를 메모리에 올리지 않음)
+
+    next_chunk 는 동기 함수라 스레드풀에서 호출한다.
+    """
+
+    def __init__(self, fileobj: BinaryIO, fmt: str, encoding: str, categories: dict[str, int]) -> None:
+        try:
+            codec = codecs.lookup(encoding)
+        except LookupError:
+            raise HTTPException(status_code=400, detail=f"Unknown encoding: {encoding}")
+        self.encoding = encoding
+        # UTF-8 BOM 은 제거 (엑셀에서 저장한 CSV)
+        self.text = io.TextIOWrapper(
+            fileobj, encoding="utf-8-sig" if codec.name == "utf-8" else codec.name, newline=""
+        )
+        self.categories = categories
+        self.category_ids = set(categories.values())
+        self.rows = self._csv_rows() if fmt == "csv" else self._ndjson_rows()
+        self.row_number = 0
+        self.occurrences: Counter[str] = Counter()
+        # 날짜가 없는 행의 해시를 이 업로드 안으로 한정
+        self.upload_id = uuid.uuid4().hex
+        self.failed = 0
+        self.errors: list[TransactionImportError] = []
+
+    def _csv_rows(self) -> Iterator[dict]:
+        reader = csv.DictReader(self.text)
+        columns = {(name or "").strip().lower() for name in reader.fieldnames or []}
+        missing = {"amount", "transaction_type"} - columns
+        if missing or not columns & {"category_id", "category"}:
+            raise HTTPException(
+                status_code=400,
+                detail="CSV header must include amount, transaction_type and category_id or category",
+            )
+        for row in reader:
+            # DictReader 는 남는 값을 None 키에 모음
+            yield {key.strip().lower(): value for key, value in row.items() if key}
+
+    def _ndjson_rows(self) -> Iterator[dict]:
+        for line in self.text:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ValueError(f"Invalid JSON: {e.msg}")
+                continue
+            yield row if isinstance(row, dict) else ValueError("Each line must be a JSON object")
+
+    def _validate(self, raw: dict) -> TransactionCreate:
+        data = {
+            key: value.strip() if isinstance(value, str) else value
+            for key, value in raw.items()
+        }
+        data = {key: value for key, value in data.items() if value not in ("", None)}
+
+        # 카테고리는 id 대신 이름(category)으로도 지정 가능
+        name = data.pop("category", None)
+        if "category_id" not in data and name is not None:
+            category_id = self.categories.get(str(name).casefold())
+            if category_id is None:
+                raise ValueError(f"Unknown category: {name}")
+            data["category_id"] = category_id
+
+        transaction = TransactionCreate.model_validate(data)
+        if transaction.category_id not in self.category_ids:
+            raise ValueError(f"Unknown category_id: {transaction.category_id}")
+        return transaction
+
+    def _fail(self, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(TransactionImportError(row=self.row_number, message=message))
+
+    def next_chunk(self, size: int) -> Optional[list[dict]]:
+        """검증을 통과한 행을 최대 size 개 반환. 파일 끝이면 None"""
+        chunk: list[dict] = []
+        while len(chunk) < size:
+            try:
+                raw = next(self.rows, None)
+            except UnicodeDecodeError:
+                raise HTTPException(status_code=400, detail=f"File is not valid {self.encoding}")
+            except csv.Error as e:
+                raise HTTPException(status_code=400, detail=f"Invalid CSV after row {self.row_number}: {e}")
+            if raw is None:
+                break
+
+            self.row_number += 1
+            if isinstance(raw, Exception):
+                self._fail(str(raw))
+                continue
+            try:
+                transaction = self._validate(raw)
+            except (ValidationError, ValueError) as e:
+                self._fail(_error_message(e))
+                continue
+
+            row = transaction.model_dump()
+            base_hash = content_hash(transaction, 0, self.upload_id)
+            row["content_hash"] = content_hash(transaction, self.occurrences[base_hash], self.upload_id)
+            self.occurrences[base_hash] += 1
+            chunk.append(row)
+
+        if not chunk:
+            self.text.detach()
+            return None
+        return chunk
+
+
+def _copy_value(value):
+    if isinstance(value, Enum):
+        # DB enum 라벨은 이름(INCOME/EXPENSE, CASH/CARD)
+        return value.name
+    return value
+
+
+def _copy_psycopg2(dbapi_connection, rows: list[dict]) -> None:
+    import psycopg2
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        # 빈 칸(따옴표 없음)은 NULL
+        writer.writerow([_copy_value(row[column]) for column in COPY_COLUMNS])
+    buffer.seek(0)
+    statement = f"COPY {Transaction.__tablename__} ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+    with dbapi_connection.cursor() as cursor:
+        try:
+            cursor.copy_expert(statement, buffer)
+        except psycopg2.IntegrityError as e:
+            # 드라이버를 직접 사용하므로 SQLAlchemy 예외로 바꿔서 insert_chunk 의 중복 재시도가 처리하게 함
+            raise IntegrityError(statement, None, e) from e
+
+
+def _copy_asyncpg(dbapi_connection, rows: list[dict]) -> None:
+    import asyncpg
+
+    records = [tuple(_copy_value(row[column]) for column in COPY_COLUMNS) for row in rows]
+    try:
+        dbapi_connection.run_async(
+            lambda connection: connection.copy_records_to_table(
+                Transaction.__tablename__, records=records, columns=list(COPY_COLUMNS)
+            )
+        )
+    except asyncpg.IntegrityConstraintViolationError as e:
+        raise IntegrityError(f"COPY {Transaction.__tablename__}", None, e) from e
+
+
+_COPY_DRIVERS = {"psycopg2": _copy_psycopg2, "asyncpg": _copy_asyncpg}
+
+
+def insert_chunk(session: Session, user_id: uuid.UUID, rows: list[dict], retry: bool = True) -> int:
+    """이미 가져온 행(content_hash)을 빼고 한 번에 insert + 롤업 반영 후 commit. 새로 넣은 행 수 반환"""
+    hashes = [row["content_hash"] for row in rows]
+    existing = set(
+        session.exec(
+            select(Transaction.content_hash)
+            .where(Transaction.user_id == user_id)
+            .where(Transaction.content_hash.in_(hashes))
+        )
+    )
+    now = utc_now()
+    new_rows = [
+        {**row, "user_id": user_id, "created_at": now, "updated_at": now}
+        for row in rows
+        if row["content_hash"] not in existing
+    ]
+    if not new_rows:
+        session.rollback()
+        return 0
+
+    # 위 SELECT 로 DB 트랜잭션이 이미 시작됐으므로 COPY 도 같은 트랜잭션 안에서 실행됨
+    dialect = session.get_bind().dialect
+    copy = _COPY_DRIVERS.get(dialect.driver) if dialect.name == "postgresql" else None
+    try:
+        if copy is not None:
+            copy(session.connection().connection.dbapi_connection, new_rows)
+        else:
+            session.exec(insert(Transaction).values(new_rows))
+
+        rollup = RollupDelta()
+        rollup.add_rows(new_rows)
+        rollup.apply(session)
+        bump_data_version(session, user_id)
+        session.commit()
+    except IntegrityError:
+        # 같은 파일을 동시에 가져온 경우: 중복을 다시 걸러서 한 번 더 시도
+        session.rollback()
+        if not retry:
+            raise
+        return insert_chunk(session, user_id, rows, retry=False)
+    return len(new_rows)
+
+
+async def import_transactions(
+    db: AsyncDBSession,
+    user_id: uuid.UUID,
+    fileobj: BinaryIO,
+    fmt: str,
+    encoding: str = "utf-8",
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> TransactionImportResult:
+    """CSV/NDJSON 거래내역 가져오기
+
+    파싱/검증은 스레드풀, insert 는 chunk_size 행씩 DB 에서 처리하고 청크마다 commit 한다.
+    중간에 실패해도 같은 파일을 다시 올리면 이미 들어간 행은 중복으로 건너뛴다.
+    """
+    categories = await db.run(category_lookup)
+    parser = ImportParser(fileobj, fmt, encoding, categories)
+
+    imported = duplicates = 0
+    while (chunk := await run_in_threadpool(parser.next_chunk, chunk_size)) is not None:
+        inserted = await db.run(insert_chunk, user_id, chunk)
+        imported += inserted
+        duplicates += len(chunk) - inserted
+
+    return TransactionImportResult(
+        total_rows=parser.row_number,
+        imported=imported,
+        duplicates=duplicates,
+        failed=parser.failed,
+        errors=parser.errors,
+    )
@@ -0,0 +1,262 @@
+"""transactions 테이블 월별 범위 파티셔닝 (PostgreSQL 전용, 선택 사항)
+
+transaction_date 기준으로 한 달에 파티션 하나(transactions_p2026_10)를 두고,
+범위 밖의 행은 기본 파티션(transactions_default)에 들어간다.
+start_date/end_date 필터가 있는 조회는 해당 월 파티션만 읽는다 (partition pruning).
+
+    migrate_to_partitioned: 기존 테이블을 파티션 테이블로 바꿈 (한 번, 점검 시간에)
+    ensure_partitions: 앞으로 필요한 월 파티션 생성 + 기본 파티션에 쌓인 행을 월 파티션으로 옮김 (시작 시/cron)
+
+파티션 테이블의 기본 키와 유니크 인덱스에는 transaction_date 가 포함된다. (PostgreSQL 제약)
+content_hash 유니크 인덱스도 (user_id, transaction_date, content_hash) 가 되지만, 해시가 같은 행은 항상 날짜도 같으므로
+(app.services.imports.content_hash) 가져오기 중복 판별은 파티션 전과 같다.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import Session
+
+from app.core.logger import setup_logger
+from app.models.transaction import Transaction
+
+logger = setup_logger(__name__)
+
+TABLE = "transactions"
+PARTITION_KEY = "transaction_date"
+DEFAULT_PARTITION = f"{TABLE}_default"
+# 변환 전 테이블 (확인 후 drop_old 로 삭제)
+UNPARTITIONED_TABLE = f"{TABLE}_unpartitioned"
+# 변환 중 새 테이블 이름 (끝나면 transactions 로 바꿈)
+_NEW_TABLE = f"{TABLE}_partitioned"
+IS_PARTITIONED_SQL = "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"
+# 여러 워커가 동시에 시작해도 파티션 생성은 하나만
+_LOCK_ID = 0x7472616E  # "tran"
+
+
+@dataclass(frozen=True, order=True)
+class MonthPartition:
+    year: int
+    month: int
+
+    @classmethod
+    def of(cls, value: date | datetime) -> "MonthPartition":
+        return cls(value.year, value.month)
+
+    @property
+    def name(self) -> str:
+        return f"{TABLE}_p{self.year:04d}_{self.month:02d}"
+
+    @property
+    def start(self) -> date:
+        return date(self.year, self.month, 1)
+
+    @property
+    def end(self) -> date:
+        return date(self.year + self.month // 12, self.month % 12 + 1, 1)
+
+    def next(self) -> "MonthPartition":
+        return MonthPartition.of(self.end)
+
+
+def month_range(first: MonthPartition, last: MonthPartition) -> list[MonthPartition]:
+    months = []
+    month = first
+    while month <= last:
+        months.append(month)
+        month = month.next()
+    return months
+
+
+def _add_months(month: MonthPartition, count: int) -> MonthPartition:
+    index = month.year * 12 + month.month - 1 + count
+    return MonthPartition(index // 12, index % 12 + 1)
+
+
+def is_supported(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def is_partitioned(session: Session, table: str = TABLE) -> bool:
+    if not is_supported(session):
+        return False
+    return session.execute(text(IS_PARTITIONED_SQL), {"table": table}).scalar_one()
+
+
+def existing_partitions(session: Session, table: str = TABLE) -> set[str]:
+    return set(session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    ).scalars())
+
+
+def _create_partition(session: Session, month: MonthPartition, table: str = TABLE) -> None:
+    session.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {month.name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.start.isoformat()}') TO ('{month.end.isoformat()}')"
+    ))
+
+
+def _default_months(session: Session) -> list[MonthPartition]:
+    """기본 파티션에 들어가 있는 행의 월 목록"""
+    rows = session.execute(text(
+        f"SELECT DISTINCT date_trunc('month', {PARTITION_KEY}) FROM {DEFAULT_PARTITION}"
+    )).scalars()
+    return sorted(MonthPartition.of(value) for value in rows)
+
+
+def _split_default(session: Session, months: list[MonthPartition]) -> int:
+    """기본 파티션의 행을 새 월 파티션으로 옮김
+
+    기본 파티션에 그 범위의 행이 있으면 월 파티션을 만들 수 없어서, 기본 파티션을 잠깐 떼어 놓고 옮긴다.
+    """
+    session.execute(text(f"ALTER TABLE {TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+    moved = 0
+    for month in months:
+        _create_partition(session, month)
+        moved += session.execute(text(
+            f"WITH moved AS ("
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE {PARTITION_KEY} >= :start AND {PARTITION_KEY} < :end "
+            f"RETURNING *) INSERT INTO {TABLE} SELECT * FROM moved"
+        ), {"start": month.start, "end": month.end}).rowcount
+    session.execute(text(f"ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+    return moved
+
+
+def ensure_partitions(
+    session: Session, months_ahead: int, since: Optional[date] = None, today: Optional[date] = None
+) -> list[str]:
+    """이번 달(또는 since)부터 months_ahead 달 뒤까지의 파티션을 만들고 만든 파티션 이름 반환 (commit 은 호출하는 쪽)
+
+    기본 파티션에 들어간 행(범위 밖 날짜)이 있으면 그 달의 파티션을 만들어 옮긴다.
+    파티션 테이블이 아니면 아무것도 하지 않는다.
+    """
+    if not is_partitioned(session):
+        return []
+    if not session.execute(text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": _LOCK_ID}).scalar_one():
+        logger.info("Partition maintenance is already running elsewhere")
+        return []
+
+    current = MonthPartition.of(today or date.today())
+    first = MonthPartition.of(since) if since else current
+    wanted = set(month_range(first, _add_months(current, months_ahead)))
+    existing = existing_partitions(session)
+
+    stray = [month for month in _default_months(session) if month.name not in existing]
+    if stray:
+        moved = _split_default(session, stray)
+        logger.info("Moved %d rows from %s into %d new partitions", moved, DEFAULT_PARTITION, len(stray))
+
+    created = [month.name for month in stray]
+    for month in sorted(wanted):
+        if month.name not in existing and month not in stray:
+            _create_partition(session, month)
+            created.append(month.name)
+    return created
+
+
+def _constraints(session: Session, table: str, kind: str) -> list[tuple[str, str]]:
+    """(이름, 정의) 목록. kind: p(기본 키), f(외래 키)"""
+    return list(session.execute(
+        text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(:table) AND contype = :kind ORDER BY conname"
+        ),
+        {"table": table, "kind": kind},
+    ).tuples())
+
+
+def _index_names(session: Session, table: str) -> set[str]:
+    return set(session.execute(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": table}
+    ).scalars())
+
+
+def partitioned_index_ddl(session: Session) -> dict[str, str]:
+    """인덱스 이름 -> 파티션 테이블용 CREATE INDEX (모델 인덱스 기준, 유니크 인덱스에는 파티션 키를 추가)"""
+    dialect = session.get_bind().dialect
+    statements = {}
+    for index in Transaction.__table__.indexes:
+        columns = [column.name for column in index.columns]
+        if index.unique and PARTITION_KEY not in columns:
+            # (user_id, transaction_date, content_hash) 로도 가져오기 중복이 막힘: 날짜가 있는 행은 해시에 날짜가,
+            # 날짜가 없는 행은 업로드 id 가 들어가므로 해시가 같으면 같은 업로드의 같은 행(같은 transaction_date)
+            columns.insert(1, PARTITION_KEY)
+            statements[index.name] = f"CREATE UNIQUE INDEX {index.name} ON {TABLE} ({', '.join(columns)})"
+        else:
+            statements[index.name] = str(CreateIndex(index).compile(dialect=dialect))
+    return statements
+
+
+def migrate_to_partitioned(session: Session, months_ahead: int, drop_old: bool = False) -> int:
+    """기존 transactions 를 월별 파티션 테이블로 바꾸고 옮긴 행 수 반환 (한 트랜잭션, commit 은 호출하는 쪽)
+
+    복사하는 동안 쓰기는 막히고(SHARE 잠금) 읽기는 계속된다. 이름을 바꾸는 마지막 단계만 읽기도 잠깐 막는다.
+    변환 전 테이블은 transactions_unpartitioned 로 남겨 두고, drop_old 면 삭제한다.
+    """
+    if not is_supported(session):
+        raise ValueError("Partitioning requires PostgreSQL")
+    if is_partitioned(session):
+        return 0
+
+    session.execute(text(f"LOCK TABLE {TABLE} IN SHARE MODE"))
+    oldest, newest = session.execute(text(f"SELECT min({PARTITION_KEY}), max({PARTITION_KEY}) FROM {TABLE}")).one()
+    old_indexes = _index_names(session, TABLE)
+    [(primary_key, _)] = _constraints(session, TABLE, "p")
+    foreign_keys = _constraints(session, TABLE, "f")
+
+    # 컬럼/기본값(id 시퀀스 포함)/NOT NULL/CHECK 는 그대로, 기본 키는 (id, transaction_date)
+    session.execute(text(
+        f"CREATE TABLE {_NEW_TABLE} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE ({PARTITION_KEY})"
+    ))
+    session.execute(text(f"ALTER TABLE {_NEW_TABLE} ADD CONSTRAINT {_NEW_TABLE}_pkey PRIMARY KEY (id, {PARTITION_KEY})"))
+    session.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {_NEW_TABLE} DEFAULT"))
+    current = MonthPartition.of(date.today())
+    first = MonthPartition.of(oldest) if oldest else current
+    last = max(MonthPartition.of(newest) if newest else current, current)
+    for month in month_range(first, _add_months(last, months_ahead)):
+        _create_partition(session, month, _NEW_TABLE)
+
+    moved = session.execute(text(f"INSERT INTO {_NEW_TABLE} SELECT * FROM {TABLE}")).rowcount
+
+    # 이름 바꾸기: 기존 테이블/제약/인덱스 이름을 새 테이블이 이어받음
+    session.execute(text(f"ALTER TABLE {TABLE} RENAME TO {UNPARTITIONED_TABLE}"))
+    session.execute(text(f"ALTER TABLE {UNPARTITIONED_TABLE} RENAME CONSTRAINT {primary_key} TO {UNPARTITIONED_TABLE}_pkey"))
+    for name, _ in foreign_keys:
+        session.execute(text(f"ALTER TABLE {UNPARTITIONED_TABLE} DROP CONSTRAINT {name}"))
+    for index in Transaction.__table__.indexes:
+        if index.name in old_indexes:
+            session.execute(text(f"DROP INDEX {index.name}"))
+
+    session.execute(text(f"ALTER TABLE {_NEW_TABLE} RENAME TO {TABLE}"))
+    session.execute(text(f"ALTER TABLE {TABLE} RENAME CONSTRAINT {_NEW_TABLE}_pkey TO {primary_key}"))
+    sequence = session.execute(text(f"SELECT pg_get_serial_sequence('{UNPARTITIONED_TABLE}', 'id')")).scalar_one()
+    if sequence:
+        session.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE}.id"))
+    for name, definition in foreign_keys:
+        session.execute(text(f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}"))
+    for name, ddl in partitioned_index_ddl(session).items():
+        # pg_trgm 인덱스처럼 기존 테이블에 없던 인덱스는 만들지 않음
+        if name in old_indexes:
+            session.execute(text(ddl))
+
+    if drop_old:
+        session.execute(text(f"DROP TABLE {UNPARTITIONED_TABLE}"))
+    session.execute(text(f"ANALYZE {TABLE}"))
+    return moved
+
+
+def maintain_partitions(session: Session, months_ahead: int) -> list[str]:
+    """앱 시작 시 호출: 파티션 테이블이면 앞으로 필요한 파티션을 만들고 commit"""
+    created = ensure_partitions(session, months_ahead)
+    session.commit()
+    if created:
+        logger.info("Created transaction partitions: %s", ", ".join(created))
+    return created
@@ -0,0 +1,191 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterable
+import uuid
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, func, select
+
+from app.models.rollup import MonthlyRollup, RollupMismatch
+from app.models.transaction import Transaction, TransactionType
+from app.services.statistics import month_period
+
+RollupKey = tuple[uuid.UUID, date, int, TransactionType]
+
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+_KEY_COLUMNS = ("user_id", "period", "category_id", "transaction_type")
+
+
+def rollup_key(transaction: Transaction) -> RollupKey:
+    return _bucket_key(
+        transaction.user_id,
+        transaction.transaction_date,
+        transaction.category_id,
+        transaction.transaction_type,
+    )
+
+
+def _bucket_key(
+    user_id: uuid.UUID, transaction_date: datetime, category_id: int, transaction_type: TransactionType
+) -> RollupKey:
+    return (
+        user_id,
+        date(transaction_date.year, transaction_date.month, 1),
+        category_id,
+        TransactionType(transaction_type),
+    )
+
+
+class RollupDelta:
+    """거래 변경분을 롤업 키 단위로 모았다가 한 번에 반영
+
+    사용법:
+        delta = RollupDelta()
+        delta.remove(db_transaction)      # 변경 전 값
+        db_transaction.sqlmodel_update(update_data)
+        delta.add(db_transaction)         # 변경 후 값
+        delta.apply(session)              # commit 전에 호출 -> 같은 DB 트랜잭션
+    """
+
+    def __init__(self) -> None:
+        self._changes: dict[RollupKey, list[int]] = defaultdict(lambda: [0, 0])
+
+    def add(self, transaction: Transaction) -> None:
+        self._record(rollup_key(transaction), transaction.amount, 1)
+
+    def remove(self, transaction: Transaction) -> None:
+        self._record(rollup_key(transaction), -transaction.amount, -1)
+
+    def add_rows(self, rows: Iterable[dict]) -> None:
+        """ORM 객체 없이 bulk insert 한 행(dict) 반영"""
+        for row in rows:
+            key = _bucket_key(row["user_id"], row["transaction_date"], row["category_id"], row["transaction_type"])
+            self._record(key, row["amount"], 1)
+
+    def _record(self, key: RollupKey, amount: int, count: int) -> None:
+        change = self._changes[key]
+        change[0] += amount
+        change[1] += count
+
+    def apply(self, session: Session) -> None:
+        rows = [
+            dict(zip(_KEY_COLUMNS, key), total_amount=amount, transaction_count=count)
+            for key, (amount, count) in self._changes.items()
+            if amount or count
+        ]
+        self._changes.clear()
+        if not rows:
+            return
+
+        _upsert(session, rows)
+
+        # 더 이상 거래가 없는 버킷 정리
+        session.exec(
+            delete(MonthlyRollup)
+            .where(MonthlyRollup.user_id.in_({row["user_id"] for row in rows}))
+            .where(MonthlyRollup.transaction_count <= 0)
+        )
+
+
+def _upsert(session: Session, rows: list[dict]) -> None:
+    dialect = session.get_bind().dialect.name
+    dialect_insert = _UPSERT_INSERTS.get(dialect)
+    if dialect_insert is None:
+        for row in rows:
+            _increment(session, row)
+        return
+
+    statement = dialect_insert(MonthlyRollup).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(_KEY_COLUMNS),
+        set_={
+            "total_amount": MonthlyRollup.total_amount + statement.excluded.total_amount,
+            "transaction_count": MonthlyRollup.transaction_count + statement.excluded.transaction_count,
+        },
+    )
+    session.exec(statement)
+
+
+def _increment(session: Session, row: dict) -> None:
+    """ON CONFLICT 를 지원하지 않는 DB 용"""
+    result = session.exec(
+        update(MonthlyRollup)
+        .where(*[getattr(MonthlyRollup, column) == row[column] for column in _KEY_COLUMNS])
+        .values(
+            total_amount=MonthlyRollup.total_amount + row["total_amount"],
+            transaction_count=MonthlyRollup.transaction_count + row["transaction_count"],
+        )
+    )
+    if result.rowcount == 0:
+        session.exec(insert(MonthlyRollup).values(row))
+
+
+def _expected_rollups(session: Session, user_id: uuid.UUID | None = None):
+    """transactions 원본에서 다시 계산한 롤업 (rebuild/verify 용)"""
+    period = month_period(session, Transaction.transaction_date).label("period")
+    statement = (
+        select(
+            Transaction.user_id,
+            period,
+            Transaction.category_id,
+            Transaction.transaction_type,
+            func.sum(Transaction.amount).label("total_amount"),
+            func.count(Transaction.id).label("transaction_count"),
+        )
+        .group_by(Transaction.user_id, period, Transaction.category_id, Transaction.transaction_type)
+    )
+    if user_id is not None:
+        statement = statement.where(Transaction.user_id == user_id)
+    return statement
+
+
+def rebuild_rollups(session: Session, user_id: uuid.UUID | None = None) -> int:
+    """롤업을 원본 거래로부터 다시 생성 (user_id 가 없으면 전체). commit 은 호출한 쪽에서"""
+    statement = delete(MonthlyRollup)
+    if user_id is not None:
+        statement = statement.where(MonthlyRollup.user_id == user_id)
+    session.exec(statement)
+
+    expected = _expected_rollups(session, user_id)
+    result = session.exec(
+        insert(MonthlyRollup).from_select(
+            [*_KEY_COLUMNS, "total_amount", "transaction_count"], expected
+        )
+    )
+    return result.rowcount
+
+
+def verify_rollups(session: Session, user_id: uuid.UUID | None = None) -> list[RollupMismatch]:
+    """롤업과 원본 거래 집계를 비교해 어긋난 버킷 목록 반환"""
+    expected = {
+        tuple(row[:4]): (int(row[4]), int(row[5]))
+        for row in session.exec(_expected_rollups(session, user_id))
+    }
+
+    statement = select(MonthlyRollup)
+    if user_id is not None:
+        statement = statement.where(MonthlyRollup.user_id == user_id)
+    actual = {
+        (rollup.user_id, rollup.period, rollup.category_id, rollup.transaction_type): (
+            rollup.total_amount,
+            rollup.transaction_count,
+        )
+        for rollup in session.exec(statement)
+    }
+
+    mismatches = []
+    for key in expected.keys() | actual.keys():
+        expected_amount, expected_count = expected.get(key, (0, 0))
+        actual_amount, actual_count = actual.get(key, (0, 0))
+        if (expected_amount, expected_count) != (actual_amount, actual_count):
+            mismatches.append(
+                RollupMismatch(
+                    **dict(zip(_KEY_COLUMNS, key)),
+                    expected_amount=expected_amount,
+                    expected_count=expected_count,
+                    actual_amount=actual_amount,
+                    actual_count=actual_count,
+                )
+            )
+    return mismatches
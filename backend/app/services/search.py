@@ -0,0 +1,31 @@
+from sqlalchemy import func
+from sqlmodel import Session
+
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(query: str) -> str:
+    """LIKE 패턴 문자(%, _)를 일반 문자로 취급"""
+    return (
+        query.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def contains(column, query: str):
+    """대소문자 무시 부분 문자열 검색 조건
+
+    PostgreSQL 에서는 pg_trgm GIN 인덱스(gin_trgm_ops)가 ILIKE '%...%' 를 처리하므로
+    조건은 그대로 두고 인덱스만 추가했다. SQLite 등은 기존처럼 전체 스캔.
+    """
+    return column.ilike(f"%{escape_like(query)}%", escape=LIKE_ESCAPE)
+
+
+def supports_ranking(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def relevance(column, query: str):
+    """검색어가 컬럼 안의 단어와 얼마나 비슷한지 (0~1, pg_trgm). supports_ranking 일 때만 사용"""
+    return func.word_similarity(query, column)
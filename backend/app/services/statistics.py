@@ -0,0 +1,106 @@
+from datetime import date, datetime, timezone
+import uuid
+
+from sqlalchemy import Date, cast, func, literal_column, type_coerce
+from sqlmodel import Session, select
+
+from app.models.category import Category
+from app.models.rollup import MonthlyRollup
+from app.models.transaction import CategorySpending, MonthlyTrend, TransactionType
+
+
+# 월별 통계에서 조회할 수 있는 최대 개월 수 (라우트의 months 상한)
+MAX_MONTHS = 120
+
+
+def month_bucket(session: Session, column):
+    """월 단위 버킷 표현식 (PostgreSQL: date_trunc, 그 외: strftime)"""
+    # 'month' 를 SQL 에 그대로 넣음: 바인드 파라미터로 넘기면 SELECT 와 GROUP BY 에 파라미터가 따로 생겨
+    # 파라미터를 서버로 보내는 드라이버에서는 SELECT 의 버킷이 GROUP BY 식과 다른 식으로 취급됨
+    if session.get_bind().dialect.name == "postgresql":
+        return func.date_trunc(literal_column("'month'"), column)
+    return func.strftime(literal_column("'%Y-%m-01'"), column)
+
+
+def month_period(session: Session, column):
+    """월 1일 날짜(date) 표현식 - 롤업의 period 컬럼과 같은 형태"""
+    bucket = month_bucket(session, column)
+    if session.get_bind().dialect.name == "postgresql":
+        return cast(bucket, Date)
+    # SQLite 는 date 를 'YYYY-MM-DD' 문자열로 저장하므로 타입만 지정
+    return type_coerce(bucket, Date)
+
+
+def bucket_to_month(value: date | datetime | str) -> tuple[int, int]:
+    """버킷 값 -> (year, month)"""
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return value.year, value.month
+
+
+def recent_months(months: int, today: date | None = None) -> list[tuple[int, int]]:
+    """이번 달을 포함한 최근 N개월 (오래된 순서)"""
+    today = today or datetime.now(timezone.utc).date()
+    index = today.year * 12 + today.month - 1
+    return [(i // 12, i % 12 + 1) for i in range(index - months + 1, index + 1)]
+
+
+def get_monthly_trends(
+    session: Session, user_id: uuid.UUID, months: int = 6, today: date | None = None
+) -> list[MonthlyTrend]:
+    """월별 수입/지출 추이 - 월별 롤업에서 읽고 빈 달은 0 으로 채움"""
+    if months <= 0:
+        return []
+
+    window = recent_months(months, today)
+    (first_year, first_month), (last_year, last_month) = window[0], window[-1]
+
+    statement = (
+        select(MonthlyRollup.period, MonthlyRollup.transaction_type, func.sum(MonthlyRollup.total_amount))
+        .where(MonthlyRollup.user_id == user_id)
+        .where(MonthlyRollup.period >= date(first_year, first_month, 1))
+        .where(MonthlyRollup.period <= date(last_year, last_month, 1))
+        .group_by(MonthlyRollup.period, MonthlyRollup.transaction_type)
+    )
+
+    totals: dict[tuple[int, int], dict[TransactionType, int]] = {}
+    for period, transaction_type, amount in session.exec(statement):
+        totals.setdefault(bucket_to_month(period), {})[TransactionType(transaction_type)] = int(amount or 0)
+
+    trends = []
+    for year, month in window:
+        data = totals.get((year, month), {})
+        income = data.get(TransactionType.INCOME, 0)
+        expense = data.get(TransactionType.EXPENSE, 0)
+        trends.append(MonthlyTrend(year=year, month=month, income=income, expense=expense, net=income - expense))
+
+    return trends
+
+
+def get_category_spending(session: Session, user_id: uuid.UUID, limit: int = 10) -> list[CategorySpending]:
+    """카테고리별 지출 합계 (상위 N개) - 월별 롤업에서 집계"""
+    total_amount = func.sum(MonthlyRollup.total_amount)
+    statement = (
+        select(
+            MonthlyRollup.category_id,
+            Category.name,
+            total_amount,
+            func.sum(MonthlyRollup.transaction_count),
+        )
+        .join(Category, MonthlyRollup.category_id == Category.id)
+        .where(MonthlyRollup.user_id == user_id)
+        .where(MonthlyRollup.transaction_type == TransactionType.EXPENSE)
+        .group_by(MonthlyRollup.category_id, Category.name)
+        .order_by(total_amount.desc())
+        .limit(limit)
+    )
+
+    return [
+        CategorySpending(
+            category_id=category_id,
+            category_name=category_name,
+            total_amount=int(amount),
+            transaction_count=int(count),
+        )
+        for category_id, category_name, amount, count in session.exec(statement)
+    ]
@@ -0,0 +1,249 @@
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
+import json
+from typing import AsyncIterator, Iterator, Optional, Sequence
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, Result, cast, func, literal, literal_column, null
+from sqlmodel import Session, select
+
+from app.core.database import open_async_db, read_from_primary
+from app.models.category import Category
+from app.models.transaction import TimeBucket, TimeSeriesGroupBy, Transaction, TransactionType
+from app.services.transactions import TransactionFilters
+
+# 한 번에 조회할 수 있는 버킷 수 (일별 약 5년)
+MAX_BUCKETS = 2000
+# 기간을 지정하지 않으면 end_date(기본 오늘)까지 이만큼의 버킷
+DEFAULT_BUCKETS = {TimeBucket.DAY: 30, TimeBucket.WEEK: 12, TimeBucket.MONTH: 12, TimeBucket.YEAR: 5}
+FETCH_SIZE = 1000
+
+# SQLite 버킷 식 (버킷 시작일 'YYYY-MM-DD' 문자열)
+_SQLITE_BUCKETS = {
+    TimeBucket.DAY: lambda column: func.date(column),
+    # 'weekday 0' 은 같은 주 일요일(또는 그날)로 이동 -> 6일 전이 월요일
+    TimeBucket.WEEK: lambda column: func.date(column, literal_column("'weekday 0'"), literal_column("'-6 days'")),
+    TimeBucket.MONTH: lambda column: func.strftime(literal_column("'%Y-%m-01'"), column),
+    TimeBucket.YEAR: lambda column: func.strftime(literal_column("'%Y-01-01'"), column),
+}
+
+
+def truncate(value: date, interval: TimeBucket) -> date:
+    """value 가 속한 버킷의 시작일 (PostgreSQL date_trunc 와 같음: 주는 월요일)"""
+    if interval == TimeBucket.WEEK:
+        return value - timedelta(days=value.weekday())
+    if interval == TimeBucket.MONTH:
+        return value.replace(day=1)
+    if interval == TimeBucket.YEAR:
+        return value.replace(month=1, day=1)
+    return value
+
+
+def shift(value: date, interval: TimeBucket, count: int) -> date:
+    """버킷 시작일에서 count 개 버킷 이동"""
+    if interval == TimeBucket.DAY:
+        return value + timedelta(days=count)
+    if interval == TimeBucket.WEEK:
+        return value + timedelta(weeks=count)
+    months = count * (12 if interval == TimeBucket.YEAR else 1)
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def bucket_range(filters: TransactionFilters, interval: TimeBucket) -> tuple[date, date, int]:
+    """(첫 버킷, 마지막 버킷, 버킷 수). 기간이 없으면 DEFAULT_BUCKETS, MAX_BUCKETS 를 넘으면 400"""
+    end = filters.end_date.date() if filters.end_date else datetime.now(timezone.utc).date()
+    last = truncate(end, interval)
+    if filters.start_date:
+        first = truncate(filters.start_date.date(), interval)
+    else:
+        first = shift(last, interval, -(DEFAULT_BUCKETS[interval] - 1))
+    if first > last:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+
+    if interval == TimeBucket.DAY:
+        count = (last - first).days + 1
+    elif interval == TimeBucket.WEEK:
+        count = (last - first).days // 7 + 1
+    else:
+        months = (last.year - first.year) * 12 + last.month - first.month
+        count = (months // 12 if interval == TimeBucket.YEAR else months) + 1
+    if count > MAX_BUCKETS:
+        raise HTTPException(
+            status_code=400, detail=f"Too many {interval.value} buckets ({count}), narrow the date range (max {MAX_BUCKETS})"
+        )
+    return first, last, count
+
+
+def _bucket(session: Session, interval: TimeBucket, column):
+    if session.get_bind().dialect.name == "postgresql":
+        # 단위를 SQL 에 그대로 넣음: 바인드 파라미터로 넘기면 SELECT 와 GROUP BY 에 파라미터가 따로 생겨
+        # 파라미터를 서버로 보내는 드라이버에서는 SELECT 의 버킷이 GROUP BY 식과 다른 식으로 취급됨
+        return func.date_trunc(literal_column(f"'{interval.value}'"), column)
+    return _SQLITE_BUCKETS[interval](column)
+
+
+def open_timeseries_cursor(
+    session: Session,
+    user_id: uuid.UUID,
+    filters: TransactionFilters,
+    interval: TimeBucket,
+    group_by: TimeSeriesGroupBy,
+    first: date,
+    last: date,
+) -> Result:
+    """(버킷, 그룹 키, 그룹 이름, 거래 유형, 합계, 건수) 를 버킷 순서로 조회
+
+    (user_id, transaction_date) 인덱스 범위에서 DB 가 집계하므로 결과 행 수는 버킷 x 그룹 x 유형 이하.
+    PostgreSQL 은 generate_series 로 거래가 없는 버킷도 (거래 유형 NULL 인 행으로) 채운다.
+    """
+    bucket = _bucket(session, interval, Transaction.transaction_date).label("period")
+    # (SELECT 할 그룹 컬럼, GROUP BY 할 컬럼)
+    if group_by == TimeSeriesGroupBy.CATEGORY:
+        group_columns = (Transaction.category_id.label("group_key"), Category.name.label("group_name"))
+        group_keys = [Transaction.category_id, Category.name]
+    elif group_by == TimeSeriesGroupBy.PAYMENT_METHOD:
+        group_columns = (Transaction.payment_method.label("group_key"), null().label("group_name"))
+        group_keys = [Transaction.payment_method]
+    else:
+        group_columns = (null().label("group_key"), null().label("group_name"))
+        group_keys = []
+
+    totals = select(
+        bucket,
+        *group_columns,
+        Transaction.transaction_type,
+        func.sum(Transaction.amount).label("amount"),
+        func.count().label("count"),
+    ).where(*filters.clauses(user_id))
+    if group_by == TimeSeriesGroupBy.CATEGORY:
+        totals = totals.join(Category, Category.id == Transaction.category_id)
+    totals = totals.group_by(bucket, *group_keys, Transaction.transaction_type)
+
+    if session.get_bind().dialect.name == "postgresql":
+        step = literal_column(f"interval '1 {interval.value}'")
+        series = select(
+            func.generate_series(
+                cast(literal(datetime.combine(first, datetime.min.time())), DateTime()),
+                cast(literal(datetime.combine(last, datetime.min.time())), DateTime()),
+                step,
+            ).label("period")
+        ).subquery("buckets")
+        totals = totals.subquery("totals")
+        statement = (
+            select(
+                series.c.period, totals.c.group_key, totals.c.group_name,
+                totals.c.transaction_type, totals.c.amount, totals.c.count,
+            )
+            .select_from(series.outerjoin(totals, totals.c.period == series.c.period))
+            .order_by(series.c.period)
+        )
+    else:
+        # SQLite: 빈 버킷은 TimeSeriesWriter 가 채움
+        statement = totals.order_by(bucket)
+    return session.exec(statement.execution_options(yield_per=FETCH_SIZE))
+
+
+def fetch_rows(session: Session, result: Result, size: int = FETCH_SIZE) -> Sequence:
+    return result.fetchmany(size)
+
+
+def _to_date(value: date | datetime | str) -> date:
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _totals() -> dict:
+    return {"income": 0, "expense": 0, "net": 0, "count": 0}
+
+
+def _add(totals: dict, transaction_type: TransactionType, amount: int, count: int) -> None:
+    totals["income" if transaction_type == TransactionType.INCOME else "expense"] += amount
+    totals["net"] = totals["income"] - totals["expense"]
+    totals["count"] += count
+
+
+class TimeSeriesWriter:
+    """버킷 순서로 정렬된 행 -> 버킷별 JSON (빈 버킷은 0)
+
+    행을 순서대로 한 번만 보고 현재 버킷만 들고 있으므로 메모리는 그룹 수에만 비례한다.
+    """
+
+    def __init__(self, periods: Iterator[date], grouped: bool) -> None:
+        self._periods = periods
+        self._grouped = grouped
+        self._point: Optional[dict] = None
+        self._groups: dict = {}
+
+    def _flush(self) -> list[str]:
+        if self._point is None:
+            return []
+        point = self._point
+        if self._grouped:
+            point["groups"] = list(self._groups.values())
+        self._point, self._groups = None, {}
+        return [json.dumps(point, ensure_ascii=False)]
+
+    def _advance(self) -> list[str]:
+        encoded = self._flush()
+        self._point = {"period": next(self._periods).isoformat(), **_totals()}
+        return encoded
+
+    def feed(self, rows: Sequence) -> list[str]:
+        encoded: list[str] = []
+        for period, group_key, group_name, transaction_type, amount, count in rows:
+            period = _to_date(period).isoformat()
+            while self._point is None or self._point["period"] < period:
+                encoded += self._advance()
+            if transaction_type is None:
+                continue
+            transaction_type = TransactionType(transaction_type)
+            amount, count = int(amount or 0), int(count or 0)
+            _add(self._point, transaction_type, amount, count)
+            if self._grouped:
+                key = group_key.value if hasattr(group_key, "value") else group_key
+                group = self._groups.setdefault(key, {"key": key, "name": group_name, **_totals()})
+                _add(group, transaction_type, amount, count)
+        return encoded
+
+    def close(self) -> list[str]:
+        encoded = self._flush()
+        for period in self._periods:
+            point = {"period": period.isoformat(), **_totals()}
+            if self._grouped:
+                point["groups"] = []
+            encoded.append(json.dumps(point, ensure_ascii=False))
+        return encoded
+
+
+async def stream_timeseries(
+    user_id: uuid.UUID, filters: TransactionFilters, interval: TimeBucket, group_by: TimeSeriesGroupBy
+) -> AsyncIterator[bytes]:
+    """기간 버킷별 수입/지출 JSON 배열을 스트리밍 (응답 크기는 버킷 수에 비례)
+
+    bucket_range 로 기간을 먼저 검사한 뒤 호출한다. 응답이 끝날 때까지 별도 세션을 사용한다.
+    """
+    first, last, count = bucket_range(filters, interval)
+    # 기간을 지정하지 않았으면 기본 기간만 집계 (버킷 범위 밖의 행이 나오지 않도록)
+    filters = replace(
+        filters,
+        start_date=filters.start_date or datetime.combine(first, datetime.min.time()),
+        end_date=filters.end_date or datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    writer = TimeSeriesWriter(
+        (shift(first, interval, index) for index in range(count)), grouped=group_by != TimeSeriesGroupBy.NONE
+    )
+
+    separator = "["
+    async with open_async_db(read_only=not read_from_primary(str(user_id))) as db:
+        result = await db.run(open_timeseries_cursor, user_id, filters, interval, group_by, first, last)
+        while rows := await db.run(fetch_rows, result):
+            for point in writer.feed(rows):
+                yield (separator + point).encode("utf-8")
+                separator = ","
+    # 버킷이 최소 하나이므로 close 는 항상 하나 이상 반환
+    yield (separator + ",".join(writer.close()) + "]").encode("utf-8")
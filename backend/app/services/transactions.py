@@ -0,0 +1,435 @@
+from collections import defaultdict
+from dataclasses import astuple, dataclass
+from datetime import datetime
+from typing import Optional
+import uuid
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import delete, insert, tuple_, update
+from sqlmodel import Session, func, select
+
+from app.core.cache import TTLCache, subscribe_cache
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor, estimate_count
+from app.models.base import to_naive, utc_now
+from app.models.transaction import (
+    BatchOperationType,
+    PaymentMethod,
+    TotalStrategy,
+    Transaction,
+    TransactionBatchItemResult,
+    TransactionBatchRequest,
+    TransactionBatchResponse,
+    TransactionCreate,
+    TransactionPaginatedResponse,
+    TransactionResponse,
+    TransactionType,
+    TransactionUpdate,
+)
+from app.services import search
+from app.services.categories import category_cache
+from app.services.data_version import bump_data_version, cached_data_version
+from app.services.rollup import RollupDelta
+
+# 추정치가 이보다 작으면 count(*) 사용 (작은 결과는 count 도 싸고, 플래너 추정은 오차가 큼)
+ESTIMATE_EXACT_THRESHOLD = 1000
+
+# (user_id, 필터, 데이터 버전) -> 전체 개수. 버전이 키에 있으므로 쓰기 이후에는 다시 계산됨
+count_cache: TTLCache[int] = TTLCache(
+    "transaction_counts", maxsize=settings.RESPONSE_CACHE_MAX_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+subscribe_cache("data_version", count_cache)
+
+
+@dataclass
+class TransactionFilters:
+    """거래 목록 필터 (쿼리 파라미터로 받음: Annotated[TransactionFilters, Depends()])"""
+    transaction_type: Optional[TransactionType] = None
+    category_id: Optional[int] = None
+    payment_method: Optional[PaymentMethod] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    min_amount: Optional[int] = None
+    max_amount: Optional[int] = None
+    search_query: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.search_query = self.search_query.strip() if self.search_query else None
+        self.start_date = to_naive(self.start_date)
+        self.end_date = to_naive(self.end_date)
+
+    def clauses(self, user_id: uuid.UUID) -> list:
+        """WHERE 조건 동적 구성"""
+        filters = [Transaction.user_id == user_id]
+
+        if self.transaction_type:
+            filters.append(Transaction.transaction_type == self.transaction_type)
+
+        if self.category_id:
+            filters.append(Transaction.category_id == self.category_id)
+
+        if self.payment_method:
+            filters.append(Transaction.payment_method == self.payment_method)
+
+        if self.start_date:
+            filters.append(Transaction.transaction_date >= self.start_date)
+
+        if self.end_date:
+            # 하루의 마지막까지 포함
+            end_datetime = self.end_date.replace(hour=23, minute=59, second=59)
+            filters.append(Transaction.transaction_date <= end_datetime)
+
+        if self.min_amount is not None and self.min_amount > 0:
+            filters.append(Transaction.amount >= self.min_amount)
+
+        if self.max_amount is not None and self.max_amount > 0:
+            filters.append(Transaction.amount <= self.max_amount)
+
+        if self.search_query:
+            # 부분 문자열 검색 (대소문자 무시, PostgreSQL 은 trigram 인덱스 사용)
+            filters.append(search.contains(Transaction.description, self.search_query))
+
+        return filters
+
+
+def count_transactions(
+    session: Session, user_id: uuid.UUID, filters: TransactionFilters, strategy: TotalStrategy
+) -> tuple[Optional[int], Optional[TotalStrategy]]:
+    """필터 결과의 전체 개수와 실제로 사용한 방법 (none 이면 (None, None))"""
+    clauses = filters.clauses(user_id)
+    if strategy == TotalStrategy.NONE:
+        return None, None
+
+    if strategy == TotalStrategy.CACHED:
+        key = (str(user_id), astuple(filters), cached_data_version(session, user_id))
+        total = count_cache.get(key)
+        if total is None:
+            total = session.exec(select(func.count()).select_from(Transaction).where(*clauses)).one()
+            count_cache.set(key, total, tags=[str(user_id)])
+        return total, TotalStrategy.CACHED
+
+    if strategy == TotalStrategy.ESTIMATED:
+        estimate = estimate_count(session, select(Transaction.id).where(*clauses))
+        if estimate is not None and estimate >= ESTIMATE_EXACT_THRESHOLD:
+            return estimate, TotalStrategy.ESTIMATED
+        # 추정을 지원하지 않는 DB(SQLite 등)이거나 결과가 작으면 정확한 값
+
+    total = session.exec(select(func.count()).select_from(Transaction).where(*clauses)).one()
+    return total, TotalStrategy.EXACT
+
+
+def list_transactions(
+    session: Session,
+    user_id: uuid.UUID,
+    filters: TransactionFilters,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    sort_by: str = "date",
+    sort_order: str = "desc",
+    pagination: str = "offset",
+    cursor: Optional[str] = None,
+    total_strategy: TotalStrategy = TotalStrategy.EXACT,
+) -> TransactionPaginatedResponse:
+    """거래 목록 (offset 또는 커서 페이지네이션)
+
+    한 행을 더 읽어서 has_more 를 채우고, 마지막 페이지면 count 없이 total 을 계산한다.
+    """
+    clauses = filters.clauses(user_id)
+
+    # 정렬 기준 결정 (같은 값일 때는 id 로 순서 고정)
+    sort_order = "desc" if sort_order == "desc" else "asc"
+    if sort_by == "relevance" and filters.search_query and search.supports_ranking(session):
+        # 검색 유사도 순 (동점이면 최신순)
+        order_columns = (
+            search.relevance(Transaction.description, filters.search_query).desc(),
+            Transaction.transaction_date.desc(),
+            Transaction.id.desc(),
+        )
+    else:
+        # relevance 를 지원하지 않는 DB(SQLite 등)는 날짜순으로 대체
+        sort_by = "amount" if sort_by == "amount" else "date"
+        sort_column = Transaction.amount if sort_by == "amount" else Transaction.transaction_date
+        if sort_order == "desc":
+            order_columns = (sort_column.desc(), Transaction.id.desc())
+        else:
+            order_columns = (sort_column.asc(), Transaction.id.asc())
+
+    statement = select(Transaction).where(*clauses).order_by(*order_columns)
+
+    if pagination != "cursor":
+        transactions = session.exec(statement.offset(skip).limit(limit + 1)).all()
+        has_more = len(transactions) > limit
+        transactions = transactions[:limit]
+        if not has_more and (transactions or skip == 0):
+            total, used = skip + len(transactions), TotalStrategy.EXACT
+        else:
+            total, used = count_transactions(session, user_id, filters, total_strategy)
+        return TransactionPaginatedResponse(
+            items=to_responses(session, transactions), total=total, total_strategy=used, has_more=has_more
+        )
+
+    # 커서(keyset) 페이지네이션: 마지막 행의 (정렬값, id) 다음부터 조회
+    if sort_by == "relevance":
+        raise HTTPException(status_code=400, detail="Cursor pagination supports sort_by=date or amount")
+
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+            if (position.get("sort_by"), position.get("sort_order")) != (sort_by, sort_order):
+                raise ValueError("Cursor does not match sort_by/sort_order")
+            if sort_by == "date":
+                last_value = datetime.fromisoformat(position["value"])
+            else:
+                last_value = int(position["value"])
+            boundary = tuple_(sort_column, Transaction.id)
+            boundary_value = tuple_(last_value, int(position["id"]))
+        except (KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        statement = statement.where(boundary < boundary_value if sort_order == "desc" else boundary > boundary_value)
+
+    transactions = session.exec(statement.limit(limit + 1)).all()
+    has_more = len(transactions) > limit
+    total = used = None
+    if not cursor:
+        # 첫 페이지에서만 전체 개수 계산
+        if has_more:
+            total, used = count_transactions(session, user_id, filters, total_strategy)
+        else:
+            total, used = len(transactions), TotalStrategy.EXACT
+
+    next_cursor = None
+    if has_more:
+        transactions = transactions[:limit]
+        last = transactions[-1]
+        next_cursor = encode_cursor({
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+            "value": last.amount if sort_by == "amount" else last.transaction_date.isoformat(),
+            "id": last.id,
+        })
+
+    return TransactionPaginatedResponse(
+        items=to_responses(session, transactions),
+        total=total,
+        total_strategy=used,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
+
+
+def to_responses(session: Session, transactions: list[Transaction]) -> list[TransactionResponse]:
+    """카테고리는 관계(추가 쿼리) 대신 카테고리 캐시에서 채움"""
+    categories = category_cache.load(session).by_id
+    return [
+        TransactionResponse(**transaction.model_dump(), category=categories.get(transaction.category_id))
+        for transaction in transactions
+    ]
+
+
+def get_owned_transaction(session: Session, user_id: uuid.UUID, transaction_id: int) -> Transaction:
+    """본인 거래만 반환 (없으면 404, 다른 사용자 거래면 403)"""
+    db_transaction = session.get(Transaction, transaction_id)
+    if not db_transaction:
+        raise HTTPException(status_code=404, detail=f"Transaction {transaction_id} not found")
+    if db_transaction.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return db_transaction
+
+
+def get_transaction(session: Session, user_id: uuid.UUID, transaction_id: int) -> TransactionResponse:
+    db_transaction = get_owned_transaction(session, user_id, transaction_id)
+    return to_responses(session, [db_transaction])[0]
+
+
+def create_transaction(session: Session, user_id: uuid.UUID, transaction: TransactionCreate) -> TransactionResponse:
+    transaction_data = transaction.model_dump()
+    db_transaction = Transaction(**transaction_data, user_id=user_id)
+
+    session.add(db_transaction)
+    rollup = RollupDelta()
+    rollup.add(db_transaction)
+    rollup.apply(session)
+    bump_data_version(session, user_id)
+    session.commit()
+    session.refresh(db_transaction)
+    return to_responses(session, [db_transaction])[0]
+
+
+def update_transaction(
+    session: Session, user_id: uuid.UUID, transaction_id: int, transaction: TransactionUpdate
+) -> TransactionResponse:
+    db_transaction = get_owned_transaction(session, user_id, transaction_id)
+
+    update_data = transaction.model_dump(exclude_unset=True)
+    # 날짜/카테고리/유형/금액이 바뀌면 기존 버킷에서 빼고 새 버킷에 더함
+    rollup = RollupDelta()
+    rollup.remove(db_transaction)
+    db_transaction.sqlmodel_update(update_data)
+    rollup.add(db_transaction)
+    rollup.apply(session)
+    bump_data_version(session, user_id)
+
+    session.commit()
+    session.refresh(db_transaction)
+    return to_responses(session, [db_transaction])[0]
+
+
+def delete_transaction(session: Session, user_id: uuid.UUID, transaction_id: int) -> None:
+    db_transaction = get_owned_transaction(session, user_id, transaction_id)
+
+    rollup = RollupDelta()
+    rollup.remove(db_transaction)
+    rollup.apply(session)
+    session.delete(db_transaction)
+    bump_data_version(session, user_id)
+    session.commit()
+
+
+# 수정할 때 null 로 바꿀 수 없는 컬럼
+REQUIRED_FIELDS = ("amount", "transaction_date", "transaction_type", "category_id")
+BATCH_STATUS = {
+    BatchOperationType.CREATE: 201,
+    BatchOperationType.UPDATE: 200,
+    BatchOperationType.DELETE: 204,
+}
+
+
+def validation_message(error: ValidationError) -> str:
+    """ValidationError 를 한 줄 메시지로 (필드: 내용; ...)"""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}" if item["loc"] else item["msg"]
+        for item in error.errors()
+    )
+
+
+def apply_batch(session: Session, user_id: uuid.UUID, batch: TransactionBatchRequest) -> TransactionBatchResponse:
+    """여러 건의 생성/수정/삭제를 한 DB 트랜잭션으로 처리
+
+    소유권 확인은 쿼리 한 번, 삭제는 DELETE 한 번, 생성은 multi-row INSERT 한 번,
+    수정은 같은 값으로 바꾸는 것끼리 묶어서 UPDATE ... WHERE id IN 한 번씩 실행한다.
+    실패한 항목은 건너뛰고 결과에 상태 코드와 이유를 담는다 (atomic=True 면 전부 취소).
+    """
+    operations = batch.operations
+    results = [
+        TransactionBatchItemResult(index=index, op=operation.op, id=operation.id, status=0)
+        for index, operation in enumerate(operations)
+    ]
+
+    def fail(index: int, status: int, error: str) -> None:
+        results[index].status = status
+        results[index].error = error
+
+    # 대상 id 소유권 확인 (같은 id 는 한 번만)
+    targets: dict[int, int] = {}
+    for index, operation in enumerate(operations):
+        if operation.op == BatchOperationType.CREATE:
+            continue
+        if operation.id is None:
+            fail(index, 400, "id is required")
+        elif operation.id in targets:
+            fail(index, 400, f"Transaction {operation.id} appears more than once in the batch")
+        else:
+            targets[operation.id] = index
+
+    existing: dict[int, Transaction] = {}
+    if targets:
+        existing = {
+            transaction.id: transaction
+            for transaction in session.exec(select(Transaction).where(Transaction.id.in_(targets)))
+        }
+    for transaction_id, index in targets.items():
+        transaction = existing.get(transaction_id)
+        if transaction is None:
+            fail(index, 404, f"Transaction {transaction_id} not found")
+        elif transaction.user_id != user_id:
+            fail(index, 403, "Not authorized")
+
+    # 입력값 검증
+    changes: dict[int, dict] = {}
+    for index, operation in enumerate(operations):
+        if results[index].status or operation.op == BatchOperationType.DELETE:
+            continue
+        try:
+            if operation.op == BatchOperationType.CREATE:
+                changes[index] = TransactionCreate.model_validate(operation.data or {}).model_dump()
+            else:
+                data = TransactionUpdate.model_validate(operation.data or {}).model_dump(exclude_unset=True)
+                nulls = [field for field in REQUIRED_FIELDS if field in data and data[field] is None]
+                if nulls:
+                    raise ValueError(f"{', '.join(nulls)} cannot be null")
+                changes[index] = data
+        except ValidationError as e:
+            fail(index, 422, validation_message(e))
+        except ValueError as e:
+            fail(index, 422, str(e))
+
+    # 카테고리 존재 확인 (카테고리 캐시)
+    if any("category_id" in data for data in changes.values()):
+        known = category_cache.load(session).by_id
+        for index, data in list(changes.items()):
+            if "category_id" in data and data["category_id"] not in known:
+                fail(index, 400, f"Category {data['category_id']} not found")
+                del changes[index]
+
+    if batch.atomic and any(result.status for result in results):
+        for result in results:
+            if not result.status:
+                result.status = 424
+                result.error = "Not applied: another operation in the batch failed"
+        return TransactionBatchResponse(succeeded=0, failed=len(results), results=results)
+
+    pending = [index for index, result in enumerate(results) if not result.status]
+    rollup = RollupDelta()
+    now = utc_now()
+
+    delete_ids = [operations[index].id for index in pending if operations[index].op == BatchOperationType.DELETE]
+    if delete_ids:
+        for transaction_id in delete_ids:
+            rollup.remove(existing[transaction_id])
+        session.exec(delete(Transaction).where(Transaction.id.in_(delete_ids)))
+
+    # 같은 변경(예: 선택한 거래들의 카테고리 일괄 변경)은 UPDATE 한 번으로
+    update_groups: dict[tuple, list[int]] = defaultdict(list)
+    for index in pending:
+        if operations[index].op != BatchOperationType.UPDATE:
+            continue
+        transaction = existing[operations[index].id]
+        data = changes[index]
+        rollup.remove(transaction)
+        rollup.add_rows([{
+            "user_id": transaction.user_id,
+            "transaction_date": data.get("transaction_date", transaction.transaction_date),
+            "category_id": data.get("category_id", transaction.category_id),
+            "transaction_type": data.get("transaction_type", transaction.transaction_type),
+            "amount": data.get("amount", transaction.amount),
+        }])
+        if data:
+            update_groups[tuple(sorted(data.items()))].append(transaction.id)
+    for values, transaction_ids in update_groups.items():
+        session.exec(
+            update(Transaction).where(Transaction.id.in_(transaction_ids)).values({**dict(values), "updated_at": now})
+        )
+
+    create_indexes = [index for index in pending if operations[index].op == BatchOperationType.CREATE]
+    if create_indexes:
+        rows = [{**changes[index], "user_id": user_id, "created_at": now, "updated_at": now} for index in create_indexes]
+        new_ids = session.exec(
+            insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+            params=rows,
+        ).scalars().all()
+        rollup.add_rows(rows)
+        for index, transaction_id in zip(create_indexes, new_ids):
+            results[index].id = transaction_id
+
+    rollup.apply(session)
+    if pending:
+        bump_data_version(session, user_id)
+    session.commit()
+
+    for index in pending:
+        results[index].status = BATCH_STATUS[operations[index].op]
+    return TransactionBatchResponse(succeeded=len(pending), failed=len(results) - len(pending), results=results)
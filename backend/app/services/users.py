@@ -0,0 +1,66 @@
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.core.database import invalidate_user
+from app.models.data_version import UserDataVersion
+from app.models.rollup import MonthlyRollup
+from app.models.user import User, UserCreate, UserPublic, UserUpdate
+
+
+def get_user_by_email(session: Session, email: str) -> User | None:
+    return session.exec(select(User).where(User.email == email)).first()
+
+
+def get_existing_user(session: Session, user_id: uuid.UUID) -> User:
+    db_user = session.get(User, user_id)
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return db_user
+
+
+def list_users(session: Session, skip: int = 0, limit: int = 100) -> list[UserPublic]:
+    return [UserPublic.model_validate(user) for user in session.exec(select(User).offset(skip).limit(limit))]
+
+
+def create_user(session: Session, user_create: UserCreate, hashed_password: str) -> UserPublic:
+    """비밀번호 해시는 호출한 쪽에서 이벤트 루프 밖에서 계산해 넘김"""
+    db_obj = User.model_validate(user_create, update={"hashed_password": hashed_password})
+    session.add(db_obj)
+    session.commit()
+    session.refresh(db_obj)
+    return UserPublic.model_validate(db_obj)
+
+
+# 아래 함수들은 CurrentUser(캐시에서 만든 객체일 수 있음) 대신 id 로 다시 조회해서 수정하고,
+# commit 후 사용자 캐시를 무효화한다.
+
+def update_user(session: Session, user_id: uuid.UUID, user_in: UserUpdate) -> UserPublic:
+    db_user = get_existing_user(session, user_id)
+    user_data = user_in.model_dump(exclude_unset=True)
+    db_user.sqlmodel_update(user_data)
+    session.add(db_user)
+    session.commit()
+    invalidate_user(user_id)
+    session.refresh(db_user)
+    return UserPublic.model_validate(db_user)
+
+
+def set_password(session: Session, user_id: uuid.UUID, hashed_password: str) -> None:
+    db_user = get_existing_user(session, user_id)
+    db_user.hashed_password = hashed_password
+    session.add(db_user)
+    session.commit()
+    invalidate_user(user_id)
+
+
+def delete_user(session: Session, user_id: uuid.UUID) -> None:
+    db_user = get_existing_user(session, user_id)
+    # 데이터 버전 행은 거래를 모두 지워도 남고 롤업도 users 를 참조하므로 먼저 삭제 (FK)
+    session.exec(delete(MonthlyRollup).where(MonthlyRollup.user_id == user_id))
+    session.exec(delete(UserDataVersion).where(UserDataVersion.user_id == user_id))
+    session.delete(db_user)
+    session.commit()
+    invalidate_user(user_id)
@@ -0,0 +1,122 @@
+"""
+pytest 공통 설정
+
+임시 SQLite DB 에 테이블을 만들고 앱을 TestClient 로 호출한다. (PostgreSQL 없이 실행)
+
+사용법:
+    cd backend && pytest app/test
+"""
+import os
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+import tempfile
+from typing import Callable, ContextManager, Iterator, Optional
+
+# 앱 설정을 읽기 전에 테스트용 값 지정 (.env 나 환경 변수에 있으면 그 값을 사용)
+_db_path = Path(tempfile.mkdtemp()) / "test.db"
+os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{_db_path}"
+os.environ["QUERY_DEBUG"] = "true"
+for _name, _value in {
+    "ENVIRONMENT": "local",
+    "FRONTEND_HOST": "http://localhost:5173",
+    "PROJECT_NAME": "Budget Book",
+    "VERSION": "test",
+    "API_V1_STR": "/api/v1",
+    "DATABASE_PASSWORD": "test",
+    "SECRET_KEY": "test-secret-key",
+    "EMAIL_TEST_USER": "test@example.com",
+    "FIRST_SUPERUSER": "admin@example.com",
+    "FIRST_SUPERUSER_PASSWORD": "changethis",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel
+
+from app.core import security
+from app.core.cache import caches
+from app.core.config import settings
+from app.core.database import engine
+from app.core.query_log import QueryTracker, track_queries
+from app.main import app
+from app.models.category import Category
+from app.models.user import User
+
+# 실행 중인 서버/PostgreSQL 에 직접 연결하는 수동 스크립트
+collect_ignore = ["test_db.py", "test_signup.py"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database() -> Iterator[None]:
+    SQLModel.metadata.create_all(engine)
+    yield
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    # 테스트끼리 캐시된 응답/카운트를 공유하지 않도록
+    for cache in caches.values():
+        cache.clear()
+
+
+@pytest.fixture
+def client() -> TestClient:
+    # lifespan 을 실행하지 않음 (비밀번호 해시는 프로세스 풀 대신 스레드풀에서 실행)
+    return TestClient(app)
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def user(session: Session) -> User:
+    user = User(email=f"user-{os.urandom(4).hex()}@example.com", hashed_password=security.get_password_hash("password123"))
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def auth_headers(user: User) -> dict[str, str]:
+    token = security.create_access_token(user.id, timedelta(minutes=30))
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def category(session: Session) -> Category:
+    category = Category(name=f"category-{os.urandom(4).hex()}", description=None)
+    session.add(category)
+    session.commit()
+    session.refresh(category)
+    return category
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[QueryTracker]]:
+    """블록 안의 SQL 수가 예산을 넘거나 같은 쿼리가 반복(N+1)되면 실패
+
+    사용법:
+        def test_list(client, query_budget):
+            with query_budget(4):
+                client.get("/api/v1/transactions/", headers=...)
+    """
+
+    @contextmanager
+    def budget(max_queries: int, max_repeats: Optional[int] = None) -> Iterator[QueryTracker]:
+        max_repeats = settings.QUERY_REPEAT_THRESHOLD if max_repeats is None else max_repeats
+        with track_queries() as tracker:
+            yield tracker
+        assert tracker.count <= max_queries, (
+            f"{tracker.count} queries (budget {max_queries}):\n{tracker.report()}"
+        )
+        repeated = tracker.repeated(max_repeats)
+        assert not repeated, f"queries repeated more than {max_repeats} times (N+1?):\n{tracker.report()}"
+
+    return budget
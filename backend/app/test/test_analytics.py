@@ -0,0 +1,83 @@
+"""NumPy 분석 통계 (이동 평균, 전월 대비, 카테고리 비율, 월말 예상)"""
+from datetime import date
+
+import pytest
+
+from app.core.query_log import track_queries
+from app.services import analytics
+
+
+@pytest.fixture
+def history(client, auth_headers, category):
+    # 1월 1000, 2월 0, 3월 3000 (+ 수입 5000), 4월 10일까지 2000
+    rows = [
+        ("2026-01-15", "expense", 1000),
+        ("2026-03-01", "expense", 1000),
+        ("2026-03-20", "expense", 2000),
+        ("2026-03-25", "income", 5000),
+        ("2026-04-02", "expense", 500),
+        ("2026-04-10", "expense", 1500),
+    ]
+    response = client.post("/api/v1/transactions/batch", headers=auth_headers, json={"operations": [
+        {"op": "create", "data": {
+            "transaction_date": f"{day}T12:00:00", "transaction_type": transaction_type,
+            "amount": amount, "category_id": category.id,
+        }}
+        for day, transaction_type, amount in rows
+    ]})
+    assert response.status_code == 200
+
+
+def test_monthly_analytics(session, user, history):
+    result = analytics.get_monthly_analytics(session, user.id, months=3, window=3, today=date(2026, 4, 10))
+
+    assert [(item.month, item.income, item.expense) for item in result] == [(2, 0, 0), (3, 5000, 3000), (4, 0, 2000)]
+    assert [item.expense_rolling_average for item in result] == [333.33, 1333.33, 1666.67]
+    assert [item.expense_change for item in result] == [-1000, 3000, -1000]
+    assert [item.expense_change_ratio for item in result] == [-1.0, None, -0.3333]
+
+
+def test_category_share_and_projection(session, user, category, history):
+    [share] = analytics.get_category_share(session, user.id, months=2, today=date(2026, 4, 10))
+    assert (share.category_id, share.category_name, share.total_amount, share.transaction_count, share.share) == (
+        category.id, category.name, 5000, 4, 1.0
+    )
+
+    projection = analytics.get_spending_projection(session, user.id, today=date(2026, 4, 10))
+    assert (projection.spent_to_date, projection.projected_expense, projection.days_in_month) == (2000, 6000, 30)
+    assert projection.average_expense == pytest.approx(4000 / 3, abs=0.01)
+
+
+def test_arrays_are_cached_by_data_version(client, session, user, auth_headers, category, history):
+    analytics.get_monthly_analytics(session, user.id)
+    with track_queries() as tracker:
+        analytics.get_category_share(session, user.id)
+        analytics.get_spending_projection(session, user.id)
+    assert tracker.count == 0
+
+    client.post("/api/v1/transactions/", headers=auth_headers, json={
+        "amount": 100, "transaction_type": "expense", "category_id": category.id,
+    })
+    with track_queries() as tracker:
+        analytics.get_spending_projection(session, user.id)
+    # 데이터 버전 + 거래 배열 다시 읽기
+    assert tracker.count == 2
+
+
+def test_analytics_endpoints(client, auth_headers):
+    for path in ("monthly-analytics", "category-share", "projection"):
+        response = client.get(f"/api/v1/transactions/statistics/{path}", headers=auth_headers)
+        assert response.status_code == 200, path
+
+
+@pytest.mark.parametrize("params", [
+    {"months": 0}, {"months": 100_000}, {"window": 0}, {"window": 100_000}, {"months": 3, "window": 6},
+])
+def test_monthly_analytics_rejects_out_of_range_params(client, auth_headers, params):
+    response = client.get("/api/v1/transactions/statistics/monthly-analytics", headers=auth_headers, params=params)
+    assert response.status_code in (400, 422)
+
+
+def test_category_share_rejects_out_of_range_months(client, auth_headers):
+    response = client.get("/api/v1/transactions/statistics/category-share", headers=auth_headers, params={"months": 100_000})
+    assert response.status_code == 422
@@ -0,0 +1,88 @@
+"""거래 일괄 생성/수정/삭제 (/transactions/batch)"""
+from datetime import datetime
+import os
+
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.services.rollup import rebuild_rollups, verify_rollups
+
+
+def add_transaction(session, user, category, amount: int = 1000) -> Transaction:
+    transaction = Transaction(
+        amount=amount, transaction_type=TransactionType.EXPENSE, user_id=user.id, category_id=category.id,
+        transaction_date=datetime(2026, 3, 5), created_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 1),
+    )
+    session.add(transaction)
+    session.commit()
+    session.refresh(transaction)
+    return transaction
+
+
+def batch(client, headers, operations: list[dict], **options) -> dict:
+    response = client.post("/api/v1/transactions/batch", headers=headers, json={"operations": operations, **options})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_update_sets_updated_at(client, auth_headers, user, category, session):
+    transactions = [add_transaction(session, user, category) for _ in range(2)]
+    body = batch(client, auth_headers, [
+        {"op": "update", "id": transaction.id, "data": {"description": "bulk"}} for transaction in transactions
+    ])
+    assert body["succeeded"] == 2
+
+    session.expire_all()
+    for transaction in transactions:
+        transaction = session.get(Transaction, transaction.id)
+        assert transaction.description == "bulk"
+        assert transaction.updated_at > datetime(2026, 1, 1)
+        assert transaction.created_at == datetime(2026, 1, 1)
+
+
+def test_partial_failures_are_reported_per_item(client, auth_headers, user, category, session):
+    mine = add_transaction(session, user, category)
+    deleted = add_transaction(session, user, category, amount=300)
+    other = User(email=f"other-{os.urandom(4).hex()}@example.com", hashed_password="x")
+    session.add(other)
+    session.commit()
+    theirs = add_transaction(session, other, category)
+    mine_id, theirs_id, deleted_id = mine.id, theirs.id, deleted.id
+    # 직접 넣은 거래의 롤업
+    rebuild_rollups(session, user.id)
+    session.commit()
+
+    body = batch(client, auth_headers, [
+        {"op": "create", "data": {"amount": 500, "transaction_type": "expense", "category_id": category.id}},
+        {"op": "create", "data": {"amount": 500, "transaction_type": "expense", "category_id": 10**9}},
+        {"op": "create", "data": {"transaction_type": "expense"}},
+        {"op": "update", "id": mine_id, "data": {"amount": 2000}},
+        {"op": "update", "id": mine_id, "data": {"amount": 3000}},
+        {"op": "update", "id": theirs_id, "data": {"amount": 1}},
+        {"op": "update", "data": {"amount": 1}},
+        {"op": "delete", "id": 10**9},
+        {"op": "delete", "id": deleted_id},
+    ])
+    assert [result["status"] for result in body["results"]] == [201, 400, 422, 200, 400, 403, 400, 404, 204]
+    assert (body["succeeded"], body["failed"]) == (3, 6)
+    assert all(result["error"] for result in body["results"] if result["status"] >= 400)
+
+    # 성공한 항목만 반영
+    session.expire_all()
+    assert session.get(Transaction, body["results"][0]["id"]).amount == 500
+    assert session.get(Transaction, mine_id).amount == 2000
+    assert session.get(Transaction, theirs_id).amount == 1000
+    assert session.get(Transaction, deleted_id) is None
+    assert verify_rollups(session, user.id) == []
+
+
+def test_atomic_batch_applies_nothing_on_failure(client, auth_headers, user, category, session):
+    mine = add_transaction(session, user, category)
+    body = batch(client, auth_headers, [
+        {"op": "update", "id": mine.id, "data": {"amount": 2000}},
+        {"op": "delete", "id": 10**9},
+    ], atomic=True)
+    assert [result["status"] for result in body["results"]] == [424, 404]
+    assert (body["succeeded"], body["failed"]) == (0, 2)
+
+    session.expire_all()
+    assert session.get(Transaction, mine.id).amount == 1000
@@ -0,0 +1,52 @@
+"""카테고리 목록 ETag (카테고리 캐시 스냅샷 해시) 와 변경 시 무효화"""
+import os
+
+from app.services.categories import category_cache
+
+
+def list_categories(client, etag: str | None = None):
+    headers = {"If-None-Match": etag} if etag else {}
+    # 다른 테스트가 만든 카테고리도 남아 있으므로 전부 조회
+    return client.get("/api/v1/categories/", headers=headers, params={"limit": 100_000})
+
+
+def test_unchanged_categories_return_304(client, category):
+    response = list_categories(client)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = list_categories(client, etag)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    # 내용 해시라서 캐시를 다시 읽어도 (다른 워커에서도) 같은 ETag
+    category_cache.invalidate()
+    assert list_categories(client, etag).status_code == 304
+
+
+def test_create_update_delete_change_etag(client, category):
+    etag = list_categories(client).headers["ETag"]
+
+    def changed_items(previous_etag: str) -> tuple[str, dict]:
+        # 이전 ETag 로 조회하면 304 대신 바뀐 목록
+        response = list_categories(client, previous_etag)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != previous_etag
+        return response.headers["ETag"], {item["id"]: item for item in response.json()["items"]}
+
+    name = f"category-{os.urandom(4).hex()}"
+    response = client.post("/api/v1/categories/", json={"name": name, "description": None})
+    assert response.status_code == 201
+    category_id = response.json()["id"]
+    etag, items = changed_items(etag)
+    assert items[category_id]["name"] == name
+
+    response = client.patch(f"/api/v1/categories/{category_id}", json={"description": "changed"})
+    assert response.status_code == 200
+    etag, items = changed_items(etag)
+    assert items[category_id]["description"] == "changed"
+
+    response = client.delete(f"/api/v1/categories/{category_id}")
+    assert response.status_code == 204
+    etag, items = changed_items(etag)
+    assert category_id not in items
@@ -0,0 +1,38 @@
+"""홈 화면 대시보드 (섹션 동시 조회)"""
+from datetime import datetime, timezone
+
+import pytest
+
+
+def test_dashboard_returns_all_sections(client, auth_headers, user, category):
+    response = client.post("/api/v1/transactions/batch", headers=auth_headers, json={
+        "operations": [
+            {"op": "create", "data": {"amount": 3000, "transaction_type": "income", "category_id": category.id}},
+            {"op": "create", "data": {"amount": 1000, "transaction_type": "expense", "category_id": category.id}},
+            {"op": "create", "data": {"amount": 500, "transaction_type": "expense", "category_id": category.id}},
+        ],
+    })
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/dashboard/", headers=auth_headers, params={"months": 3, "recent": 2})
+    assert response.status_code == 200
+    body = response.json()
+
+    today = datetime.now(timezone.utc).date()
+    assert body["user"]["email"] == user.email
+    assert body["month"] == {
+        "year": today.year, "month": today.month, "income": 3000, "expense": 1500, "net": 1500, "transaction_count": 3,
+    }
+    assert body["top_categories"][0]["total_amount"] == 1500
+    assert len(body["trends"]) == 3 and body["trends"][-1]["net"] == 1500
+    assert [item["amount"] for item in body["recent_transactions"]] == [500, 1000]
+    assert set(body["timings"]) == {"month", "top_categories", "trends", "recent_transactions", "total"}
+
+
+def test_dashboard_requires_auth(client):
+    assert client.get("/api/v1/dashboard/").status_code == 401
+
+
+@pytest.mark.parametrize("params", [{"months": 100_000}, {"months": 0}, {"recent": 10_000}, {"top": 0}])
+def test_dashboard_rejects_out_of_range_params(client, auth_headers, params):
+    assert client.get("/api/v1/dashboard/", headers=auth_headers, params=params).status_code == 422
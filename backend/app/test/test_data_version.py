@@ -0,0 +1,87 @@
+"""데이터 버전 기반 ETag/응답 캐시 (conditional_response)"""
+from datetime import timedelta
+
+from sqlmodel import Session
+
+from app.core import security
+from app.core.database import engine
+from app.models.user import User
+from app.services import data_version
+
+
+def create_transaction(client, headers, category_id: int, amount: int = 1000) -> dict:
+    response = client.post("/api/v1/transactions/", headers=headers, json={
+        "amount": amount, "transaction_type": "expense", "category_id": category_id,
+    })
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_etag_returns_304_until_data_changes(client, auth_headers, category):
+    create_transaction(client, auth_headers, category.id)
+    response = client.get("/api/v1/transactions/", headers=auth_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v1/transactions/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    # 쿼리 파라미터가 다르면 다른 ETag
+    response = client.get("/api/v1/transactions/", headers={**auth_headers, "If-None-Match": etag}, params={"limit": 5})
+    assert response.status_code == 200
+
+    create_transaction(client, auth_headers, category.id, amount=2000)
+    response = client.get("/api/v1/transactions/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+
+
+def test_category_rename_invalidates_responses(client, auth_headers, category):
+    create_transaction(client, auth_headers, category.id)
+    paths = ("/api/v1/transactions/", "/api/v1/transactions/statistics/category-spending")
+    etags = {path: client.get(path, headers=auth_headers).headers["ETag"] for path in paths}
+
+    response = client.patch(f"/api/v1/categories/{category.id}", json={"name": f"{category.name}-renamed"})
+    assert response.status_code == 200
+
+    response = client.get(paths[0], headers={**auth_headers, "If-None-Match": etags[paths[0]]})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["category"]["name"] == f"{category.name}-renamed"
+    response = client.get(paths[1], headers={**auth_headers, "If-None-Match": etags[paths[1]]})
+    assert response.status_code == 200
+    assert response.json()[0]["category_name"] == f"{category.name}-renamed"
+
+
+def test_other_users_data_does_not_invalidate(client, auth_headers, category, session):
+    create_transaction(client, auth_headers, category.id)
+    etag = client.get("/api/v1/transactions/", headers=auth_headers).headers["ETag"]
+
+    other = User(email="other-etag@example.com", hashed_password=security.get_password_hash("password123"))
+    session.add(other)
+    session.commit()
+    other_headers = {"Authorization": f"Bearer {security.create_access_token(other.id, timedelta(minutes=5))}"}
+    create_transaction(client, other_headers, category.id)
+
+    response = client.get("/api/v1/transactions/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_bump_during_cache_fill_is_not_cached(user, session, monkeypatch):
+    read_version = data_version.get_data_version
+
+    def read_then_commit_elsewhere(read_session, user_id):
+        version = read_version(read_session, user_id)
+        read_session.rollback()
+        # 읽은 뒤 캐시에 넣기 전에 다른 요청의 쓰기가 commit 됨 (무효화 발행)
+        with Session(engine) as other:
+            data_version.bump_data_version(other, user_id)
+            other.commit()
+        return version
+
+    monkeypatch.setattr(data_version, "get_data_version", read_then_commit_elsewhere)
+    assert data_version.cached_data_version(session, user.id) == 0
+    monkeypatch.undo()
+
+    # 읽은 버전(0)이 캐시에 남았다면 TTL 동안 0 을 반환
+    assert data_version.cached_data_version(session, user.id) == 1
+    assert data_version.version_cache.get(str(user.id)) == 1
@@ -4,11 +4,12 @@
 import sys
 from pathlib import Path
 
-# 프로젝트 루트를 Python 경로에 추가
-sys.path.insert(0, str(Path(__file__).parent))
+# 프로젝트 루트(backend)를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parents[2]))
 
-from app.core.database import engine, SessionLocal
+from app.core.database import engine
 from sqlalchemy import text
+from sqlmodel import Session
 
 
 def test_connection():
@@ -21,13 +22,10 @@ def test_connection():
             print(f"테스트 쿼리 결과: {result.scalar()}")
             
         # 세션 테스트
-        db = SessionLocal()
-        try:
+        with Session(engine) as db:
             result = db.execute(text("SELECT version()"))
             version = result.scalar()
             print(f"✅ PostgreSQL 버전: {version}")
-        finally:
-            db.close()
             
         return True
         
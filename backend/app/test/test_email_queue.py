@@ -0,0 +1,114 @@
+"""메일 발송 대기열 (aiosmtpd 로 띄운 로컬 SMTP 서버로 발송)"""
+import asyncio
+from email import message_from_bytes, policy
+import socket
+
+from aiosmtpd.controller import Controller
+import pytest
+
+from app.core.config import settings
+from app.core.mailer import EmailQueue
+from app.utils import compile_email_template, render_email_template
+
+
+class SMTPHandler:
+    def __init__(self) -> None:
+        self.messages: list[tuple[list[str], str]] = []
+        self.connections = 0
+        # 이 횟수만큼 451 (일시적 오류) 로 거절
+        self.failures = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.failures:
+            self.failures -= 1
+            return "451 Try again later"
+        message = message_from_bytes(envelope.content, policy=policy.default)
+        self.messages.append((envelope.rcpt_tos, message.get_content()))
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    handler = SMTPHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(settings, "SMTP_PORT", port)
+    monkeypatch.setattr(settings, "SMTP_TLS", False)
+    monkeypatch.setattr(settings, "SMTP_SSL", False)
+    monkeypatch.setattr(settings, "SMTP_USER", None)
+    monkeypatch.setattr(settings, "EMAILS_FROM_EMAIL", "noreply@example.com")
+    yield handler
+    controller.stop()
+
+
+def run_queue(queue: EmailQueue, emails: list[str], wait: float = 0.0) -> None:
+    async def scenario():
+        await queue.start()
+        for email in emails:
+            await queue.send(email_to=email, subject="Hello", html_content="<p>hi</p>")
+        await queue.join()
+        if wait:
+            await asyncio.sleep(wait)
+            await queue.join()
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_queue_reuses_smtp_connection(smtp_server):
+    queue = EmailQueue(maxsize=10, max_retries=3, retry_backoff=0.01, smtp_idle=60)
+    run_queue(queue, [f"user{i}@example.com" for i in range(5)])
+
+    assert [rcpt for rcpt, _ in smtp_server.messages] == [[f"user{i}@example.com"] for i in range(5)]
+    assert smtp_server.connections == 1
+    assert queue.stats()["sent"] == 5
+
+
+def test_queue_retries_temporary_failures(smtp_server):
+    smtp_server.failures = 2
+    queue = EmailQueue(maxsize=10, max_retries=3, retry_backoff=0.01, smtp_idle=60)
+    run_queue(queue, ["retry@example.com"], wait=0.2)
+
+    assert len(smtp_server.messages) == 1
+    stats = queue.stats()
+    assert (stats["sent"], stats["retried"], stats["failed"]) == (1, 2, 0)
+
+
+def test_queue_gives_up_after_max_retries(smtp_server):
+    smtp_server.failures = 10
+    queue = EmailQueue(maxsize=10, max_retries=1, retry_backoff=0.01, smtp_idle=60)
+    run_queue(queue, ["fail@example.com"], wait=0.2)
+
+    assert smtp_server.messages == []
+    assert (queue.stats()["retried"], queue.stats()["failed"]) == (1, 1)
+
+
+def test_password_recovery_sends_email(client, user, smtp_server):
+    response = client.post(f"/api/v1/login/password-recovery/{user.email}")
+    assert response.status_code == 200
+    [(rcpt, content)] = smtp_server.messages
+    assert rcpt == [user.email]
+    assert "reset-password?token=" in content
+
+    response = client.post("/api/v1/login/password-recovery/nobody@example.com")
+    assert response.status_code == 404
+
+
+def test_email_template_is_cached():
+    compile_email_template.cache_clear()
+    context = {"project_name": "Budget Book", "username": "a&b@example.com", "link": "http://x", "valid_hours": 48}
+    html = render_email_template(template_name="reset_password.html", context=context)
+    render_email_template(template_name="reset_password.html", context=context)
+
+    assert compile_email_template.cache_info().misses == 1
+    assert "{{" not in html
+    assert "a&amp;b@example.com" in html
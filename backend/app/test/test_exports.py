@@ -0,0 +1,90 @@
+"""거래내역 내보내기 (CSV BOM, NDJSON, gzip, 여러 배치로 스트리밍)"""
+from datetime import timedelta
+import gzip
+import json
+import os
+
+import pytest
+
+from app.core import security
+from app.models.user import User
+from app.services import exports
+
+
+@pytest.fixture
+def exported_rows(client, auth_headers, category, monkeypatch) -> list[dict]:
+    # 배치 경계를 지나도록 2행씩 가져옴
+    monkeypatch.setattr(exports.fetch_batch, "__defaults__", (2,))
+    rows = [
+        {"amount": 1000, "transaction_type": "expense", "category_id": category.id,
+         "transaction_date": "2026-03-01T09:00:00", "description": "점심, 김밥"},
+        {"amount": 2500, "transaction_type": "income", "category_id": category.id,
+         "transaction_date": "2026-03-02T09:00:00", "payment_method": "card"},
+        {"amount": 300, "transaction_type": "expense", "category_id": category.id,
+         "transaction_date": "2026-03-03T09:00:00", "description": '"따옴표"'},
+    ]
+    response = client.post("/api/v1/transactions/batch", headers=auth_headers, json={"operations": [
+        {"op": "create", "data": row} for row in rows
+    ]})
+    assert response.json()["succeeded"] == 3
+    return rows
+
+
+def export(client, headers, **params):
+    response = client.get("/api/v1/transactions/export", headers=headers, params=params)
+    assert response.status_code == 200
+    return response
+
+
+def test_csv_export_can_be_imported_again(client, auth_headers, session, category, exported_rows):
+    response = export(client, auth_headers, format="csv")
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="transactions.csv"'
+    content = response.content
+    # 엑셀용 BOM + 헤더 + 날짜순 행
+    assert content.startswith("\ufeff".encode("utf-8"))
+    lines = content.decode("utf-8-sig").splitlines()
+    assert lines[0] == ",".join(exports.EXPORT_COLUMNS)
+    assert len(lines) == 4
+    assert '"점심, 김밥"' in lines[1]
+
+    other = User(email=f"user-{os.urandom(4).hex()}@example.com", hashed_password="x")
+    session.add(other)
+    session.commit()
+    other_headers = {"Authorization": f"Bearer {security.create_access_token(other.id, timedelta(minutes=5))}"}
+    response = client.post("/api/v1/transactions/import", headers=other_headers, files={
+        "file": ("transactions.csv", content),
+    })
+    assert response.json()["imported"] == 3
+
+    imported = client.get("/api/v1/transactions/", headers=other_headers, params={"sort_order": "asc"}).json()["items"]
+    assert [
+        (item["amount"], item["transaction_type"], item["description"], item["payment_method"], item["transaction_date"])
+        for item in imported
+    ] == [
+        (row["amount"], row["transaction_type"], row.get("description"), row.get("payment_method"), row["transaction_date"])
+        for row in exported_rows
+    ]
+
+
+def test_ndjson_export(client, auth_headers, category, exported_rows):
+    response = export(client, auth_headers, format="ndjson")
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["amount"] for row in rows] == [1000, 2500, 300]
+    assert rows[0]["category"] == category.name
+    assert rows[1]["payment_method"] == "card"
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_gzip_export_matches_plain_export(client, auth_headers, exported_rows, fmt):
+    plain = export(client, auth_headers, format=fmt).content
+    response = export(client, auth_headers, format=fmt, gzip="true")
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"] == f'attachment; filename="transactions.{fmt}.gz"'
+    assert gzip.decompress(response.content) == plain
+
+
+def test_export_rejects_unknown_format(client, auth_headers):
+    response = client.get("/api/v1/transactions/export", headers=auth_headers, params={"format": "xlsx"})
+    assert response.status_code == 400
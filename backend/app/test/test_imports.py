@@ -0,0 +1,106 @@
+"""거래내역 가져오기 (CSV/NDJSON, 중복/오류 행 처리)"""
+from datetime import datetime
+
+import asyncpg
+import psycopg2.errors
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.transaction import TransactionCreate, TransactionType
+from app.services import imports
+
+
+def upload(client, headers, content: str, filename: str = "transactions.csv"):
+    response = client.post(
+        "/api/v1/transactions/import", headers=headers, files={"file": (filename, content.encode("utf-8"))}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_import_skips_error_rows_and_duplicates(client, auth_headers, category):
+    content = (
+        "transaction_date,amount,transaction_type,category,description\n"
+        f"2026-03-01,1000,expense,{category.name},lunch\n"
+        f"2026-03-01,1000,expense,{category.name},lunch\n"  # 같은 파일 안의 같은 행은 따로 들어감
+        f"2026-03-02,abc,expense,{category.name},bad amount\n"
+        "2026-03-03,500,expense,no-such-category,\n"
+        f",700,income,{category.name},no date\n"
+    )
+    result = upload(client, auth_headers, content)
+    assert (result["total_rows"], result["imported"], result["duplicates"], result["failed"]) == (5, 3, 0, 2)
+    assert [error["row"] for error in result["errors"]] == [3, 4]
+    assert "no-such-category" in result["errors"][1]["message"]
+
+    # 같은 파일을 다시 올리면 날짜가 있는 행은 중복, 날짜가 없는 행은 새 거래
+    result = upload(client, auth_headers, content)
+    assert (result["imported"], result["duplicates"], result["failed"]) == (1, 2, 2)
+    assert client.get("/api/v1/transactions/", headers=auth_headers).json()["total"] == 4
+
+
+def test_rows_without_date_are_deduplicated_within_one_upload(client, auth_headers, category):
+    content = (
+        "amount,transaction_type,category\n"
+        f"4500,expense,{category.name}\n"
+        f"4500,expense,{category.name}\n"
+    )
+    # 같은 파일 안의 같은 행은 따로 들어가고, 다음 날 같은 내용을 다시 가져와도 빠지지 않음
+    assert upload(client, auth_headers, content)["imported"] == 2
+    assert upload(client, auth_headers, content)["imported"] == 2
+    assert client.get("/api/v1/transactions/", headers=auth_headers).json()["total"] == 4
+
+
+def test_rows_without_date_hash_the_same_within_an_upload():
+    fields = {"amount": 700, "transaction_type": TransactionType.INCOME, "category_id": 1}
+    # 날짜가 없으면 가져온 시각이 들어감 (청크를 재시도하는 사이에 바뀔 수 있음)
+    first = TransactionCreate.model_construct(set(fields), transaction_date=datetime(2026, 1, 1, 9), **fields)
+    later = TransactionCreate.model_construct(set(fields), transaction_date=datetime(2026, 1, 1, 9, 0, 1), **fields)
+    dated = TransactionCreate.model_construct(transaction_date=datetime(2026, 1, 1, 9), **fields)
+
+    assert imports.content_hash(first, 0, "upload-1") == imports.content_hash(later, 0, "upload-1")
+    assert imports.content_hash(first, 0, "upload-1") != imports.content_hash(first, 0, "upload-2")
+    assert imports.content_hash(first, 0, "upload-1") != imports.content_hash(dated, 0, "upload-1")
+
+
+def test_import_ndjson(client, auth_headers, category):
+    content = (
+        f'{{"amount": 100, "transaction_type": "income", "category_id": {category.id}, "transaction_date": "2026-01-01"}}\n'
+        "\n"
+        "not json\n"
+    )
+    result = upload(client, auth_headers, content, filename="transactions.ndjson")
+    assert (result["imported"], result["failed"]) == (1, 1)
+
+
+def test_import_rejects_csv_without_required_columns(client, auth_headers):
+    response = client.post(
+        "/api/v1/transactions/import", headers=auth_headers, files={"file": ("t.csv", b"amount,description\n1,x\n")}
+    )
+    assert response.status_code == 400
+
+
+class _FailingCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, statement, buffer):
+        raise psycopg2.errors.UniqueViolation("duplicate key value violates unique constraint")
+
+
+class _FailingConnection:
+    def cursor(self):
+        return _FailingCursor()
+
+    def run_async(self, fn):
+        raise asyncpg.UniqueViolationError("duplicate key value violates unique constraint")
+
+
+@pytest.mark.parametrize("copy", [imports._copy_psycopg2, imports._copy_asyncpg])
+def test_copy_duplicate_errors_are_integrity_errors(copy):
+    # insert_chunk 는 IntegrityError 에서 중복을 다시 걸러 재시도함
+    row = dict.fromkeys(imports.COPY_COLUMNS)
+    with pytest.raises(IntegrityError):
+        copy(_FailingConnection(), [row])
@@ -0,0 +1,34 @@
+"""/metrics 접근 권한과 라우트별 요청 지표"""
+from datetime import timedelta
+import os
+
+from app.core import security
+from app.core.config import settings
+from app.models.user import User
+
+
+def test_metrics_requires_token_or_superuser(client, auth_headers, session, monkeypatch):
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers=auth_headers).status_code == 403
+
+    admin = User(email=f"admin-{os.urandom(4).hex()}@example.com", hashed_password="x", is_superuser=True)
+    session.add(admin)
+    session.commit()
+    token = security.create_access_token(admin.id, timedelta(minutes=5))
+    assert client.get("/metrics", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
+
+
+def test_requests_are_labelled_by_route_not_path(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    for transaction_id in (1000001, 1000002):
+        client.get(f"/api/v1/transactions/{transaction_id}", headers=auth_headers)
+    client.get("/no-such-path")
+
+    body = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).text
+    assert 'route="transactions-get_transaction"' in body
+    assert 'route="unmatched"' in body
+    assert "1000001" not in body
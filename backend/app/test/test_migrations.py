@@ -0,0 +1,103 @@
+"""Alembic 마이그레이션을 기존(create_all 로 만든) DB 에 적용
+
+PostgreSQL 에서도 확인하려면 비어 있는 DB 의 URL 을 TEST_POSTGRES_URL 로 지정한다.
+"""
+from argparse import Namespace
+from datetime import datetime
+import os
+from pathlib import Path
+import tempfile
+import uuid
+
+from alembic import command
+from alembic.config import Config
+import pytest
+import sqlalchemy as sa
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[1] / "alembic"
+
+# 마이그레이션 도입 전 SQLModel.metadata.create_all 로 만들어진 스키마 (enum 타입 포함)
+baseline = sa.MetaData()
+sa.Table(
+    "users", baseline,
+    sa.Column("id", sa.Uuid(), primary_key=True),
+    sa.Column("email", sa.String(255), nullable=False, unique=True, index=True),
+    sa.Column("is_active", sa.Boolean(), nullable=False),
+    sa.Column("is_superuser", sa.Boolean(), nullable=False),
+    sa.Column("full_name", sa.String(255)),
+    sa.Column("hashed_password", sa.String(255), nullable=False),
+    sa.Column("created_at", sa.DateTime(), nullable=False),
+    sa.Column("updated_at", sa.DateTime()),
+)
+sa.Table(
+    "categories", baseline,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("name", sa.String(50), nullable=False, unique=True, index=True),
+    sa.Column("description", sa.String(200)),
+    sa.Column("created_at", sa.DateTime()),
+    sa.Column("updated_at", sa.DateTime()),
+)
+sa.Table(
+    "transactions", baseline,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("amount", sa.Integer(), nullable=False),
+    sa.Column("description", sa.String()),
+    sa.Column("transaction_type", sa.Enum("INCOME", "EXPENSE", name="transactiontype"), nullable=False),
+    sa.Column("payment_method", sa.Enum("CASH", "CARD", name="paymentmethod")),
+    sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id"), nullable=False),
+    sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=False),
+    sa.Column("transaction_date", sa.DateTime(), nullable=False),
+    sa.Column("created_at", sa.DateTime()),
+    sa.Column("updated_at", sa.DateTime()),
+)
+
+
+def database_urls() -> list:
+    urls = [pytest.param(f"sqlite:///{Path(tempfile.mkdtemp()) / 'migrations.db'}", id="sqlite")]
+    postgres_url = os.environ.get("TEST_POSTGRES_URL")
+    urls.append(pytest.param(
+        postgres_url, id="postgresql",
+        marks=pytest.mark.skipif(not postgres_url, reason="TEST_POSTGRES_URL is not set"),
+    ))
+    return urls
+
+
+def alembic_config(url: str) -> Config:
+    # ini 파일 없이 (fileConfig 가 테스트 로깅 설정을 바꾸지 않도록)
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.cmd_opts = Namespace(x=[f"database_url={url}"])
+    return config
+
+
+@pytest.mark.parametrize("url", database_urls())
+def test_upgrade_existing_create_all_database(url):
+    engine = sa.create_engine(url)
+    baseline.create_all(engine)
+    user_id = uuid.uuid4()
+    try:
+        with engine.begin() as connection:
+            connection.execute(baseline.tables["users"].insert().values(
+                id=user_id, email=f"{user_id}@example.com", is_active=True, is_superuser=False,
+                hashed_password="x", created_at=datetime(2026, 1, 1),
+            ))
+            connection.execute(baseline.tables["categories"].insert().values(id=1, name="식비"))
+            connection.execute(baseline.tables["transactions"].insert(), [
+                {"amount": amount, "transaction_type": "EXPENSE", "user_id": user_id, "category_id": 1,
+                 "transaction_date": datetime(2026, 3, day)}
+                for day, amount in ((5, 1000), (20, 500))
+            ])
+
+        config = alembic_config(url)
+        command.upgrade(config, "head")
+        # 모델과 스키마가 같아야 함
+        command.check(config)
+
+        with engine.connect() as connection:
+            rollups = connection.execute(sa.text(
+                "SELECT total_amount, transaction_count FROM monthly_rollups"
+            )).all()
+        assert [tuple(row) for row in rollups] == [(1500, 2)]
+    finally:
+        command.downgrade(alembic_config(url), "base")
+        engine.dispose()
@@ -0,0 +1,63 @@
+"""거래 목록 커서(keyset) 페이지네이션"""
+import pytest
+
+from app.core.pagination import encode_cursor
+
+
+@pytest.fixture
+def transaction_ids(client, auth_headers, category) -> list[int]:
+    # 같은 날짜/금액이 섞여 있어도 (정렬값, id) 로 순서가 고정되는지 확인
+    ids = []
+    for index in range(7):
+        response = client.post("/api/v1/transactions/", headers=auth_headers, json={
+            "amount": 1000 * (index % 3), "transaction_type": "expense", "category_id": category.id,
+            "transaction_date": f"2026-03-0{1 + index % 2}T12:00:00",
+        })
+        assert response.status_code == 200
+        ids.append(response.json()["id"])
+    return ids
+
+
+def read_all_pages(client, headers, **params) -> list[dict]:
+    pages = []
+    cursor = None
+    while True:
+        response = client.get("/api/v1/transactions/", headers=headers, params={
+            "pagination": "cursor", "limit": 3, **params, **({"cursor": cursor} if cursor else {}),
+        })
+        assert response.status_code == 200
+        page = response.json()
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            assert not page["has_more"]
+            return pages
+
+
+@pytest.mark.parametrize("sort_by, sort_order", [("date", "desc"), ("date", "asc"), ("amount", "desc"), ("amount", "asc")])
+def test_cursor_pages_match_offset_order(client, auth_headers, transaction_ids, sort_by, sort_order):
+    params = {"sort_by": sort_by, "sort_order": sort_order}
+    pages = read_all_pages(client, auth_headers, **params)
+    assert [len(page["items"]) for page in pages] == [3, 3, 1]
+    # total 은 첫 페이지에서만
+    assert pages[0]["total"] == 7
+    assert all(page["total"] is None for page in pages[1:])
+
+    expected = client.get("/api/v1/transactions/", headers=auth_headers, params={**params, "limit": 100}).json()
+    assert [item["id"] for page in pages for item in page["items"]] == [item["id"] for item in expected["items"]]
+    assert sorted(item["id"] for page in pages for item in page["items"]) == sorted(transaction_ids)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    encode_cursor({"sort_by": "date", "sort_order": "desc"}),
+    encode_cursor({"sort_by": "amount", "sort_order": "desc", "value": 100, "id": 1}),
+    encode_cursor({"sort_by": "date", "sort_order": "desc", "value": "yesterday", "id": 1}),
+    encode_cursor({"sort_by": "date", "sort_order": "desc", "value": "2026-03-01T12:00:00", "id": None}),
+])
+def test_invalid_cursor_returns_400(client, auth_headers, transaction_ids, cursor):
+    response = client.get("/api/v1/transactions/", headers=auth_headers, params={
+        "pagination": "cursor", "sort_by": "date", "sort_order": "desc", "cursor": cursor,
+    })
+    assert response.status_code == 400
+
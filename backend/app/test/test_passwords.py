@@ -0,0 +1,51 @@
+"""비밀번호 변경, 로그인 시 재해시, 해시 작업 대기열이 가득 찼을 때 503"""
+import os
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import password_pool
+from app.models.user import User
+
+
+def login(client, email: str, password: str):
+    return client.post("/api/v1/login/access-token", data={"username": email, "password": password})
+
+
+def test_password_change_checks_current_password(client, session, user, auth_headers):
+    response = client.patch("/api/v1/users/me/password", headers=auth_headers, json={
+        "current_password": "wrong-password", "new_password": "password456",
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Incorrect password"
+
+    response = client.patch("/api/v1/users/me/password", headers=auth_headers, json={
+        "current_password": "password123", "new_password": "password456",
+    })
+    assert response.status_code == 200
+    assert login(client, user.email, "password123").status_code == 400
+    assert login(client, user.email, "password456").status_code == 200
+
+
+def test_login_rehashes_password_with_current_rounds(client, session, monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    user = User(email=f"user-{os.urandom(4).hex()}@example.com", hashed_password=security.get_password_hash("password123", 4))
+    session.add(user)
+    session.commit()
+    assert security.needs_rehash(user.hashed_password)
+
+    assert login(client, user.email, "password123").status_code == 200
+
+    session.refresh(user)
+    assert user.hashed_password.startswith("$2b$05$")
+    assert not security.needs_rehash(user.hashed_password)
+    assert security.verify_password("password123", user.hashed_password)
+
+
+def test_login_returns_503_when_hash_pool_is_full(client, user, monkeypatch):
+    monkeypatch.setattr(password_pool, "in_flight", password_pool.workers + password_pool.max_pending)
+    rejected = password_pool.rejected
+
+    response = login(client, user.email, "password123")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert password_pool.rejected == rejected + 1
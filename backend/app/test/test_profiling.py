@@ -0,0 +1,79 @@
+"""요청 프로파일링 (X-Profile 헤더, 관리자만) 과 /monitoring/profiles 조회"""
+from datetime import timedelta
+import os
+import pstats
+
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.middleware import Middleware
+
+from app.core import security
+from app.core.profiling import ProfilingMiddleware, profiles
+from app.core.request_context import RequestContextMiddleware
+from app.main import app
+from app.models.user import User
+
+
+@pytest.fixture
+def profiling_client(monkeypatch) -> Iterator[TestClient]:
+    # 테스트 앱은 PROFILING_ENABLED 가 꺼져 있으므로 main.py 와 같은 위치
+    # (RequestContextMiddleware 바깥, QueryCounterMiddleware 안쪽) 에 미들웨어를 넣고 다시 구성
+    middleware = list(app.user_middleware)
+    position = next(index for index, item in enumerate(middleware) if item.cls is RequestContextMiddleware)
+    middleware.insert(position, Middleware(ProfilingMiddleware))
+    monkeypatch.setattr(app, "user_middleware", middleware)
+    monkeypatch.setattr(app, "middleware_stack", None)
+    profiles.clear()
+    yield TestClient(app)
+    profiles.clear()
+
+
+@pytest.fixture
+def superuser_headers(session) -> dict[str, str]:
+    superuser = User(
+        email=f"admin-{os.urandom(4).hex()}@example.com", hashed_password="x", is_superuser=True
+    )
+    session.add(superuser)
+    session.commit()
+    return {"Authorization": f"Bearer {security.create_access_token(superuser.id, timedelta(minutes=5))}"}
+
+
+def test_profile_header_is_ignored_for_regular_user(profiling_client, auth_headers):
+    response = profiling_client.get("/api/v1/transactions/", headers={**auth_headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+    assert not profiles
+
+    # 목록 조회도 관리자 전용
+    assert profiling_client.get("/api/v1/monitoring/profiles", headers=auth_headers).status_code == 403
+
+
+def test_superuser_profile_can_be_listed_and_downloaded(profiling_client, superuser_headers, tmp_path):
+    response = profiling_client.get("/api/v1/transactions/", headers={**superuser_headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    # 요청하지 않은 요청은 기록하지 않음
+    assert "X-Profile-Id" not in profiling_client.get("/api/v1/monitoring/profiles", headers=superuser_headers).headers
+    summaries = profiling_client.get("/api/v1/monitoring/profiles", headers=superuser_headers).json()
+    assert [summary["id"] for summary in summaries] == [profile_id]
+    assert summaries[0]["route"] == "GET /api/v1/transactions/"
+    assert summaries[0]["status_code"] == 200
+    assert summaries[0]["query_count"] > 0
+
+    detail = profiling_client.get(f"/api/v1/monitoring/profiles/{profile_id}", headers=superuser_headers).json()
+    assert detail["functions"]
+    assert len(detail["queries"]) == summaries[0]["query_count"]
+
+    response = profiling_client.get(f"/api/v1/monitoring/profiles/{profile_id}/pstats", headers=superuser_headers)
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == f'attachment; filename="profile-{profile_id}.prof"'
+    path = tmp_path / "profile.prof"
+    path.write_bytes(response.content)
+    assert pstats.Stats(str(path)).total_calls > 0
+
+    assert profiling_client.get(
+        "/api/v1/monitoring/profiles/unknown/pstats", headers=superuser_headers
+    ).status_code == 404
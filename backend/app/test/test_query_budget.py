@@ -0,0 +1,60 @@
+"""엔드포인트별 쿼리 수 예산 (N+1 회귀 방지)"""
+import pytest
+from sqlmodel import Session, select
+
+from app.models.category import Category
+from app.models.transaction import Transaction
+
+
+def create_transactions(client, headers, category_id: int, count: int) -> list[int]:
+    response = client.post("/api/v1/transactions/batch", headers=headers, json={
+        "operations": [
+            {"op": "create", "data": {"amount": 1000 + i, "transaction_type": "expense", "category_id": category_id}}
+            for i in range(count)
+        ],
+    })
+    assert response.status_code == 200
+    return [result["id"] for result in response.json()["results"]]
+
+
+def test_transaction_list_does_not_load_categories_per_row(client, auth_headers, category, query_budget):
+    create_transactions(client, auth_headers, category.id, 30)
+
+    # 데이터 버전 + 목록 + count + 카테고리 캐시 로드
+    with query_budget(4, max_repeats=1):
+        response = client.get("/api/v1/transactions/", headers=auth_headers, params={"limit": 10})
+    assert response.status_code == 200
+    assert all(item["category"]["id"] == category.id for item in response.json()["items"])
+
+    # 같은 요청은 응답 캐시에서 (데이터 버전 캐시 포함 DB 조회 없음)
+    with query_budget(0):
+        client.get("/api/v1/transactions/", headers=auth_headers, params={"limit": 10})
+
+
+def test_transaction_detail(client, auth_headers, category, query_budget):
+    [transaction_id] = create_transactions(client, auth_headers, category.id, 1)
+
+    with query_budget(3, max_repeats=1):
+        response = client.get(f"/api/v1/transactions/{transaction_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+
+def test_query_headers(client, auth_headers, category):
+    response = client.get("/api/v1/transactions/statistics/category-spending", headers=auth_headers)
+    assert int(response.headers["X-DB-Query-Count"]) >= 1
+    assert float(response.headers["X-DB-Query-Time-Ms"]) >= 0
+    assert "X-DB-Repeated-Queries" not in response.headers
+
+
+def test_repeated_queries_are_detected(session: Session, user, category, query_budget):
+    session.add_all([
+        Transaction(user_id=user.id, category_id=category.id, amount=100, transaction_type="expense")
+        for _ in range(3)
+    ])
+    session.commit()
+
+    # 행마다 카테고리를 따로 조회하는 전형적인 N+1
+    with pytest.raises(AssertionError, match="N\\+1"):
+        with query_budget(100, max_repeats=1):
+            for transaction in session.exec(select(Transaction).where(Transaction.user_id == user.id)).all():
+                session.exec(select(Category.name).where(Category.id == transaction.category_id)).one()
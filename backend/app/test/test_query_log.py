@@ -0,0 +1,41 @@
+"""느린 쿼리 경고 로그 (SLOW_QUERY_MS) 와 SQL 지문"""
+import logging
+
+from app.core import query_log
+from app.core.config import settings
+
+
+def slow_query_records(caplog) -> list[logging.LogRecord]:
+    return [
+        record for record in caplog.records
+        if record.name == query_log.logger.name and record.getMessage().startswith("Slow query")
+    ]
+
+
+def test_slow_query_is_logged_with_fingerprint(client, auth_headers, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+    with caplog.at_level(logging.WARNING, logger=query_log.logger.name):
+        response = client.get("/api/v1/transactions/", headers=auth_headers)
+    assert response.status_code == 200
+
+    records = slow_query_records(caplog)
+    assert records
+    assert all(record.levelno == logging.WARNING for record in records)
+    record = next(record for record in records if "transactions" in query_log.fingerprints.get(record.fingerprint, ""))
+    assert record.duration_ms >= 0
+    assert record.route == "GET /api/v1/transactions/"
+    assert record.fingerprint in record.getMessage()
+
+
+def test_slow_query_log_disabled(client, auth_headers, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", None)
+    with caplog.at_level(logging.WARNING, logger=query_log.logger.name):
+        assert client.get("/api/v1/transactions/", headers=auth_headers).status_code == 200
+    assert not slow_query_records(caplog)
+
+
+def test_normalize_groups_queries_by_shape():
+    assert query_log.normalize("SELECT * FROM t WHERE id IN (1, 2, 3) AND name = 'a'") == (
+        "SELECT * FROM t WHERE id IN (...) AND name = ?"
+    )
+    assert query_log.fingerprint("SELECT 1 FROM t WHERE id = 5") == query_log.fingerprint("SELECT 1 FROM t WHERE id = 7")
@@ -0,0 +1,43 @@
+"""복제본 조회 라우팅 (두 번째 SQLite DB 를 복제본으로 사용, 복제가 안 된 상태 = 복제 지연)"""
+from pathlib import Path
+import tempfile
+
+import pytest
+from sqlmodel import SQLModel
+
+from app.core import database
+from app.core.config import to_async_url
+
+_replica_url = f"sqlite:///{Path(tempfile.mkdtemp()) / 'replica.db'}"
+_replica = database.create_engines(_replica_url, to_async_url(_replica_url), "replica")
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    SQLModel.metadata.create_all(_replica[0])
+    monkeypatch.setattr(database, "read_engines", [_replica])
+    return _replica
+
+
+def test_reads_stick_to_primary_after_write(client, auth_headers, category, replica):
+    response = client.post("/api/v1/transactions/", headers=auth_headers, json={
+        "amount": 1000, "transaction_type": "expense", "category_id": category.id,
+    })
+    assert response.status_code == 200
+    transaction_id = response.json()["id"]
+
+    # 쓴 직후에는 주 DB 에서 조회
+    assert client.get(f"/api/v1/transactions/{transaction_id}", headers=auth_headers).status_code == 200
+
+    # READ_AFTER_WRITE_SECONDS 가 지나면 복제본 (아직 복제되지 않음)
+    database.recent_writes.clear()
+    assert client.get(f"/api/v1/transactions/{transaction_id}", headers=auth_headers).status_code == 404
+
+
+def test_category_write_sends_everyone_to_primary(client, category, replica):
+    # 카테고리 캐시를 복제본에서 채움
+    assert client.get(f"/api/v1/categories/{category.id}").status_code == 404
+
+    response = client.post("/api/v1/categories/", json={"name": f"{category.name}-new", "description": None})
+    assert response.status_code == 201
+    assert client.get(f"/api/v1/categories/{category.id}").status_code == 200
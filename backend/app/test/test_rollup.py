@@ -0,0 +1,88 @@
+"""거래 생성/수정/삭제 시 월별 롤업 증분 반영"""
+from datetime import date
+import os
+
+import pytest
+from sqlmodel import select
+
+from app.models.category import Category
+from app.models.rollup import MonthlyRollup
+from app.models.transaction import TransactionType
+from app.services.rollup import verify_rollups
+
+
+@pytest.fixture
+def other_category(session) -> Category:
+    category = Category(name=f"category-{os.urandom(4).hex()}", description=None)
+    session.add(category)
+    session.commit()
+    session.refresh(category)
+    return category
+
+
+def rollups(session, user) -> dict:
+    session.expire_all()
+    rows = session.exec(select(MonthlyRollup).where(MonthlyRollup.user_id == user.id)).all()
+    return {
+        (row.period, row.category_id, row.transaction_type): (row.total_amount, row.transaction_count)
+        for row in rows
+    }
+
+
+def create_transaction(client, headers, category_id: int, amount: int, transaction_date: str) -> int:
+    response = client.post("/api/v1/transactions/", headers=headers, json={
+        "amount": amount, "transaction_type": "expense", "category_id": category_id,
+        "transaction_date": transaction_date,
+    })
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def update_transaction(client, headers, transaction_id: int, **data) -> None:
+    response = client.patch(f"/api/v1/transactions/{transaction_id}", headers=headers, json=data)
+    assert response.status_code == 200
+
+
+def test_update_amount_applies_difference(client, auth_headers, user, category, session):
+    first = create_transaction(client, auth_headers, category.id, 1000, "2026-03-05T12:00:00")
+    create_transaction(client, auth_headers, category.id, 500, "2026-03-20T12:00:00")
+    key = (date(2026, 3, 1), category.id, TransactionType.EXPENSE)
+    assert rollups(session, user) == {key: (1500, 2)}
+
+    update_transaction(client, auth_headers, first, amount=300)
+    assert rollups(session, user) == {key: (800, 2)}
+    assert verify_rollups(session, user.id) == []
+
+
+def test_move_between_buckets(client, auth_headers, user, category, other_category, session):
+    transaction_id = create_transaction(client, auth_headers, category.id, 1000, "2026-03-05T12:00:00")
+    create_transaction(client, auth_headers, category.id, 200, "2026-03-06T12:00:00")
+
+    # 카테고리 이동: 원래 버킷에서 빠지고 새 버킷에 더해짐
+    update_transaction(client, auth_headers, transaction_id, category_id=other_category.id)
+    assert rollups(session, user) == {
+        (date(2026, 3, 1), category.id, TransactionType.EXPENSE): (200, 1),
+        (date(2026, 3, 1), other_category.id, TransactionType.EXPENSE): (1000, 1),
+    }
+
+    # 유형 변경
+    update_transaction(client, auth_headers, transaction_id, transaction_type="income")
+    assert rollups(session, user) == {
+        (date(2026, 3, 1), category.id, TransactionType.EXPENSE): (200, 1),
+        (date(2026, 3, 1), other_category.id, TransactionType.INCOME): (1000, 1),
+    }
+
+    # 월 이동과 금액 변경을 함께 -> 비게 된 버킷은 삭제
+    update_transaction(client, auth_headers, transaction_id, transaction_date="2026-04-01T00:00:00", amount=700)
+    assert rollups(session, user) == {
+        (date(2026, 3, 1), category.id, TransactionType.EXPENSE): (200, 1),
+        (date(2026, 4, 1), other_category.id, TransactionType.INCOME): (700, 1),
+    }
+    assert verify_rollups(session, user.id) == []
+
+
+def test_delete_removes_empty_bucket(client, auth_headers, user, category, session):
+    transaction_id = create_transaction(client, auth_headers, category.id, 1000, "2026-03-05T12:00:00")
+    response = client.delete(f"/api/v1/transactions/{transaction_id}", headers=auth_headers)
+    assert response.status_code == 204
+    assert rollups(session, user) == {}
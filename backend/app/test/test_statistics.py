@@ -0,0 +1,8 @@
+"""월별 통계 (롤업 기반 카테고리별 지출/월별 추이)"""
+import pytest
+
+
+@pytest.mark.parametrize("months", [0, -1, 100_000])
+def test_monthly_trends_rejects_out_of_range_months(client, auth_headers, months):
+    response = client.get("/api/v1/transactions/statistics/monthly-trends", headers=auth_headers, params={"months": months})
+    assert response.status_code == 422
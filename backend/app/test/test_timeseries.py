@@ -0,0 +1,71 @@
+"""기간 버킷별 통계 (/transactions/statistics/timeseries)"""
+from datetime import datetime
+
+import pytest
+
+from app.models.transaction import TimeBucket
+from app.services import timeseries
+from app.services.transactions import TransactionFilters
+
+
+def create(client, headers, category_id: int, *rows: tuple[str, str, int, str]) -> None:
+    response = client.post("/api/v1/transactions/batch", headers=headers, json={"operations": [
+        {"op": "create", "data": {
+            "transaction_date": day, "transaction_type": transaction_type, "amount": amount,
+            "category_id": category_id, "payment_method": payment_method,
+        }}
+        for day, transaction_type, amount, payment_method in rows
+    ]})
+    assert response.status_code == 200
+
+
+def test_daily_buckets_fill_gaps(client, auth_headers, category):
+    create(
+        client, auth_headers, category.id,
+        ("2026-03-02T10:00:00", "expense", 1000, "card"),
+        ("2026-03-02T20:00:00", "income", 5000, "cash"),
+        ("2026-03-04T09:00:00", "expense", 300, "cash"),
+    )
+    response = client.get("/api/v1/transactions/statistics/timeseries", headers=auth_headers, params={
+        "interval": "day", "start_date": "2026-03-01", "end_date": "2026-03-05",
+    })
+    assert response.status_code == 200
+    assert [(point["period"], point["expense"], point["income"], point["count"]) for point in response.json()] == [
+        ("2026-03-01", 0, 0, 0),
+        ("2026-03-02", 1000, 5000, 2),
+        ("2026-03-03", 0, 0, 0),
+        ("2026-03-04", 300, 0, 1),
+        ("2026-03-05", 0, 0, 0),
+    ]
+
+
+def test_weekly_buckets_grouped_by_payment_method(client, auth_headers, category):
+    create(
+        client, auth_headers, category.id,
+        ("2026-03-01T10:00:00", "expense", 100, "card"),  # 일요일 -> 2월 23일 주
+        ("2026-03-02T10:00:00", "expense", 200, "card"),  # 월요일
+        ("2026-03-08T10:00:00", "expense", 300, "cash"),
+    )
+    response = client.get("/api/v1/transactions/statistics/timeseries", headers=auth_headers, params={
+        "interval": "week", "group_by": "payment_method", "start_date": "2026-02-23", "end_date": "2026-03-15",
+    })
+    assert response.status_code == 200
+    points = response.json()
+    assert [point["period"] for point in points] == ["2026-02-23", "2026-03-02", "2026-03-09"]
+    assert [point["expense"] for point in points] == [100, 500, 0]
+    assert sorted((group["key"], group["expense"]) for group in points[1]["groups"]) == [("card", 200), ("cash", 300)]
+    assert points[2]["groups"] == []
+
+
+def test_too_many_buckets(client, auth_headers):
+    response = client.get("/api/v1/transactions/statistics/timeseries", headers=auth_headers, params={
+        "interval": "day", "start_date": "2000-01-01", "end_date": "2026-01-01",
+    })
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("interval", list(TimeBucket))
+def test_bucket_range_matches_shift(interval):
+    filters = TransactionFilters(start_date=datetime(2024, 12, 30), end_date=datetime(2026, 2, 3))
+    first, last, count = timeseries.bucket_range(filters, interval)
+    assert timeseries.shift(first, interval, count - 1) == last
@@ -0,0 +1,64 @@
+"""거래 목록 전체 개수 계산 방법 (total_strategy)"""
+import pytest
+
+from app.services import transactions
+from app.services.transactions import count_cache
+
+
+@pytest.fixture
+def five_transactions(client, auth_headers, category) -> None:
+    response = client.post("/api/v1/transactions/batch", headers=auth_headers, json={"operations": [
+        {"op": "create", "data": {"amount": 1000 + index, "transaction_type": "expense", "category_id": category.id}}
+        for index in range(5)
+    ]})
+    assert response.json()["succeeded"] == 5
+
+
+def list_page(client, headers, strategy: str, skip: int = 0) -> dict:
+    response = client.get("/api/v1/transactions/", headers=headers, params={
+        "total_strategy": strategy, "limit": 2, "skip": skip,
+    })
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_none_skips_count_but_keeps_has_more(client, auth_headers, five_transactions):
+    page = list_page(client, auth_headers, "none")
+    assert (page["total"], page["total_strategy"], page["has_more"]) == (None, None, True)
+    assert len(page["items"]) == 2
+
+    page = list_page(client, auth_headers, "none", skip=2)
+    assert (page["total"], page["has_more"]) == (None, True)
+
+    # 마지막 페이지는 count 없이 정확한 값을 알 수 있음
+    page = list_page(client, auth_headers, "none", skip=4)
+    assert (page["total"], page["total_strategy"], page["has_more"]) == (5, "exact", False)
+
+
+def test_cached_count_is_reused_until_a_write(client, auth_headers, category, five_transactions):
+    page = list_page(client, auth_headers, "cached")
+    assert (page["total"], page["total_strategy"]) == (5, "cached")
+
+    # 다른 페이지(다른 응답 캐시 키)도 같은 count 재사용
+    hits = count_cache.hits
+    assert list_page(client, auth_headers, "cached", skip=2)["total"] == 5
+    assert count_cache.hits == hits + 1
+
+    response = client.post("/api/v1/transactions/", headers=auth_headers, json={
+        "amount": 1, "transaction_type": "income", "category_id": category.id,
+    })
+    assert response.status_code == 200
+    page = list_page(client, auth_headers, "cached")
+    assert (page["total"], page["total_strategy"]) == (6, "cached")
+
+
+def test_estimated_falls_back_to_exact_on_sqlite(client, auth_headers, five_transactions):
+    page = list_page(client, auth_headers, "estimated")
+    assert (page["total"], page["total_strategy"], page["has_more"]) == (5, "exact", True)
+
+
+def test_estimated_uses_planner_estimate_when_large(client, auth_headers, five_transactions, monkeypatch):
+    # PostgreSQL 플래너 추정값 대신
+    monkeypatch.setattr(transactions, "estimate_count", lambda session, statement: 250_000)
+    page = list_page(client, auth_headers, "estimated")
+    assert (page["total"], page["total_strategy"]) == (250_000, "estimated")
@@ -0,0 +1,84 @@
+"""토큰 -> 사용자 캐시 (get_current_user) 무효화와 만료"""
+from datetime import timedelta
+import time
+
+from app.core import database, security
+from app.core.database import invalidate_user, user_cache
+from app.models.user import User
+
+
+def bearer(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_deactivated_user_is_rejected_on_next_request(client, session, user, auth_headers):
+    assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+
+    db_user = session.get(User, user.id)
+    db_user.is_active = False
+    session.add(db_user)
+    session.commit()
+    # 캐시된 스냅샷은 아직 활성 사용자
+    assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+
+    invalidate_user(user.id)
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+
+def test_profile_update_is_visible_immediately(client, auth_headers):
+    assert client.get("/api/v1/users/me", headers=auth_headers).json()["full_name"] is None
+    response = client.patch("/api/v1/users/me", headers=auth_headers, json={"full_name": "새 이름"})
+    assert response.status_code == 200
+    assert client.get("/api/v1/users/me", headers=auth_headers).json()["full_name"] == "새 이름"
+
+
+def test_password_change_invalidates_cached_tokens(client, user):
+    tokens = [security.create_access_token(user.id, timedelta(minutes=minutes)) for minutes in (10, 20)]
+    for token in tokens:
+        assert client.get("/api/v1/users/me", headers=bearer(token)).status_code == 200
+        assert user_cache.get(token) is not None
+
+    response = client.patch("/api/v1/users/me/password", headers=bearer(tokens[0]), json={
+        "current_password": "password123", "new_password": "password456",
+    })
+    assert response.status_code == 200
+    assert all(user_cache.get(token) is None for token in tokens)
+
+
+def test_deleted_user_token_is_not_served_from_cache(client, user, auth_headers):
+    assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+    assert client.delete("/api/v1/users/me", headers=auth_headers).status_code == 200
+
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_cache_entry_expires_with_token(client, user):
+    token = security.create_access_token(user.id, timedelta(seconds=5))
+    assert client.get("/api/v1/users/me", headers=bearer(token)).status_code == 200
+
+    expires_at, _, _ = user_cache._entries[token]
+    # USER_CACHE_TTL_SECONDS 보다 짧은 토큰 exp 가 상한
+    assert expires_at - time.monotonic() <= 5
+
+
+def test_deactivation_during_lookup_is_not_cached(client, session, user, auth_headers, monkeypatch):
+    get_user = database.Session.get
+
+    def read_then_deactivate(db_session, model, user_id):
+        found = get_user(db_session, model, user_id)
+        # 읽은 뒤 캐시에 넣기 전에 다른 요청이 사용자를 비활성화
+        db_user = get_user(session, User, user_id)
+        db_user.is_active = False
+        session.add(db_user)
+        session.commit()
+        invalidate_user(user_id)
+        return found
+
+    monkeypatch.setattr(database.Session, "get", read_then_deactivate)
+    assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+    monkeypatch.undo()
+
+    assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 400
@@ -0,0 +1,26 @@
+"""사용자 삭제 (사용자를 참조하는 집계 행 정리)"""
+from sqlmodel import select
+
+from app.models.data_version import UserDataVersion
+from app.models.rollup import MonthlyRollup
+from app.models.user import User
+
+
+def test_delete_user_after_deleting_transactions(client, session, user, auth_headers, category):
+    user_id = user.id
+    for transaction_type in ("expense", "income"):
+        response = client.post("/api/v1/transactions/", headers=auth_headers, json={
+            "amount": 1000, "transaction_type": transaction_type, "category_id": category.id,
+        })
+        transaction_id = response.json()["id"]
+        assert client.delete(f"/api/v1/transactions/{transaction_id}", headers=auth_headers).status_code == 204
+    # 거래는 없지만 데이터 버전 행은 남아 있음 (PostgreSQL 에서는 FK 때문에 사용자 삭제가 실패하던 상태)
+    assert session.exec(select(UserDataVersion).where(UserDataVersion.user_id == user_id)).first() is not None
+
+    response = client.delete("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 200
+
+    session.expire_all()
+    assert session.get(User, user_id) is None
+    assert session.exec(select(UserDataVersion).where(UserDataVersion.user_id == user_id)).first() is None
+    assert session.exec(select(MonthlyRollup).where(MonthlyRollup.user_id == user_id)).first() is None
@@ -1,27 +1,42 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from string import Template
+from functools import lru_cache
+import html
+from pathlib import Path
+import re
 from typing import Any
 
-from fastapi import Path
 import jwt
 from jwt.exceptions import InvalidTokenError
-import emails  # type: ignore
 
-from app.core import logger, security
+from app.core import security
 from app.core.config import settings
+from app.core.logger import setup_logger
+from app.core.mailer import send_now
+
+logger = setup_logger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent / "email-templates" / "build"
+# {{ name }} 자리표시자
+_PLACEHOLDER = re.compile(r"{{\s*(\w+)\s*}}")
 
 @dataclass
 class EmailData:
     html_content: str
     subject: str
     
+@lru_cache(maxsize=None)
+def compile_email_template(template_name: str) -> tuple[str, ...]:
+    """템플릿을 한 번만 읽어서 [문자열, 변수 이름, 문자열, ...] 로 나눠 둠"""
+    return tuple(_PLACEHOLDER.split((TEMPLATES_DIR / template_name).read_text(encoding="utf-8")))
+
 def render_email_template(*, template_name: str, context: dict[str, Any]) -> str:
-    template_str = (
-        Path(__file__).parent / "email-templates" / "build" / template_name
-    ).read_text()
-    html_content = Template(template_str).render(context)
-    return html_content
+    parts = compile_email_template(template_name)
+    # 홀수 번째가 변수 이름 (없는 변수는 빈 문자열)
+    return "".join(
+        part if index % 2 == 0 else html.escape(str(context.get(part, "")))
+        for index, part in enumerate(parts)
+    )
 
 def generate_password_reset_token(email: str) -> str:
     delta = timedelta(hours=settings.EMAIL_RESET_TOKEN_EXPIRE_HOURS)
@@ -57,23 +72,10 @@ def send_email(
     subject: str = "",
     html_content: str = "",
 ) -> None:
+    """바로 발송 (스크립트/CLI 용). 라우트에서는 app.core.mailer.mailer.send 로 대기열에 넣는다"""
     assert settings.emails_enabled, "no provided configuration for email variables"
-    message = emails.Message(
-        subject=subject,
-        html=html_content,
-        mail_from=(settings.EMAILS_FROM_NAME, settings.EMAILS_FROM_EMAIL),
-    )
-    smtp_options = {"host": settings.SMTP_HOST, "port": settings.SMTP_PORT}
-    if settings.SMTP_TLS:
-        smtp_options["tls"] = True
-    elif settings.SMTP_SSL:
-        smtp_options["ssl"] = True
-    if settings.SMTP_USER:
-        smtp_options["user"] = settings.SMTP_USER
-    if settings.SMTP_PASSWORD:
-        smtp_options["password"] = settings.SMTP_PASSWORD
-    response = message.send(to=email_to, smtp=smtp_options)
-    logger.info(f"send email result: {response}")
+    send_now(email_to, subject, html_content)
+    logger.info("Sent email to %s", email_to)
 
 def verify_password_reset_token(token: str) -> str | None:
     try: